@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.utils import keyring as keyring_module
+
+
+@pytest.fixture(autouse=True, scope="session")
+def development_key_in_temp_dir(tmp_path_factory):
+    """Keep a generated development key out of the repository's backups/ directory"""
+    path = str(tmp_path_factory.mktemp("keys") / "dev_encryption.key")
+    original = keyring_module.DEV_KEYRING_PATH
+    keyring_module.DEV_KEYRING_PATH = path
+    yield path
+    keyring_module.DEV_KEYRING_PATH = original
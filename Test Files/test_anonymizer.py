@@ -0,0 +1,57 @@
+"""Pytest tests for the batch analytics anonymizer."""
+
+from datetime import datetime
+
+import numpy as np
+
+from src.data.anonymizer import ANALYTICS_COLUMNS, BatchAnonymizer, analytics_key, region_for, write_analytics_dataset
+from src.data.blind_index import email_blind_index
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.sqlite_store import SQLiteCandidateStore
+
+
+def _session(name, email, date_of_birth, location):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name, email=email, phone="9876543210", experience_years=4,
+        desired_positions=["Data Analyst"], location=location, tech_stack=["Python"],
+        gender="Female", date_of_birth=date_of_birth, graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    return session
+
+
+def test_pages_become_generalized_columns_without_pii():
+    anonymizer = BatchAnonymizer(analytics_key("secret"), reference_date=datetime(2025, 8, 14))
+    records = [
+        {"Session_ID": "s1", "Timestamp": "2025-03-04T10:00:00", "Email": "Priya@Example.com",
+         "Date_of_Birth": "15/08/1996", "Location": "Mumbai", "Experience_Years": "4", "Full_Name": "Priya"},
+        {"Session_ID": "s2", "Timestamp": "2025-03-09T10:00:00", "Email": "priya@example.com ",
+         "Date_of_Birth": "1960-01-01", "Location": "Austin, USA", "Experience_Years": ""},
+        {"Session_ID": "s3", "Timestamp": "", "Email": "", "Date_of_Birth": "", "Location": ""},
+    ]
+    columns = anonymizer.anonymize([records[:2], records[2:]])
+
+    assert list(columns) == ANALYTICS_COLUMNS
+    keys = columns["Candidate_Key"]
+    assert keys[0] == keys[1] != keys[2] and len(keys[0]) == 32
+    assert keys[0] != email_blind_index("priya@example.com", "secret")
+    assert columns["Age_Band"].tolist() == ["25-29", "60+", ""]
+    assert columns["Region"].tolist() == ["West India", "North America", ""]
+    assert columns["Application_Month"].tolist() == ["2025-03", "2025-03", ""]
+    assert np.isnan(columns["Experience_Years"][1])
+    assert region_for("Somewhere, India") == "India" and region_for("Atlantis") == "Other"
+
+
+def test_dataset_is_written_from_encrypted_store_rows(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="k")
+    for index in range(5):
+        store.save_candidate_data(_session("Priya Sharma", f"p{index % 2}@example.com", "15/08/1996", "Bengaluru"))
+
+    path = str(tmp_path / "analytics.npz")
+    assert write_analytics_dataset(store, path, "secret", page_size=2, reference_date=datetime(2025, 1, 1)) == 5
+    with np.load(path, allow_pickle=False) as data:
+        assert set(data.files) == set(ANALYTICS_COLUMNS)
+        assert len(set(data["Candidate_Key"].tolist())) == 2
+        assert set(data["Age_Band"].tolist()) == {"25-29"} and set(data["Region"].tolist()) == {"South India"}
+    store.close()
@@ -0,0 +1,81 @@
+"""Pytest tests for the durable audit log."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from src.data.audit_log import AuditLog
+from src.utils.gdpr_compliance import GDPRCompliance
+
+
+@pytest.fixture()
+def audit_log(tmp_path):
+    audit_log = AuditLog(str(tmp_path / "audit.db"), flush_interval=0.05)
+    yield audit_log
+    audit_log.close()
+
+
+def test_entries_are_batched_and_queryable(audit_log):
+    compliance = GDPRCompliance(audit_log=audit_log)
+    for index in range(50):
+        compliance.log_data_access("data_save", "candidate_info", f"s{index % 5}")
+    compliance.log_data_access("export", "candidates", "admin", details={"rows": 50})
+
+    assert audit_log.count() == 51
+    assert [e["action"] for e in audit_log.query(user_id="s3")] == ["data_save"] * 10
+    export, = audit_log.query(action="export")
+    assert export["details"] == {"rows": 50} and export["ip_address"]
+    assert audit_log.query(since="9999") == []
+    assert len(audit_log.query(limit=7)) == 7
+
+
+def test_entries_survive_a_restart_and_cannot_be_rewritten(tmp_path):
+    path = str(tmp_path / "audit.db")
+    first = AuditLog(path)
+    first.record({"timestamp": "2025-01-01T00:00:00", "action": "consent_obtained", "user_id": "s1"})
+    first.close()
+
+    reopened = AuditLog(path)
+    assert reopened.query(user_id="s1")[0]["action"] == "consent_obtained"
+    with pytest.raises(sqlite3.IntegrityError):
+        reopened._conn.execute("DELETE FROM audit_log")
+    reopened.close()
+
+
+def test_a_full_queue_falls_back_to_a_direct_write(tmp_path):
+    audit_log = AuditLog(str(tmp_path / "audit.db"), max_queue_size=1, flush_interval=5.0)
+    for index in range(20):
+        audit_log.record({"timestamp": f"2025-01-01T00:00:{index:02d}", "action": "read", "user_id": "s1"})
+    assert audit_log.count() == 20
+    audit_log.close()
+
+
+def test_queued_entries_are_written_when_the_process_exits(tmp_path):
+    path = str(tmp_path / "audit.db")
+    script = (
+        "from src.data.audit_log import AuditLog\n"
+        f"audit_log = AuditLog({path!r}, flush_interval=60.0)\n"
+        "for index in range(5):\n"
+        "    audit_log.record({'timestamp': f'2025-01-01T00:00:0{index}', 'action': 'read', 'user_id': 's1'})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=os.getcwd())
+    assert AuditLog(path).count() == 5
+
+
+def test_a_batch_that_keeps_failing_is_written_entry_by_entry(audit_log):
+    attempts = []
+
+    def flaky(rows):
+        attempts.append(len(rows))
+        if len(rows) > 1:
+            raise sqlite3.OperationalError("database is locked")
+        return AuditLog._insert(audit_log, rows)
+
+    audit_log.queue.flush_fn = flaky
+    audit_log.queue.max_retries = 0
+    for index in range(3):
+        audit_log.record({"timestamp": f"2025-01-01T00:00:0{index}", "action": "read", "user_id": "s1"})
+    assert audit_log.count() == 3
@@ -0,0 +1,95 @@
+"""Pytest tests for blind index lookups on encrypted email and phone columns."""
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.blind_index import BlindIndexBackfill, BlindIndexTable, email_blind_index
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+
+
+def _session(name, email, phone):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name, email=email, phone=phone, experience_years=4,
+        desired_positions=["Data Analyst"], location="Mumbai", tech_stack=["Python"],
+        gender="Female", date_of_birth="15/08/1996", graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    return session
+
+
+def _row(session_id, index=""):
+    row = [""] * len(SHEET_HEADERS)
+    row[SHEET_HEADERS.index("Session_ID")] = session_id
+    row[SHEET_HEADERS.index("Email_Index")] = index
+    return row
+
+
+def test_sheets_lookup_uses_the_index_instead_of_scanning():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-blind", None, write_behind=False, client=emulator, blind_index_key="k")
+    handler.save_candidate_data(_session("Priya Sharma", "priya@example.com", "9876543210"))
+    handler.save_candidate_data(_session("Meera Iyer", "meera@example.com", "9123456780"))
+    emulator.reset_stats()
+
+    found = handler.find_by_email("  PRIYA@example.com ")
+    assert [r["Full_Name"] for r in found] == ["Priya Sharma"]
+    assert [r["Full_Name"] for r in handler.find_by_phone("(912) 345-6780")] == ["Meera Iyer"]
+
+    # One column read loads the index, then each hit is a single row read
+    assert emulator.calls["batch_get"] == 3
+    assert emulator.calls.get("get_all_values", 0) == 0 and emulator.calls.get("get_all_records", 0) == 0
+
+
+def test_deleting_one_candidate_drops_their_index_entries():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-blind-delete", None, write_behind=False, client=emulator, blind_index_key="k")
+    session = _session("Priya Sharma", "priya@example.com", "9876543210")
+    handler.save_candidate_data(session)
+    assert handler.blind_indexes.lookup("Email_Index", email_blind_index("priya@example.com", "k")) == [session.session_id]
+
+    assert handler.delete_candidate_data(session.session_id) is True
+    assert handler.blind_indexes.lookup("Email_Index", email_blind_index("priya@example.com", "k")) == []
+
+
+def test_table_refreshes_on_a_stale_miss_and_forgets_deletes():
+    loads = []
+
+    def load_columns(names):
+        loads.append(names)
+        return {"Session_ID": ["s1", "s2"], "Email_Index": ["h1", "h2"], "Phone_Index": ["", "p2"]}
+
+    table = BlindIndexTable(load_columns, refresh_interval=60.0)
+    assert table.lookup("Email_Index", "h2") == ["s2"]
+    assert table.lookup("Email_Index", "missing") == []   # fresh table: no reload
+    assert len(loads) == 1
+
+    table.record_rows([_row("s3", "h2")])
+    assert table.lookup("Email_Index", "h2") == ["s2", "s3"]
+    table.forget(["s2"])
+    assert table.lookup("Email_Index", "h2") == ["s3"]
+    assert table.lookup("Phone_Index", "p2") == []
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="k")
+    yield store
+    store.close()
+
+
+def test_backfill_indexes_rows_saved_without_a_key(store):
+    unkeyed = SQLiteCandidateStore(store.db_path, blind_index_key="")
+    for index in range(3):
+        unkeyed.save_candidate_data(_session("Priya Sharma", f"p{index}@example.com", f"987654321{index}"))
+    unkeyed.close()
+    assert store.find_by_email("p1@example.com") == []
+
+    assert BlindIndexBackfill(store, "k", page_size=2).run() == {"scanned": 3, "updated": 3}
+    assert store.find_by_email("P1@example.com")[0]["Email_Index"] == email_blind_index("p1@example.com", "k")
+    assert len(store.find_by_phone("98765 43212")) == 1
+
+    assert BlindIndexBackfill(store, "k").run()["updated"] == 0
@@ -0,0 +1,96 @@
+"""Pytest tests for per-candidate data keys and crypto-shredding."""
+
+from src.data.data_keys import DataKeyStore
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.row_builder import ENCRYPTED_COLUMNS
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.utils.gdpr_compliance import ENVELOPE_PREFIX, GDPRCompliance
+from src.utils.keyring import EncryptionKeyring
+
+
+def _session(name, email, phone):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name, email=email, phone=phone, experience_years=4,
+        desired_positions=["Data Analyst"], location="Mumbai", tech_stack=["Python"],
+        gender="Female", date_of_birth="15/08/1996", graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    return session
+
+
+def test_deleting_a_candidate_shreds_only_their_key(tmp_path):
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler(
+        "sheet-envelope", None, write_behind=False, client=emulator,
+        data_key_store_path=str(tmp_path / "data_keys.db"),
+    )
+    priya = _session("Priya Sharma", "priya@example.com", "9876543210")
+    meera = _session("Meera Iyer", "meera@example.com", "9123456780")
+    handler.save_candidate_data(priya)
+    handler.save_candidate_data(meera)
+
+    stored = {record["Session_ID"]: record for record in handler.get_all_candidates()}
+    assert all(stored[priya.session_id][column].startswith(ENVELOPE_PREFIX) for column in ENCRYPTED_COLUMNS)
+    # Rows copied elsewhere (backups, exports) before the erasure
+    copies = handler.gdpr_compliance.decrypt_records(list(stored.values()), ENCRYPTED_COLUMNS)
+    assert {record["Email"] for record in copies} == {"priya@example.com", "meera@example.com"}
+
+    assert handler.delete_many([priya.session_id]) == 1
+    erased, kept = handler.gdpr_compliance.decrypt_records(
+        [stored[priya.session_id], stored[meera.session_id]], ENCRYPTED_COLUMNS
+    )
+    assert erased["Email"] == "" and erased["Phone"] == "" and erased["Date_of_Birth"] == ""
+    assert kept["Phone"] == "9123456780"
+
+
+def test_data_keys_survive_a_restart_and_a_master_key_rotation(tmp_path):
+    keyring = EncryptionKeyring.from_spec("keyring:v1:first-master-key")
+    path = str(tmp_path / "data_keys.db")
+    store = DataKeyStore(path, keyring=keyring)
+    token, = GDPRCompliance(keyring=keyring, data_keys=store).encrypt_for_sessions(["s1"], ["1990-01-01"])
+    store.close()
+
+    rotated = keyring.with_new_key(version="v2")
+    reopened = DataKeyStore(path, keyring=rotated)
+    assert reopened.rewrap() == 1 and reopened.rewrap() == 0
+    reopened.close()
+
+    # The retired master key is no longer needed to reach the data key
+    current = DataKeyStore(path, keyring=rotated.without_version("v1"))
+    compliance = GDPRCompliance(keyring=rotated, data_keys=current)
+    decrypted, = compliance.decrypt_records([{"Session_ID": "s1", "Date_of_Birth": token}], ["Date_of_Birth"])
+    assert decrypted["Date_of_Birth"] == "1990-01-01"
+    assert compliance.shred(["s1", "unknown"]) == 1
+    current.close()
+
+
+def test_deletes_shred_keys_of_rows_that_never_reached_the_store(tmp_path):
+    key_path = str(tmp_path / "data_keys.db")
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler(
+        "sheet-envelope-outbox", None, write_behind=False, client=emulator,
+        data_key_store_path=key_path, outbox_path=str(tmp_path / "outbox.db"), replay_interval=3600,
+    )
+    queued, = handler.gdpr_compliance.encrypt_for_sessions(["only-queued"], ["priya@example.com"])
+    handler.outbox.add("only-queued", [queued])
+    copy = {"Session_ID": "only-queued", "Email": queued}
+
+    assert handler.delete_candidate_data("only-queued") is False   # no sheet row
+    assert handler.gdpr_compliance.decrypt_records([copy], ["Email"])[0]["Email"] == ""
+
+
+def test_sqlite_store_uses_data_keys_and_shreds_on_delete(tmp_path):
+    store = SQLiteCandidateStore(
+        str(tmp_path / "candidates.db"), blind_index_key="k", data_key_store_path=str(tmp_path / "keys.db")
+    )
+    session = _session("Priya Sharma", "priya@example.com", "9876543210")
+    store.save_candidate_data(session)
+    copy = store.get_candidate_data(session.session_id)
+    assert copy["Email"].startswith(ENVELOPE_PREFIX)
+
+    assert store.delete_candidate_data(session.session_id) is True
+    assert store.gdpr_compliance.decrypt_records([copy], ENCRYPTED_COLUMNS)[0]["Email"] == ""
+    store.close()
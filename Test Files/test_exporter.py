@@ -0,0 +1,74 @@
+"""Pytest tests for the streaming candidate exporter."""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.exporter import read_chunks, stream_export, write_export
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+
+
+def _rows(count):
+    rows = []
+    for i in range(count):
+        row = [""] * len(SHEET_HEADERS)
+        row[SHEET_HEADERS.index("Session_ID")] = f"s{i}"
+        row[SHEET_HEADERS.index("Why_Good_Candidate")] = f"answer, with \"quotes\" {i}"
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    store.insert_rows(_rows(25))
+    yield store
+    store.close()
+
+
+def test_csv_export_streams_one_chunk_per_page(store):
+    chunks = list(stream_export(store, "csv", page_size=10))
+    assert len(chunks) == 3
+
+    records = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [r["Session_ID"] for r in records] == [f"s{i}" for i in range(25)]
+    assert records[3]["Why_Good_Candidate"] == 'answer, with "quotes" 3'
+
+
+def test_gzipped_ndjson_file_sink(store, tmp_path):
+    path = tmp_path / "export" / "candidates.ndjson.gz"
+    written = write_export(store, str(path), "ndjson", compress=True, page_size=7)
+
+    assert written == path.stat().st_size
+    lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()
+    assert [json.loads(line)["Session_ID"] for line in lines] == [f"s{i}" for i in range(25)]
+
+
+def test_download_is_spooled_without_leaving_files(store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = read_chunks(stream_export(store, "csv", page_size=10), max_memory=100)
+
+    assert len(list(csv.DictReader(io.StringIO(data.decode("utf-8"))))) == 25
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["candidates.db", "candidates.db-shm", "candidates.db-wal"]
+
+
+def test_sheets_export_reads_fixed_size_ranges():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("export-sheet", None, write_behind=False, client=emulator)
+    handler.insert_rows(_rows(25))
+    emulator.reset_stats()
+
+    body = b"".join(stream_export(handler, "ndjson", page_size=10)).decode("utf-8")
+    assert len(body.splitlines()) == 25
+    assert emulator.calls == {"col_values": 1, "get": 3}
+
+
+def test_unknown_format_is_rejected(store):
+    with pytest.raises(ValueError):
+        stream_export(store, "xml")
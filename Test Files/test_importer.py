@@ -0,0 +1,116 @@
+"""Pytest tests for the bulk candidate importer."""
+
+import json
+import uuid
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.importer import (
+    IMPORT_NAMESPACE, IMPORTED_STATUS, build_import_rows, import_applications, load_applications,
+    validate_applications,
+)
+from src.utils.gdpr_compliance import GDPRCompliance
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+
+CSV_DUMP = """Full Name,Email,Phone,Experience,Desired Positions,Location,Skills,Gender,DOB,Graduation Year,CGPA 10th,CGPA 12th,CGPA Degree
+Priya Sharma,PRIYA@example.com,+91 98765 43210,4,data analyst,Mumbai,"python, sql",female,15/08/1996,2018,9.1,8.7,8.4
+Bob,bob@bad,123,60,x,Pune,Go,other,15/08/1996,1980,11,8,abc
+Arjun Mehta,arjun@example.com,9876501234,2,backend engineer; devops,Delhi,Go|Docker,Male,01-02-1999,2021,8,7.5,7.9
+"""
+
+
+def _application(name, email, tech):
+    return {
+        "full_name": name, "email": email, "phone": "9876543210", "experience_years": 3,
+        "desired_positions": ["Data Analyst"], "location": "Mumbai", "tech_stack": tech,
+        "gender": "Female", "date_of_birth": "15/08/1996", "graduation_year": 2018,
+        "cgpa_10th": 9.1, "cgpa_12th": 8.7, "cgpa_degree": 8.4,
+    }
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    yield store
+    store.close()
+
+
+def test_validation_reports_every_failed_check_per_row():
+    clean, errors = validate_applications(load_applications(CSV_DUMP.encode(), "csv"))
+
+    assert list(clean.index) == [0, 2]
+    assert clean.loc[0, "phone"] == "919876543210"
+    assert clean.loc[2, "tech_stack"] == "Go, Docker"
+    assert clean.loc[2, "desired_positions"] == "Backend Engineer, Devops"
+
+    assert set(errors["row"]) == {2}
+    assert set(errors["field"]) == {
+        "full_name", "email", "phone", "experience_years", "desired_positions", "gender",
+        "graduation_year", "cgpa_10th", "cgpa_degree",
+    }
+
+
+def test_import_writes_valid_rows_and_upserts_on_reimport(store):
+    result = import_applications(store, CSV_DUMP.encode(), "csv")
+
+    assert (result.total, result.imported, result.rejected) == (3, 2, 1)
+    assert "row,field,message,value" in result.error_report_csv()
+
+    records = store.get_all_candidates()
+    assert [r["Full_Name"] for r in records] == ["Priya Sharma", "Arjun Mehta"]
+    assert records[0]["Status"] == IMPORTED_STATUS
+    assert store.find_by_email("priya@example.com")[0]["Location"] == "Mumbai"
+
+    import_applications(store, CSV_DUMP.encode(), "csv")
+    assert len(store.get_all_candidates()) == 2
+
+
+def test_json_import_into_sheets_uses_one_append():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-import", None, write_behind=False, client=emulator)
+    dump = json.dumps([
+        _application("Priya Sharma", "priya@example.com", ["Python", "SQL"]),
+        _application("Meera Iyer", "meera@example.com", ["Java"]),
+    ])
+    emulator.reset_stats()
+
+    result = import_applications(handler, dump, "json")
+
+    assert result.imported == 2
+    assert emulator.calls["append_rows"] == 1
+    assert [r["Tech_Stack"] for r in handler.get_all_candidates()] == ["Python, Sql", "Java"]
+
+
+def test_dates_are_parsed_and_source_session_ids_are_ignored(store):
+    applications = [
+        dict(_application("Priya Sharma", "priya@example.com", ["Python"]), session_id="interview-1",
+             timestamp="04/03/2025 10:00"),
+        dict(_application("Meera Iyer", "meera@example.com", ["Java"]), date_of_birth="31/02/1996"),
+        dict(_application("Arjun Mehta", "arjun@example.com", ["Go"]), date_of_birth="1999-02-01",
+             timestamp="2999-01-01T00:00:00"),
+        dict(_application("Ravi Kumar", "ravi@example.com", ["Go"]), date_of_birth="1999-02-01",
+             timestamp="not a date"),
+    ]
+    result = import_applications(store, json.dumps(applications), "json")
+
+    assert result.imported == 1
+    assert sorted(zip(result.errors["row"], result.errors["field"])) == [
+        (2, "date_of_birth"), (3, "timestamp"), (4, "timestamp"),
+    ]
+    record = store.get_all_candidates()[0]
+    assert record["Session_ID"].startswith("import-") and record["Timestamp"] == "2025-03-04T10:00:00"
+
+
+def test_imported_session_ids_are_keyed():
+    clean, _ = validate_applications(load_applications(CSV_DUMP.encode(), "csv"))
+    session_column = SHEET_HEADERS.index("Session_ID")
+
+    def session_ids(key):
+        return [row[session_column] for row in build_import_rows(clean, GDPRCompliance(), key)]
+
+    assert session_ids("key-one") == session_ids("key-one")   # re-imports still upsert
+    assert session_ids("key-one") != session_ids("key-two")
+    assert session_ids("key-one")[0] != f"import-{uuid.uuid5(IMPORT_NAMESPACE, 'priya@example.com')}"
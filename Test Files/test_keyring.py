@@ -0,0 +1,148 @@
+"""Pytest tests for the process-wide encryption keyring and key rotation."""
+
+import base64
+import json
+
+from cryptography.fernet import Fernet
+import pytest
+
+from src.data.exporter import stream_export
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.reencryption import ReencryptionJob
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.utils.gdpr_compliance import GDPRCompliance
+from src.utils import keyring as keyring_module
+from src.utils.keyring import EncryptionKeyring, derive_fernet_key, get_keyring, parse_keyring_spec, set_keyring
+
+
+def _session(name, email):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name, email=email, phone="9876543210", experience_years=4,
+        desired_positions=["Data Analyst"], location="Mumbai", tech_stack=["Python"],
+        gender="Female", date_of_birth="15/08/1996", graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    return session
+
+
+@pytest.fixture()
+def keyring():
+    previous = get_keyring()
+    keyring = EncryptionKeyring.from_spec(f"keyring:v1:{Fernet.generate_key().decode()}")
+    set_keyring(keyring)
+    yield keyring
+    set_keyring(previous)
+
+
+@pytest.fixture()
+def store(tmp_path, keyring):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    for index in range(5):
+        store.save_candidate_data(_session(f"Candidate {chr(65 + index)}", f"c{index}@example.com"))
+    yield store
+    store.close()
+
+
+def test_spec_parsing_orders_keys_primary_first():
+    key = Fernet.generate_key().decode()
+    assert [version for version, _ in parse_keyring_spec(f"keyring:v2:{key}, v1:not-a-fernet-key")] == ["v2", "v1"]
+    assert parse_keyring_spec(key) == [("v1", key.encode())]
+
+    # Without the prefix any passphrase is one key, stretched into a Fernet key - even with "," or ":"
+    (version, derived), = parse_keyring_spec("v1:correct,horse:battery")
+    assert version == "v1" and derived == derive_fernet_key("v1:correct,horse:battery")
+    Fernet(derived)
+
+    keyring = EncryptionKeyring.from_spec(f"keyring:v1:{key}").with_new_key()
+    assert EncryptionKeyring.from_spec(keyring.to_spec()).keys == keyring.keys
+    with pytest.raises(ValueError):
+        parse_keyring_spec("keyring:v2")
+
+
+def test_development_key_is_shared_when_another_process_creates_it(tmp_path, monkeypatch):
+    path = tmp_path / "dev_encryption.key"
+    path.write_text("v1:" + Fernet.generate_key().decode())   # written before the keyring: prefix
+
+    # The file appears between the existence check and the exclusive create
+    monkeypatch.setattr(keyring_module.os.path, "exists", lambda p: False)
+    spec = keyring_module._development_spec(str(path))
+    assert spec == "keyring:" + path.read_text()
+    assert EncryptionKeyring.from_spec(spec).primary_version == "v1"
+
+
+def test_ciphertexts_survive_new_instances_and_key_rotation(keyring):
+    encrypted = GDPRCompliance().encrypt_sensitive_data("priya@example.com")
+    assert GDPRCompliance().decrypt_sensitive_data(encrypted) == "priya@example.com"
+
+    set_keyring(keyring.with_new_key())
+    compliance = GDPRCompliance()
+    assert compliance.keyring.versions == ["v2", "v1"]
+    assert compliance.needs_rotation(encrypted)
+    assert compliance.decrypt_sensitive_data(encrypted) == "priya@example.com"
+
+    rotated = compliance.rotate_sensitive_data(encrypted)
+    assert not compliance.needs_rotation(rotated)
+    assert GDPRCompliance(keyring.with_new_key().without_version("v1")).decrypt_sensitive_data(rotated) == rotated
+    assert GDPRCompliance(compliance.keyring.without_version("v1")).decrypt_sensitive_data(rotated) == "priya@example.com"
+
+
+def test_reencryption_job_resumes_from_its_checkpoint(store, keyring, tmp_path):
+    rotated_keyring = keyring.with_new_key()
+    set_keyring(rotated_keyring)
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    first = ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2).run(max_pages=1)
+    assert (first["pages_done"], first["rotated"], first["completed"]) == (1, 2, False)
+
+    job = ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2)
+    result = job.run()
+    assert (result["pages_done"], result["scanned"], result["rotated"], result["completed"]) == (3, 5, 5, True)
+
+    # Only the new key is needed now, and lookups through the blind index still work
+    retired = GDPRCompliance(rotated_keyring.without_version("v1"))
+    records = store.get_all_candidates()
+    assert [r["Full_Name"] for r in records][:2] == ["Candidate A", "Candidate B"]
+    assert {retired.decrypt_sensitive_data(r["Email"]) for r in records} == {f"c{i}@example.com" for i in range(5)}
+    assert store.find_by_email("c3@example.com")[0]["Full_Name"] == "Candidate D"
+
+    # Nothing left to rotate
+    assert ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2).run()["rotated"] == 0
+
+
+
+def test_reencryption_resume_survives_deletes_before_the_cursor(store, keyring, tmp_path):
+    set_keyring(keyring.with_new_key())
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    first = ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2).run(max_pages=1)
+    assert first["last_session_id"] == store.get_all_candidates()[1]["Session_ID"]
+
+    # An offset checkpoint would now skip Candidate C; the Session_ID cursor does not, and never re-reads A or B
+    store.delete_candidate_data(store.get_all_candidates()[0]["Session_ID"])
+    result = ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2).run()
+    assert (result["scanned"], result["rotated"], result["completed"]) == (5, 5, True)
+    assert ReencryptionJob(store, checkpoint_path=checkpoint_path, page_size=2).run()["rotated"] == 0
+
+def test_batch_encryption_round_trips_and_reads_legacy_values(keyring):
+    compliance = GDPRCompliance()
+    emails = [f"user{i}@example.com" for i in range(1200)] + [""]
+
+    encrypted = compliance.encrypt_many(emails)
+    assert encrypted[-1] == ""
+    assert all(value.startswith("gAAAAA") for value in encrypted[:-1])
+    assert compliance.decrypt_many(encrypted) == emails
+
+    # Values written with the old double base64 encoding still decrypt, and rotate to the compact form
+    legacy = base64.b64encode(keyring.encrypt(b"priya@example.com")).decode()
+    assert compliance.decrypt_sensitive_data(legacy) == "priya@example.com"
+    assert compliance.needs_rotation(legacy)
+    rotated = compliance.rotate_sensitive_data(legacy)
+    assert len(rotated) < len(legacy) and compliance.decrypt_sensitive_data(rotated) == "priya@example.com"
+
+
+def test_export_can_decrypt_personal_data(store):
+    ndjson = b"".join(stream_export(store, "ndjson", page_size=2, decrypt=True)).decode()
+    records = [json.loads(line) for line in ndjson.splitlines()]
+    assert records[0]["Email"] == "c0@example.com"
+    assert records[0]["Date_of_Birth"] == "15/08/1996"
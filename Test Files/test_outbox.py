@@ -0,0 +1,150 @@
+"""Pytest tests for the durable local outbox and its replayer."""
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.outbox import CandidateOutbox, OutboxReplayer, start_replayer
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+
+
+@pytest.fixture()
+def outbox(tmp_path):
+    box = CandidateOutbox(str(tmp_path / "outbox.db"))
+    yield box
+    box.close()
+
+
+def test_rows_survive_reopening_the_database(tmp_path):
+    """Rows written to the outbox are still pending after a restart."""
+    path = str(tmp_path / "outbox.db")
+    box = CandidateOutbox(path)
+    box.add("s1", ["2024-01-01", "s1", "Jane Doe"])
+    box.close()
+
+    reopened = CandidateOutbox(path)
+    assert reopened.pending_count() == 1
+    assert reopened.due() == [("s1", ["2024-01-01", "s1", "Jane Doe"])]
+    reopened.close()
+
+
+def test_delivered_sessions_are_not_queued_again(outbox):
+    """A Session_ID that was already sent is never re-added as pending."""
+    assert outbox.add("s1", ["a"]) is True
+    outbox.mark_sent(["s1"])
+
+    assert outbox.add("s1", ["b"]) is False
+    assert outbox.is_sent("s1")
+    assert outbox.pending_count() == 0
+
+
+def test_changed_content_is_queued_again(outbox):
+    """With a content hash, only a changed row re-opens a delivered session."""
+    assert outbox.add("s1", ["a"], content_hash="h1") is True
+    outbox.mark_sent(["s1"])
+
+    assert outbox.add("s1", ["a2"], content_hash="h1") is False
+    assert outbox.add("s1", ["b"], content_hash="h2") is True
+    assert outbox.due() == [("s1", ["b"])]
+
+
+def test_failed_rows_back_off_before_retry(outbox):
+    """mark_failed keeps the row pending but delays the next attempt."""
+    outbox.add("s1", ["a"])
+    outbox.mark_failed(["s1"], "429 quota exceeded")
+
+    assert outbox.pending_count() == 1
+    assert outbox.due() == []
+
+
+def test_replayer_skips_rows_already_in_the_sheet(outbox):
+    """Rows that reached the sheet before a crash are marked sent, not re-appended."""
+    delivered = []
+    outbox.add("s1", ["row-1"])
+    outbox.add("s2", ["row-2"])
+
+    def deliver(items):
+        delivered.extend(items)
+        outbox.mark_sent(session_id for session_id, _ in items)
+
+    replayer = OutboxReplayer(
+        outbox, deliver_fn=deliver, existing_ids_fn=lambda: {"s1"}, interval=3600
+    )
+    assert replayer.replay_once() == 1
+    replayer.stop(timeout=0.1)
+
+    assert delivered == [("s2", ["row-2"])]
+    assert outbox.is_sent("s1") and outbox.is_sent("s2")
+
+
+def test_replayer_keeps_rows_pending_when_sheet_is_down(outbox):
+    """A failing sheet read leaves every row pending for the next cycle."""
+    outbox.add("s1", ["row-1"])
+
+    def unavailable():
+        raise ConnectionError("sheets unavailable")
+
+    replayer = OutboxReplayer(
+        outbox, deliver_fn=lambda items: None, existing_ids_fn=unavailable, interval=3600
+    )
+    assert replayer.replay_once() == 0
+    replayer.stop(timeout=0.1)
+    assert outbox.pending_count() == 1
+
+
+def test_removed_and_purged_rows_are_never_replayed(outbox):
+    """Erased sessions leave the outbox at once; delivered rows go after the grace period."""
+    outbox.add("s1", ["row-1"])
+    outbox.add("s2", ["row-2"])
+    outbox.add("s3", ["row-3"])
+    outbox.mark_sent(["s3"])
+
+    assert outbox.remove(["s1", "missing"]) == 1
+    replayer = OutboxReplayer(outbox, deliver_fn=lambda items: None, interval=3600, sent_retention=0)
+    assert replayer.purge_once() == 1
+    replayer.stop(timeout=0.1)
+
+    assert outbox.due() == [("s2", ["row-2"])]
+    assert not outbox.is_sent("s3")
+
+
+def test_deleting_a_candidate_drops_their_outbox_row(tmp_path):
+    """A GDPR delete removes the pending local copy even if it never reached the sheet."""
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler(
+        "sheet-outbox-delete", None, write_behind=False, client=emulator,
+        outbox_path=str(tmp_path / "outbox.db"), replay_interval=3600,
+    )
+    handler.outbox.add("pending-a", ["row-a"])
+    handler.outbox.add("pending-b", ["row-b"])
+
+    assert handler.delete_candidate_data("pending-a") is False
+    assert handler.delete_many(["pending-b"]) == 0
+    assert handler.outbox.due() == []
+
+
+def test_sqlite_store_replays_rows_saved_while_it_was_down(tmp_path):
+    """Outbox rows written with no store running are drained into SQLite, except erased ones."""
+    outbox_path = str(tmp_path / "outbox.db")
+    rows = {}
+    for session_id in ("s1", "s2"):
+        row = [""] * len(SHEET_HEADERS)
+        row[SHEET_HEADERS.index("Session_ID")] = session_id
+        row[SHEET_HEADERS.index("Status")] = "completed"
+        rows[session_id] = row
+    box = CandidateOutbox(outbox_path)
+    for session_id, row in rows.items():
+        box.add(session_id, row)
+    box.close()
+
+    db_path = str(tmp_path / "candidates.db")
+    store = SQLiteCandidateStore(db_path, blind_index_key="test-key", outbox_path=outbox_path, replay_interval=3600)
+    store.delete_candidate_data("s2")
+    replayer = start_replayer(store._stats_key, store.outbox)
+    assert replayer.replay_once() == 1
+    replayer.stop(timeout=0.1)
+
+    assert [record["Session_ID"] for record in store.get_all_candidates()] == ["s1"]
+    assert store.outbox.pending_count() == 0
+    store.close()
@@ -0,0 +1,80 @@
+"""Pytest tests for PII redaction of LLM prompts, logs and exports."""
+
+from types import SimpleNamespace
+
+from src.chatbot.llm_handler import LLMHandler
+from src.data.exporter import stream_export
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.utils.helpers import compact_markdown
+from src.utils.pii_redaction import PiiRedactor, redact_stream
+
+
+def test_placeholders_are_stable_and_reversible():
+    redactor = PiiRedactor.for_candidate({"full_name": "Priya Sharma", "email": "priya@example.com"})
+    text = (
+        "I'm Priya Sharma, mail PRIYA@example.com or call +91 98765-43210. "
+        "Born 15/08/1996, graduated 2018 with 4 years experience. Priya again: 9876543210"
+    )
+    redacted = redactor.redact(text)
+
+    assert redacted == (
+        "I'm [NAME_1], mail [EMAIL_1] or call [PHONE_1]. "
+        "Born [DATE_1], graduated 2018 with 4 years experience. [NAME_2] again: [PHONE_2]"
+    )
+    assert redactor.redact("Thanks Priya, we'll email priya@example.com") == "Thanks [NAME_2], we'll email [EMAIL_1]"
+    assert redactor.restore("Hello [NAME_2], reply to [EMAIL_1] by [DATE_9]") == (
+        "Hello Priya, reply to PRIYA@example.com by [DATE_9]"
+    )
+
+
+def test_generate_response_sends_only_placeholders():
+    sent = []
+
+    def create(**kwargs):
+        sent.append(kwargs["messages"])
+        reply = SimpleNamespace(content=" Thanks [NAME_1], we will call [PHONE_1]. ")
+        return SimpleNamespace(choices=[SimpleNamespace(message=reply)])
+
+    handler = LLMHandler.__new__(LLMHandler)
+    handler.config = SimpleNamespace(groq_model="m", groq_temperature=0.1, groq_max_tokens=50)
+    handler.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    history = [{"role": "assistant", "content": "## **Welcome**\n\n\n> Please share your details"}]
+    reply = handler.generate_response(
+        "I am Meera Iyer, phone 91234 56780", context_type="fallback", conversation_history=history,
+        redactor=PiiRedactor.for_candidate({"full_name": "Meera Iyer"}),
+    )
+
+    messages = sent[0]
+    assert messages[1]["content"] == "Welcome\nPlease share your details"
+    assert messages[2]["content"] == "I am [NAME_1], phone [PHONE_1]"
+    assert reply == "Thanks Meera Iyer, we will call 91234 56780."
+    assert compact_markdown("x" * 20, 10) == "x" * 10 + "…"
+
+
+def test_stream_masks_pii_split_across_chunks():
+    redactor = PiiRedactor.for_candidate({"full_name": "Priya Sharma"}, mask=True)
+    text = "[2025-03-04T10:00:00] User: I'm Priya Sharma, priya@example.com, born 1996-08-15, call 9876543210\n" * 3
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+
+    redacted = "".join(redact_stream(chunks, redactor))
+    assert redacted == "[2025-03-04T10:00:00] User: I'm Priya S***, pr***@example.com, born ****-**-**, call 987****210\n" * 3
+
+
+def test_redacted_export_masks_names_in_free_text(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="k")
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name="Meera Iyer", email="meera@example.com", phone="9123456780", experience_years=4,
+        desired_positions=["Data Analyst"], location="Mumbai", tech_stack=["Python"],
+        gender="Female", date_of_birth="15/08/1996", graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+        why_good_candidate="Meera led analytics at her firm; reach her on meera.iyer@work.com",
+    )
+    store.save_candidate_data(session)
+
+    export = b"".join(stream_export(store, "csv", decrypt=True, redact=True)).decode()
+    assert "Meera I***" in export and "M*** led analytics" in export and "me********@work.com" in export
+    assert "me***@example.com" in export and "912****780" in export and "15/08/1996" not in export
+    store.close()
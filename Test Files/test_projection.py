@@ -0,0 +1,85 @@
+"""Pytest tests for the typed column projection helpers."""
+
+import numpy as np
+
+from src.config.settings import SHEET_HEADERS
+from src.data.projection import column_range, compute_statistics, to_typed_column
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+
+
+def _emulator():
+    return SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+
+
+def _row(session_id, experience="", status="completed", tech=""):
+    row = [""] * len(SHEET_HEADERS)
+    row[SHEET_HEADERS.index("Session_ID")] = session_id
+    row[SHEET_HEADERS.index("Experience_Years")] = experience
+    row[SHEET_HEADERS.index("Status")] = status
+    row[SHEET_HEADERS.index("Tech_Stack")] = tech
+    return row
+
+
+def test_to_typed_column_parses_numbers_and_pads():
+    numeric = to_typed_column("Experience_Years", ["3", "", "x", 4.5, None, "9"], 5)
+    assert numeric.dtype == np.float64 and len(numeric) == 5
+    assert numeric[0] == 3.0 and numeric[3] == 4.5
+    assert np.isnan(numeric[1]) and np.isnan(numeric[2]) and np.isnan(numeric[4])
+
+    text = to_typed_column("Status", ["completed", None, 7], 4)
+    assert text.dtype == object
+    assert text.tolist() == ["completed", "", "7", ""]
+
+
+def test_compute_statistics_from_numpy_columns():
+    columns = {
+        "Status": to_typed_column("Status", ["completed", "rejected", "completed", ""], 4),
+        "Experience_Years": to_typed_column("Experience_Years", ["2", "", "5", "x"], 4),
+        "Tech_Stack": to_typed_column("Tech_Stack", ["Python, SQL", "Python", "", "Go, Python "], 4),
+    }
+    stats = compute_statistics(columns)
+
+    assert stats["total_candidates"] == 4
+    assert stats["completed_interviews"] == 2
+    assert stats["completion_rate"] == 50.0
+    assert stats["average_experience"] == 3.5
+    assert stats["top_tech_stacks"][0] == ("Python", 3)
+    assert compute_statistics({name: np.empty(0) for name in columns})["total_candidates"] == 0
+
+
+def test_get_columns_reads_only_the_named_columns():
+    emulator = _emulator()
+    handler = SheetsHandler("sheet-projection", None, write_behind=False, client=emulator)
+    handler.insert_rows([_row("s1", "2", tech="Python"), _row("s2", "", status="rejected")])
+    emulator.reset_stats()
+
+    columns = handler.get_columns(["Experience_Years", "Status"])
+
+    assert set(columns) == {"Experience_Years", "Status"}
+    assert columns["Status"].tolist() == ["completed", "rejected"]
+    assert columns["Experience_Years"][0] == 2.0 and np.isnan(columns["Experience_Years"][1])
+    assert emulator.calls["batch_get"] == 1
+    assert column_range("Session_ID") == "B2:B" and column_range("Session_ID", 2, 10) == "B2:B10"
+
+
+def test_older_header_row_is_extended_without_touching_data():
+    emulator = _emulator()
+    sheet = emulator.open_by_key("sheet-old-headers").sheet1
+    old_headers = SHEET_HEADERS[:SHEET_HEADERS.index("Status")]
+    sheet.append_rows([old_headers, _row("s1", "3")[:len(old_headers)]])
+
+    handler = SheetsHandler("sheet-old-headers", None, write_behind=False, client=emulator)
+
+    assert sheet.row_values(1) == SHEET_HEADERS
+    assert handler.get_columns(["Session_ID"])["Session_ID"].tolist() == ["s1"]
+
+
+def test_foreign_header_row_is_replaced():
+    emulator = _emulator()
+    sheet = emulator.open_by_key("sheet-foreign-headers").sheet1
+    sheet.append_row(["Name", "Email"])
+
+    SheetsHandler("sheet-foreign-headers", None, write_behind=False, client=emulator)
+
+    assert sheet.get_all_values() == [SHEET_HEADERS]
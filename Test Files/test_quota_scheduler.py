@@ -0,0 +1,88 @@
+"""Pytest tests for the quota-aware Google API scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from src.data.quota_scheduler import (
+    Priority, QuotaScheduler, ScheduledProxy, TokenBucket, api_priority, current_priority
+)
+from src.data.sheets_emulator import SheetsEmulator, quota_exceeded_error
+
+
+def test_bucket_allows_a_burst_then_refills_within_the_quota():
+    bucket = TokenBucket(60, burst=10)
+    now = 100.0
+    assert all(bucket.take(now) == 0.0 for _ in range(10))
+
+    # The remaining 50 requests of the minute are spread evenly
+    assert bucket.take(now) == pytest.approx(1.2)
+    assert bucket.take(now + 1.2) == 0.0
+
+
+def test_quota_errors_are_retried_with_backoff():
+    scheduler = QuotaScheduler(None, None, base_backoff=0.01, seed=1)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise quota_exceeded_error("write", 60)
+        return "ok"
+
+    assert scheduler.call("write", flaky) == "ok"
+    metrics = scheduler.metrics()
+    assert metrics["throttled"] == {"read": 0, "write": 2}
+    assert metrics["backoff"]["write"] == 0.0
+
+
+def test_quota_errors_surface_after_max_retries():
+    scheduler = QuotaScheduler(None, None, max_retries=1, base_backoff=0.01)
+
+    def always_throttled():
+        raise quota_exceeded_error("read", 60)
+
+    with pytest.raises(Exception) as error:
+        scheduler.call("read", always_throttled)
+    assert error.value.code == 429
+
+
+def test_waiting_calls_run_in_priority_order():
+    # One token every half second, and the burst token is used up front
+    scheduler = QuotaScheduler(read_quota_per_minute=121, burst=1)
+    scheduler.call("read", lambda: None)
+    order = []
+
+    def request(priority):
+        with api_priority(priority):
+            scheduler.call("read", order.append, priority)
+
+    threads = []
+    for priority in (Priority.EXPORT, Priority.ANALYTICS, Priority.INTERACTIVE):
+        thread = threading.Thread(target=request, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join(5)
+
+    assert order == [Priority.INTERACTIVE, Priority.ANALYTICS, Priority.EXPORT]
+    waits = scheduler.metrics()["wait_times"]
+    assert waits["export"]["calls"] == 1 and waits["export"]["max_wait"] > 0.5
+
+
+def test_proxy_routes_api_calls_through_the_scheduler():
+    scheduler = QuotaScheduler(None, None)
+    client = ScheduledProxy(SheetsEmulator(), scheduler)
+    worksheet = client.open_by_key("abc").sheet1
+
+    with api_priority(Priority.INTERACTIVE):
+        worksheet.append_row(["a", 1])
+    assert current_priority() == Priority.ANALYTICS
+    assert worksheet.spreadsheet.worksheets()[0].get_all_values() == [["a", "1"]]
+    assert client.calls["append_row"] == 1   # non-API attributes pass straight through
+
+    waits = scheduler.metrics()["wait_times"]
+    assert waits["interactive"]["calls"] == 1
+    assert waits["analytics"]["calls"] == 4   # open_by_key, sheet1, worksheets, get_all_values
@@ -0,0 +1,111 @@
+"""Pytest tests for the retention sweeper."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.audit_log import AuditLog
+from src.data.retention import RetentionSweeper, expired_session_ids
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.utils.gdpr_compliance import GDPRCompliance
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+
+
+def _row(session_id, days_old):
+    row = [""] * len(SHEET_HEADERS)
+    row[SHEET_HEADERS.index("Timestamp")] = (NOW - timedelta(days=days_old)).isoformat()
+    row[SHEET_HEADERS.index("Session_ID")] = session_id
+    row[SHEET_HEADERS.index("Status")] = "completed"
+    return row
+
+
+@pytest.fixture()
+def audit_log(tmp_path):
+    audit_log = AuditLog(str(tmp_path / "audit.db"))
+    yield audit_log
+    audit_log.close()
+
+
+def test_expiry_is_a_vectorized_timestamp_comparison():
+    columns = {
+        "Session_ID": ["old", "new", "blank", "dayfirst", "bad"],
+        "Timestamp": ["2024-01-01T09:30:00", "2026-05-01T00:00:00", "", "15/01/2024", "soon"],
+    }
+    assert expired_session_ids(columns, datetime(2025, 6, 1)) == ["old", "dayfirst"]
+
+
+def test_sweeper_deletes_expired_rows_in_batches_and_audits_each(tmp_path, audit_log):
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-retention", None, write_behind=False, client=emulator)
+    handler.insert_rows([_row(f"s{i}", days_old=100 * i) for i in range(8)])   # s4..s7 are past 365 days
+    emulator.reset_stats()
+
+    sweeper = RetentionSweeper(
+        handler, batch_size=3, checkpoint_path=str(tmp_path / "retention.json"),
+        gdpr_compliance=GDPRCompliance(audit_log=audit_log), clock=lambda: NOW,
+    )
+    result = sweeper.run()
+
+    assert (result["scanned"], result["deleted"], result["pending"]) == (8, 4, [])
+    assert [r["Session_ID"] for r in handler.get_all_candidates()] == ["s0", "s1", "s2", "s3"]
+    assert emulator.calls["spreadsheet_batch_update"] == 2
+    assert [e["details"]["session_ids"] for e in audit_log.query(action="retention_delete")] == [
+        ["s4", "s5", "s6"], ["s7"]
+    ]
+
+    # A repeat run finds nothing new
+    assert sweeper.run()["deleted"] == 0
+
+
+def test_interrupted_sweep_resumes_from_its_checkpoint(tmp_path, audit_log):
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-retention-resume", None, write_behind=False, client=emulator)
+    handler.insert_rows([_row(f"s{i}", days_old=400 + i) for i in range(4)] + [_row("fresh", 1)])
+    sweeper = RetentionSweeper(
+        handler, batch_size=2, checkpoint_path=str(tmp_path / "retention.json"),
+        gdpr_compliance=GDPRCompliance(audit_log=audit_log), clock=lambda: NOW,
+    )
+
+    original_delete = handler.delete_many
+    calls = []
+
+    def failing_second_batch(session_ids):
+        calls.append(session_ids)
+        return 0 if len(calls) == 2 else original_delete(session_ids)
+
+    handler.delete_many = failing_second_batch
+    assert sweeper.run()["pending"] == ["s2", "s3"]
+
+    handler.delete_many = original_delete
+    handler.get_columns = None   # resuming must not rescan the columns
+    result = sweeper.run()
+    assert result["deleted"] == 4 and result["completed_at"]
+    assert [r["Session_ID"] for r in handler.get_all_candidates()] == ["fresh"]
+
+
+def test_later_sweeps_read_only_rows_past_the_last_cutoff(tmp_path, audit_log):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    store.insert_rows([_row("old", 400), _row("aging", 360), _row("fresh", 10)])
+    clock = [NOW]
+    sweeper = RetentionSweeper(
+        store, checkpoint_path=str(tmp_path / "retention.json"),
+        gdpr_compliance=GDPRCompliance(audit_log=audit_log), clock=lambda: clock[0],
+    )
+    assert sweeper.run()["deleted"] == 1   # first sweep is a full scan
+
+    full_scan = store.get_columns
+    store.get_columns = None   # incremental sweeps must not read the whole table
+    clock[0] = NOW + timedelta(days=10)
+    result = sweeper.run()
+    assert (result["scanned"], result["pending"], result["deleted"]) == (1, [], 1)
+    assert [r["Session_ID"] for r in store.get_all_candidates()] == ["fresh"]
+
+    store.get_columns = full_scan
+    clock[0] = NOW + timedelta(days=45)   # past the full scan interval
+    assert sweeper.run()["since"] is None
+    assert sweeper.run()["since"] == (NOW + timedelta(days=45 - 365)).isoformat()
+    store.close()
@@ -0,0 +1,76 @@
+"""Pytest tests for the Session_ID row index."""
+
+from src.data.row_index import SessionRowIndex, descending_row_ranges, parse_append_start_row
+
+
+class _Column:
+    """Stands in for the Session_ID column and counts reads."""
+    def __init__(self, values):
+        self.values = list(values)
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return list(self.values)
+
+
+def test_index_is_built_from_one_column_read():
+    column = _Column(["Session_ID", "a", "b", "c"])
+    index = SessionRowIndex(column)
+
+    assert index.get("a") == 2
+    assert index.get("c") == 4
+    assert column.reads == 1
+
+
+def test_miss_refreshes_once_to_pick_up_foreign_appends():
+    column = _Column(["Session_ID", "a"])
+    index = SessionRowIndex(column)
+    index.get("a")
+
+    column.values.append("b")
+    assert index.get("b") == 3
+    assert column.reads == 2
+
+
+def test_appends_are_recorded_without_reading_the_sheet():
+    column = _Column(["Session_ID", "a"])
+    index = SessionRowIndex(column)
+    index.refresh()
+
+    index.record_append(["b", "c"], start_row=3)
+    assert index.get("c") == 4
+    assert index.last_row == 4
+    assert column.reads == 1
+
+
+def test_delete_shifts_following_rows_up():
+    column = _Column(["Session_ID", "a", "b", "c", "d"])
+    index = SessionRowIndex(column)
+    index.refresh()
+
+    index.record_delete(3)   # removes "b"
+    assert index.contains("b") is False
+    assert index.get("a") == 2
+    assert index.get("c") == 3
+    assert index.get("d") == 4
+    assert column.reads == 1
+
+
+def test_parse_append_start_row():
+    response = {"updates": {"updatedRange": "Sheet1!A12:U14"}}
+    assert parse_append_start_row(response) == 12
+    assert parse_append_start_row({"updates": {}}) is None
+    assert parse_append_start_row(None) is None
+
+
+def test_descending_row_ranges_merge_adjacent_rows():
+    assert descending_row_ranges([2, 3, 4, 7, 9, 10]) == [(9, 10), (7, 7), (2, 4)]
+
+
+def test_record_delete_many_shifts_remaining_rows():
+    index = SessionRowIndex(_Column(["Session_ID", "a", "b", "c", "d", "e"]))
+    index.refresh()
+    index.record_delete_many([3, 5])
+
+    assert index.rows_for(["a", "b", "c", "d", "e"]) == {"a": 2, "c": 3, "e": 4}
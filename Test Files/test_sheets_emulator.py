@@ -0,0 +1,206 @@
+"""Pytest tests for the Google Sheets emulator and SheetsHandler running against it."""
+
+import gspread
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.sheets_emulator import SheetsEmulator, quota_exceeded_error
+from src.data.sheets_handler import SheetsHandler
+
+
+def _row(session_id, experience=3, tech="Python, SQL", timestamp=""):
+    row = [""] * len(SHEET_HEADERS)
+    row[SHEET_HEADERS.index("Timestamp")] = timestamp
+    row[SHEET_HEADERS.index("Session_ID")] = session_id
+    row[SHEET_HEADERS.index("Experience_Years")] = experience
+    row[SHEET_HEADERS.index("Tech_Stack")] = tech
+    row[SHEET_HEADERS.index("Status")] = "completed"
+    return row
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def handler():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    return SheetsHandler("sheet-1", None, write_behind=False, client=emulator)
+
+
+def test_worksheet_reads_and_writes():
+    worksheet = SheetsEmulator().open_by_key("abc").sheet1
+    response = worksheet.append_rows([["a", 1], ["b", 2.0]])
+
+    assert response["updates"]["updatedRange"] == "Sheet1!A1:B2"
+    assert worksheet.col_values(2) == ["1", "2"]
+    worksheet.update_cell(2, 1, "c")
+    assert worksheet.batch_get(["A1:A", "B1:B"], major_dimension="COLUMNS") == [[["a", "c"]], [["1", "2"]]]
+    worksheet.delete_rows(1)
+    assert worksheet.get_all_values() == [["c", "2"]]
+
+
+def test_quota_raises_429_until_window_passes():
+    clock = _Clock()
+    worksheet = SheetsEmulator(read_quota_per_minute=2, clock=clock).open_by_key("abc").sheet1
+    worksheet.row_values(1)   # open_by_key already used one read
+
+    with pytest.raises(gspread.exceptions.APIError) as error:
+        worksheet.row_values(1)
+    assert error.value.code == 429
+
+    clock.now = 61.0
+    assert worksheet.row_values(1) == []
+
+
+def test_handler_writes_headers_and_round_trips_rows(handler):
+    assert handler.sheet.row_values(1) == SHEET_HEADERS
+    assert handler.insert_rows([_row("s1", 2), _row("s2", 6, "Python, Docker")]) == 2
+
+    assert handler.get_candidate_data("s2")["Experience_Years"] == 6
+    assert handler.update_candidate_status("s1", "shortlisted") is True
+    assert handler.get_candidate_data("s1")["Status"] == "shortlisted"
+
+    stats = handler.get_statistics()
+    assert stats["total_candidates"] == 2
+    assert stats["average_experience"] == 4.0
+    assert stats["top_tech_stacks"][0] == ("Python", 2)
+
+    assert handler.delete_candidate_data("s1") is True
+    assert [r["Session_ID"] for r in handler.get_all_candidates()] == ["s2"]
+
+
+def test_handlers_share_one_connection():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    first = SheetsHandler("sheet-1", None, write_behind=False, client=emulator)
+    second = SheetsHandler("sheet-1", None, write_behind=False, client=emulator)
+
+    assert first.connection is second.connection
+    assert emulator.calls["open_by_key"] == 1
+    assert emulator.calls["row_values"] == 1   # headers checked once
+
+
+def test_auth_error_triggers_lazy_reconnect(handler):
+    emulator = handler.client
+    handler.connection.report_error(quota_exceeded_error("read", 60))
+    assert handler.connection.connected   # throttling is not a connection problem
+
+    unauthorized = quota_exceeded_error("read", 60)
+    unauthorized.code = 401
+    handler.connection.report_error(unauthorized)
+    assert not handler.connection.connected
+
+    assert handler.sheet.row_values(1) == SHEET_HEADERS
+    assert emulator.calls["open_by_key"] == 2
+
+
+def test_bulk_delete_and_status_update_use_one_write_each(handler):
+    handler.insert_rows([_row(f"s{i}") for i in range(10)])
+    emulator = handler.client
+    emulator.reset_stats()
+
+    assert handler.update_status_many({"s1": "hired", "s8": "rejected", "nope": "hired"}) == 2
+    assert handler.delete_many(["s2", "s3", "s4", "s7", "nope"]) == 4
+    assert emulator.calls["batch_update"] == 1
+    assert emulator.calls["spreadsheet_batch_update"] == 1
+
+    records = handler.sheet.get_all_records()
+    assert [r["Session_ID"] for r in records] == ["s0", "s1", "s5", "s6", "s8", "s9"]
+    assert records[1]["Status"] == "hired" and records[4]["Status"] == "rejected"
+    assert handler.get_candidate_data("s9")["Session_ID"] == "s9"
+
+
+def test_statistics_are_materialized_in_a_stats_worksheet(handler):
+    handler.insert_rows([_row("s1", 2), _row("s2", 6, "Python, Docker")])
+    assert handler.get_statistics()["total_candidates"] == 2   # initial full scan
+
+    handler.stats.scan_fn = None   # any further full scan would fail
+    handler.insert_rows([_row("s3", 10, "Go")])
+    handler.update_status_many({"s1": "shortlisted", "s3": "hired"})
+    handler.delete_candidate_data("s2")
+
+    stats = handler.get_statistics()
+    assert stats["total_candidates"] == 2
+    assert stats["completed_interviews"] == 0
+    assert stats["average_experience"] == 6.0
+    assert stats["top_tech_stacks"] == [("Go", 1), ("Python", 1), ("SQL", 1)]
+
+    handler.stats.persist(force=True)
+    stats_sheet = handler.sheet.spreadsheet.worksheet("Stats").get_all_values()
+    assert ["Total", "2"] in stats_sheet and ["Status:hired", "1"] in stats_sheet
+
+
+def test_month_shards_route_appends_and_serve_cross_shard_queries():
+    emulator = SheetsEmulator(read_quota_per_minute=None, write_quota_per_minute=None)
+    handler = SheetsHandler("sheet-1", None, write_behind=False, client=emulator, shard_by="month")
+    handler.sheet.append_rows([_row("legacy", 1)])   # written before sharding was enabled
+
+    assert handler.insert_rows([
+        _row("jan-1", 2, timestamp="2025-01-10T09:00:00"),
+        _row("feb-1", 4, "Go", timestamp="2025-02-03T09:00:00"),
+        _row("jan-2", 6, timestamp="2025-01-20T09:00:00"),
+    ]) == 3
+    spreadsheet = handler.sheet.spreadsheet
+    assert spreadsheet.worksheet("Candidates_2025-01").col_values(SHEET_HEADERS.index("Session_ID") + 1) == [
+        "Session_ID", "jan-1", "jan-2"
+    ]
+
+    # A retried batch overwrites rows that already landed instead of duplicating them
+    assert handler.insert_rows([_row("feb-1", 4, "Go", timestamp="2025-02-03T09:00:00")]) == 1
+    assert len(spreadsheet.worksheet("Candidates_2025-02").get_all_values()) == 2
+
+    assert handler.get_candidate_data("jan-2")["Experience_Years"] == 6
+    assert handler.update_candidate_status("feb-1", "hired") is True
+    assert [r["Session_ID"] for r in handler.get_all_candidates()] == ["legacy", "jan-1", "jan-2", "feb-1"]
+    assert handler.get_statistics()["total_candidates"] == 4
+    assert handler.get_statistics()["average_experience"] == 3.2
+
+    emulator.reset_stats()
+    assert handler.delete_many(["legacy", "jan-1", "feb-1"]) == 3
+    assert emulator.calls["spreadsheet_batch_update"] == 1
+    assert [r["Session_ID"] for r in handler.get_all_candidates()] == ["jan-2"]
+    assert handler.get_statistics()["total_candidates"] == 1
+
+
+def test_saving_a_session_again_updates_its_row_in_place(handler):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name="Priya Sharma", email="priya@example.com", phone="9876543210",
+        experience_years=4, desired_positions=["Data Analyst"], location="Mumbai",
+        tech_stack=["Python"], gender="Female", date_of_birth="15/08/1996",
+        graduation_year=2018, cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    assert handler.save_candidate_data(session) is True
+    assert handler.get_statistics()["total_candidates"] == 1
+    emulator = handler.client
+    emulator.reset_stats()
+
+    assert handler.save_candidate_data(session) is True   # unchanged content
+    assert emulator.total_calls == 0
+
+    assert handler.update_candidate_status(session.session_id, "shortlisted") is True
+    emulator.reset_stats()
+    session.candidate_info.experience_years = 6
+    assert handler.save_candidate_data(session) is True
+    assert emulator.calls.get("append_rows", 0) == 0 and emulator.calls["batch_update"] == 1
+
+    records = handler.get_all_candidates()
+    assert len(records) == 1 and records[0]["Experience_Years"] == 6
+    assert records[0]["Status"] == "shortlisted"   # a re-save keeps HR's status
+    stats = handler.get_statistics()
+    assert stats["total_candidates"] == 1 and stats["average_experience"] == 6.0
+
+
+def test_queued_content_hash_is_recorded_only_after_the_write(handler):
+    handler.catalog.stage_content_hash("s1", "h1")
+    handler._on_rows_failed([("s1", [])], RuntimeError("429 quota exceeded"))
+    assert handler.catalog.content_hash("s1") is None   # the next save writes again
+
+    handler.catalog.stage_content_hash("s1", "h2")
+    handler._on_rows_written([("s1", [])], 1)
+    assert handler.catalog.content_hash("s1") == "h2"
@@ -0,0 +1,101 @@
+"""Pytest tests for the local columnar snapshot cache."""
+
+import numpy as np
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.snapshot_cache import CandidateSnapshot
+
+
+def _row(session_id, experience="3", status="completed"):
+    row = [""] * len(SHEET_HEADERS)
+    row[SHEET_HEADERS.index("Session_ID")] = session_id
+    row[SHEET_HEADERS.index("Experience_Years")] = experience
+    row[SHEET_HEADERS.index("Status")] = status
+    return row
+
+
+class _FakeSheet:
+    """Minimal stand-in that records which row ranges were fetched."""
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetches = []
+
+    def session_column(self):
+        return ["Session_ID"] + [r[1] for r in self.rows]
+
+    def fetch_rows(self, first_row, last_row):
+        self.fetches.append((first_row, last_row))
+        return self.rows[first_row - 2:last_row - 1]
+
+
+@pytest.fixture()
+def sheet():
+    return _FakeSheet([_row("a"), _row("b")])
+
+
+def _snapshot(sheet, path):
+    return CandidateSnapshot(
+        str(path), sheet.session_column, sheet.fetch_rows, refresh_interval=0, save_delay=0
+    )
+
+
+def test_only_appended_rows_are_fetched(sheet, tmp_path):
+    snapshot = _snapshot(sheet, tmp_path / "snap.npz")
+    snapshot.refresh()
+    sheet.rows.append(_row("c", experience="5"))
+    snapshot.refresh()
+
+    assert sheet.fetches == [(2, 3), (4, 4)]
+    assert snapshot.get_columns(["Session_ID"])["Session_ID"].tolist() == ["a", "b", "c"]
+    assert snapshot.records()[2]["Experience_Years"] == 5
+
+
+def test_delete_triggers_full_resync(sheet, tmp_path):
+    snapshot = _snapshot(sheet, tmp_path / "snap.npz")
+    snapshot.refresh()
+    del sheet.rows[0]
+    snapshot.refresh()
+
+    assert sheet.fetches[-1] == (2, 2)
+    assert snapshot.row_count == 1
+
+
+def test_snapshot_is_reloaded_from_disk(sheet, tmp_path):
+    path = tmp_path / "snap.npz"
+    _snapshot(sheet, path).refresh()
+
+    reloaded = _snapshot(sheet, path)
+    reloaded.refresh()
+    assert reloaded.row_count == 2
+    assert sheet.fetches == [(2, 3)]   # nothing new to fetch after reload
+
+
+def test_local_patch_and_remove(sheet, tmp_path):
+    snapshot = _snapshot(sheet, tmp_path / "snap.npz")
+    snapshot.refresh()
+    snapshot.patch("a", "Status", "rejected")
+    snapshot.remove("b")
+
+    assert snapshot.records() == [
+        dict(zip(SHEET_HEADERS, [""] * len(SHEET_HEADERS)),
+             Session_ID="a", Experience_Years=3, Status="rejected")
+    ]
+
+
+def test_writes_are_debounced_and_text_is_not_padded(sheet, tmp_path):
+    path = tmp_path / "snap.npz"
+    snapshot = CandidateSnapshot(
+        str(path), sheet.session_column, sheet.fetch_rows, refresh_interval=0, save_delay=3600
+    )
+    snapshot.refresh()
+    snapshot.patch("a", "Status", "a much longer status — ünïcode")
+    snapshot.remove("b")
+    assert not path.exists()
+
+    snapshot.flush()
+    with np.load(path, allow_pickle=False) as data:
+        assert data["Status.utf8"].dtype == np.uint8
+        assert data["Status.offsets"].tolist() == [len("a much longer status — ünïcode".encode())]
+    reloaded = _snapshot(sheet, path)
+    assert reloaded.records()[0]["Status"] == "a much longer status — ünïcode"
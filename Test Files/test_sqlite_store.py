@@ -0,0 +1,152 @@
+"""Pytest tests for the SQLite candidate store."""
+
+import pytest
+
+from src.config.settings import SHEET_HEADERS
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.sqlite_store import SQLiteCandidateStore
+
+
+def _session(name="Priya Sharma", email="priya@example.com", experience=4, tech=None):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name,
+        email=email,
+        phone="9876543210",
+        experience_years=experience,
+        desired_positions=["Data Analyst"],
+        location="Mumbai",
+        tech_stack=tech or ["Python", "SQL"],
+        gender="Female",
+        date_of_birth="15/08/1996",
+        graduation_year=2018,
+        cgpa_10th=9.1,
+        cgpa_12th=8.7,
+        cgpa_degree=8.4,
+    )
+    return session
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    yield store
+    store.close()
+
+
+def test_save_and_get_by_session(store):
+    session = _session()
+    assert store.save_candidate_data(session) is True
+
+    record = store.get_candidate_data(session.session_id)
+    assert record["Full_Name"] == "Priya Sharma"
+    assert record["Experience_Years"] == 4
+    assert record["Email"] != "priya@example.com"   # stored encrypted
+    assert list(record) == SHEET_HEADERS
+
+
+def test_saving_the_same_session_twice_keeps_one_row(store):
+    session = _session()
+    store.save_candidate_data(session)
+    store.save_candidate_data(session)
+
+    assert len(store.get_all_candidates()) == 1
+
+
+def test_find_by_email_uses_blind_index(store):
+    session = _session(email="Priya@Example.com")
+    store.save_candidate_data(session)
+    store.save_candidate_data(_session(name="Rahul Verma", email="rahul@example.com"))
+
+    matches = store.find_by_email("priya@example.com")
+    assert [m["Session_ID"] for m in matches] == [session.session_id]
+
+
+def test_status_update_delete_and_statistics(store):
+    first, second = _session(experience=2), _session(experience=6, tech=["Python", "Docker"])
+    store.save_candidate_data(first)
+    store.save_candidate_data(second)
+
+    assert store.update_candidate_status(second.session_id, "shortlisted") is True
+    stats = store.get_statistics()
+    assert stats["total_candidates"] == 2
+    assert stats["completed_interviews"] == 1
+    assert stats["average_experience"] == 4.0
+    assert stats["top_tech_stacks"][0] == ("Python", 2)
+
+    assert store.delete_candidate_data(first.session_id) is True
+    assert store.delete_candidate_data(first.session_id) is False
+    assert store.get_statistics()["total_candidates"] == 1
+
+
+def test_bulk_insert_rows(store):
+    rows = []
+    for i in range(100):
+        row = [""] * len(SHEET_HEADERS)
+        row[SHEET_HEADERS.index("Session_ID")] = f"bulk-{i}"
+        row[SHEET_HEADERS.index("Experience_Years")] = i % 10
+        rows.append(row)
+
+    assert store.insert_rows(rows) == 100
+    assert store.get_candidate_data("bulk-42")["Experience_Years"] == 2
+    assert "bulk-99" in store.export_data("csv")
+
+
+def test_bulk_status_update_and_delete(store):
+    sessions = [_session(name=name) for name in ("Asha", "Bina", "Chitra")]
+    for session in sessions:
+        store.save_candidate_data(session)
+    ids = [s.session_id for s in sessions]
+
+    assert store.update_status_many({ids[0]: "rejected", ids[2]: "hired", "missing": "hired"}) == 2
+    assert store.get_candidate_data(ids[2])["Status"] == "hired"
+    assert store.delete_many([ids[0], ids[1], "missing"]) == 2
+    assert [r["Session_ID"] for r in store.get_all_candidates()] == [ids[2]]
+
+
+def test_statistics_are_maintained_incrementally(store, tmp_path):
+    first, second = _session(experience=2), _session(experience=6, tech=["Python", "Docker"])
+    store.save_candidate_data(first)
+    assert store.get_statistics()["total_candidates"] == 1   # initial full scan
+
+    store.stats.scan_fn = None   # any further full scan would fail
+    store.save_candidate_data(second)
+    store.save_candidate_data(second)   # re-saving replaces, not double counts
+    store.update_candidate_status(first.session_id, "shortlisted")
+    stats = store.get_statistics()
+    assert stats["total_candidates"] == 2
+    assert stats["completed_interviews"] == 1
+    assert stats["average_experience"] == 4.0
+    assert stats["top_tech_stacks"][0] == ("Python", 2)
+
+    store.delete_candidate_data(second.session_id)
+    assert store.get_statistics()["top_tech_stacks"] == [("Python", 1), ("Sql", 1)]
+
+    reopened = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="test-key")
+    reopened.stats.scan_fn = None   # loaded from candidate_stats, no scan
+    assert reopened.get_statistics()["total_candidates"] == 1
+    reopened.close()
+
+
+def test_stores_on_one_file_share_a_connection_and_aggregates(tmp_path):
+    path = str(tmp_path / "shared.db")
+    first = SQLiteCandidateStore(path, blind_index_key="test-key")
+    second = SQLiteCandidateStore(path, blind_index_key="test-key")
+    assert first._conn is second._conn and first.stats is second.stats
+
+    first.close()
+    second.save_candidate_data(_session())   # still open for the remaining store
+    assert second.get_statistics()["total_candidates"] == 1
+    second.close()
+
+
+def test_resaving_a_session_keeps_its_status(store):
+    session = _session()
+    store.save_candidate_data(session)
+    store.update_candidate_status(session.session_id, "rejected")
+
+    session.candidate_info.experience_years = 7
+    store.save_candidate_data(session)
+    record = store.get_candidate_data(session.session_id)
+    assert (record["Status"], record["Experience_Years"]) == ("rejected", 7)
+    assert store.get_statistics()["completed_interviews"] == 0
@@ -0,0 +1,67 @@
+"""Pytest tests for the data subject access export."""
+
+import json
+
+import pytest
+
+from src.data.audit_log import AuditLog
+from src.data.models import CandidateInfo, ConversationSession
+from src.data.outbox import CandidateOutbox
+from src.data.row_builder import CandidateRowBuilder
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.data.subject_access import SubjectAccessExport
+from src.utils.gdpr_compliance import GDPRCompliance
+
+
+def _session(name, email, phone):
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=name, email=email, phone=phone, experience_years=4,
+        desired_positions=["Data Analyst"], location="Mumbai", tech_stack=["Python"],
+        gender="Female", date_of_birth="15/08/1996", graduation_year=2018,
+        cgpa_10th=9.1, cgpa_12th=8.7, cgpa_degree=8.4,
+    )
+    return session
+
+
+@pytest.fixture()
+def stores(tmp_path):
+    audit_log = AuditLog(str(tmp_path / "audit.db"), flush_interval=0.05)
+    store = SQLiteCandidateStore(str(tmp_path / "candidates.db"), blind_index_key="k")
+    store.gdpr_compliance._audit_log = audit_log
+    outbox = CandidateOutbox(str(tmp_path / "outbox.db"))
+    yield store, outbox, audit_log
+    store.close()
+    outbox.close()
+    audit_log.close()
+
+
+def test_archive_collects_the_subject_from_every_store(stores):
+    store, outbox, audit_log = stores
+    priya = _session("Priya Sharma", "priya@example.com", "9876543210")
+    store.save_candidate_data(priya)
+    store.save_candidate_data(_session("Meera Iyer", "meera@example.com", "9123456780"))
+
+    # A later interview still waiting in the outbox
+    pending = _session("Priya Sharma", "priya@example.com", "9876543210")
+    builder = CandidateRowBuilder(GDPRCompliance(audit_log=audit_log), blind_index_key="k")
+    outbox.add(pending.session_id, builder.build_row(pending))
+
+    service = SubjectAccessExport(store, audit_log=audit_log, outbox=outbox)
+    chunks = list(service.stream(" PRIYA@example.com", requested_by="dpo", chunk_size=256))
+    assert len(chunks) > 1
+    archive = json.loads(b"".join(chunks))
+
+    assert set(archive["session_ids"]) == {priya.session_id, pending.session_id}
+    record, = archive["candidate_records"]
+    assert record["Email"] == "priya@example.com" and record["Phone"] == "9876543210"
+    assert "Email_Index" not in record
+    assert archive["archived_rows"][0]["Outbox_Status"] == "pending"
+    assert {entry["user_id"] for entry in archive["audit_trail"]} == {priya.session_id, pending.session_id}
+    assert audit_log.query(action="subject_access_export")[0]["user_id"] == "dpo"
+
+
+def test_unknown_subject_gets_an_empty_archive(stores):
+    store, outbox, audit_log = stores
+    archive = json.loads(b"".join(SubjectAccessExport(store, audit_log=audit_log).stream("nobody@example.com")))
+    assert archive["session_ids"] == [] and archive["candidate_records"] == [] and archive["audit_trail"] == []
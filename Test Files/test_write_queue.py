@@ -0,0 +1,119 @@
+"""Pytest tests for the write-behind persistence queue.
+
+The queue is exercised against a plain recording function so no Google
+Sheets client is needed.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.data.write_queue import WriteBehindQueue
+
+
+class _RecordingSink:
+    """Collects every batch passed to the flush function."""
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+        self.lock = threading.Lock()
+
+    def __call__(self, rows):
+        with self.lock:
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise RuntimeError("quota exceeded")
+            self.batches.append(list(rows))
+
+
+@pytest.fixture()
+def sink():
+    return _RecordingSink()
+
+
+def test_rows_are_flushed_in_batches_by_size(sink):
+    """A full batch is written with a single flush call."""
+    q = WriteBehindQueue(sink, batch_size=3, flush_interval=5.0)
+    for i in range(6):
+        assert q.enqueue(f"s{i}", [i]) is True
+
+    assert q.flush(timeout=5.0) is True
+    q.close()
+
+    assert [len(b) for b in sink.batches] == [3, 3]
+    assert q.pending_count() == 0
+
+
+def test_partial_batch_is_flushed_after_interval(sink):
+    """Rows below the size threshold are written once the interval elapses."""
+    q = WriteBehindQueue(sink, batch_size=50, flush_interval=0.2)
+    q.enqueue("s1", ["a"])
+    assert q.is_pending("s1")
+
+    time.sleep(0.6)
+    assert sink.batches == [[["a"]]]
+    assert not q.is_pending("s1")
+    q.close()
+
+
+def test_unique_rows_are_coalesced_to_the_newest_version(sink):
+    """Re-queuing a waiting key replaces its row instead of writing it twice."""
+    q = WriteBehindQueue(sink, batch_size=50, flush_interval=5.0)
+    q.enqueue("s1", ["old"], unique=True)
+    q.enqueue("s2", ["other"], unique=True)
+    q.enqueue("s1", ["new"], unique=True)
+
+    assert q.flush(timeout=5.0) is True
+    q.close()
+    assert sink.batches == [[["new"], ["other"]]]
+
+
+def test_backpressure_rejects_when_queue_is_full():
+    """enqueue returns False instead of blocking forever when the queue is full."""
+    release = threading.Event()
+
+    def slow_sink(rows):
+        release.wait(5.0)
+
+    q = WriteBehindQueue(slow_sink, batch_size=1, flush_interval=0.0, max_queue_size=1)
+    q.enqueue("s1", [1])           # picked up by the worker, which then blocks
+    time.sleep(0.1)
+    q.enqueue("s2", [2])           # fills the queue
+    assert q.enqueue("s3", [3], timeout=0.1) is False
+    assert not q.is_pending("s3")
+
+    release.set()
+    q.close()
+
+
+def test_close_drains_queued_rows(sink):
+    """Shutdown writes every row accepted before close()."""
+    q = WriteBehindQueue(sink, batch_size=100, flush_interval=60.0)
+    for i in range(5):
+        q.enqueue(f"s{i}", [i])
+
+    assert q.close(timeout=5.0) is True
+    assert sum(len(b) for b in sink.batches) == 5
+    assert q.enqueue("late", [0]) is False
+
+
+def test_failed_batches_are_retried_then_reported():
+    """Transient failures are retried; exhausted retries call on_failure."""
+    failures = []
+    flaky = _RecordingSink(fail_times=1)
+    q = WriteBehindQueue(flaky, batch_size=1, flush_interval=0.0, retry_backoff=0.01)
+    q.enqueue("s1", [1])
+    q.flush(timeout=5.0)
+    assert flaky.batches == [[[1]]]
+    q.close()
+
+    broken = _RecordingSink(fail_times=10)
+    q = WriteBehindQueue(
+        broken, batch_size=1, flush_interval=0.0, max_retries=1, retry_backoff=0.01,
+        on_failure=lambda batch, exc: failures.extend(key for key, _ in batch),
+    )
+    q.enqueue("s2", [2])
+    q.flush(timeout=5.0)
+    q.close()
+    assert failures == ["s2"]
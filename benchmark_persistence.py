@@ -0,0 +1,78 @@
+"""
+Persistence Benchmark Script - Compares Google Sheets write strategies against the local emulator
+"""
+
+import argparse
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.data.models import ConversationSession, CandidateInfo
+from src.data.sheets_emulator import SheetsEmulator
+from src.data.sheets_handler import SheetsHandler
+
+
+def make_session(i: int) -> ConversationSession:
+    """Build a finished interview session for candidate i"""
+    session = ConversationSession()
+    session.candidate_info = CandidateInfo(
+        full_name=f"Candidate {chr(65 + i % 26)}",
+        email=f"candidate{i}@example.com",
+        phone="9876543210",
+        experience_years=i % 12,
+        desired_positions=["Software Engineer"],
+        location="Bengaluru",
+        tech_stack=["Python", "SQL"] if i % 2 else ["Java", "Docker"],
+        gender="Female" if i % 2 else "Male",
+        date_of_birth="15/08/1996",
+        graduation_year=2018,
+        cgpa_10th=9.1,
+        cgpa_12th=8.7,
+        cgpa_degree=8.4,
+    )
+    return session
+
+
+def run(strategy: str, candidates: int, latency: float, quota: int, seed: int):
+    """Save candidates with one strategy and report caller-side latency and API usage"""
+    emulator = SheetsEmulator(
+        latency=latency, jitter=latency / 2, seed=seed,
+        read_quota_per_minute=quota, write_quota_per_minute=quota
+    )
+    handler = SheetsHandler(
+        f"benchmark-{strategy}", None, client=emulator,
+        write_behind=(strategy == "write-behind"), flush_interval=0.5
+    )
+    sessions = [make_session(i) for i in range(candidates)]
+    emulator.reset_stats()
+
+    saved = 0
+    started = time.perf_counter()
+    for session in sessions:
+        saved += bool(handler.save_candidate_data(session))
+    caller_time = time.perf_counter() - started
+    handler.flush_pending_writes(timeout=60)
+    total_time = time.perf_counter() - started
+
+    rows = len(emulator.open_by_key(handler.sheet_id).sheet1.rows) - 1
+    print(f"📊 {strategy:>12}: saved {saved}/{candidates}, rows in sheet {rows}")
+    print(f"   ⏱️ caller {caller_time * 1000 / candidates:.1f} ms/save, total {total_time:.2f}s")
+    print(f"   📡 API calls {emulator.total_calls}, throttled (429) {emulator.throttled}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Sheets persistence strategies offline")
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated API latency in seconds")
+    parser.add_argument("--quota", type=int, default=60, help="read/write requests per minute")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("🚀 TalentScout persistence benchmark (Google Sheets emulator)")
+    for strategy in ("direct", "write-behind"):
+        run(strategy, args.candidates, args.latency, args.quota, args.seed)
+
+
+if __name__ == "__main__":
+    main()
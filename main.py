@@ -20,6 +20,7 @@ from src.ui.components import (
     render_header,
     render_chat_interface,
     render_progress_actions_bar,
+    render_hr_data_panel,
 )
 from src.chatbot.conversation_manager import ConversationManager
 from src.config.settings import AppConfig
@@ -44,6 +45,9 @@ def main():
     # Render header
     render_header()
     
+    # HR data tools live in the sidebar, independent of the candidate consent flow
+    render_hr_data_panel(st.session_state.conversation_manager)
+    
     # GDPR Compliance Check
     if 'gdpr_consent_given' not in st.session_state:
         st.markdown("### 🔒 Privacy & Data Protection")
@@ -11,10 +11,19 @@ import json
 from src.data.models import ConversationSession, CandidateInfo, TechnicalQuestion, CandidateResponse
 from src.data.validator import DataValidator
 from src.data.sheets_handler import SheetsHandler
+from src.data.sheets_emulator import get_emulator
+from src.data.sqlite_store import SQLiteCandidateStore
+from src.data.row_builder import CandidateRowBuilder
+from src.data.outbox import get_outbox
+from src.data.data_keys import get_data_key_store
+from src.data.audit_log import set_default_audit_log_path
+from src.data.retention import start_retention_sweeper
 from src.chatbot.llm_handler import LLMHandler
 from src.chatbot.sentiment_analyzer import SentimentAnalyzer
 from src.config.prompts import QUESTION_TEMPLATES
 from src.config.settings import ConversationState, AppConfig
+from src.utils.gdpr_compliance import GDPRCompliance
+from src.utils.pii_redaction import PiiRedactor, redacted_print
 
 # Ensure ConversationState is available globally in this module
 # This prevents UnboundLocalError in long methods
@@ -29,43 +38,138 @@ class ConversationManager:
         self.sentiment_analyzer = SentimentAnalyzer()
         self.data_validator = DataValidator()
         
-        # Initialize sheets handler if credentials are available
-        self.sheets_handler = None
+        # Audit entries from every GDPRCompliance instance go to the configured store
+        set_default_audit_log_path(config.audit_log_path)
+        
+        # Durable local outbox so completed interviews survive Sheets outages
+        self.outbox = None
+        if config.outbox_enabled:
+            try:
+                self.outbox = get_outbox(config.outbox_path)
+            except Exception as e:
+                print(f"⚠️ Local outbox unavailable: {str(e)}")
+        
+        # Outbox rows are written when no candidate store exists, so they get their own per-candidate keys;
+        # SheetsHandler shares the same data key store, so a delete shreds these rows too
+        self.outbox_compliance = GDPRCompliance(
+            data_keys=get_data_key_store(config.data_key_store_path) if config.data_key_store_path else None
+        )
+        if not config.data_key_store_path:
+            print("⚠️ DATA_KEY_STORE_PATH not set - deletes remove candidate rows but cannot crypto-shred "
+                  "copies left in backups, exports or the outbox")
+        
+        # Candidate storage backend selected through AppConfig.storage_backend
+        self.candidate_store = None
+        self.storage_name = "Google Sheets"
+        if config.storage_backend.lower() == "sqlite":
+            self.storage_name = "the candidate database"
+            try:
+                self.candidate_store = SQLiteCandidateStore(
+                    config.sqlite_db_path,
+                    blind_index_key=config.secret_key,
+                    stats_reconcile_interval=config.stats_reconcile_interval,
+                    data_key_store_path=config.data_key_store_path or None,
+                    outbox_path=config.outbox_path if self.outbox else None,
+                    replay_interval=config.outbox_replay_interval
+                )
+                print(f"✅ SQLite candidate store enabled: {config.sqlite_db_path}")
+            except Exception as e:
+                print(f"❌ SQLite candidate store failed: {str(e)}")
+        elif config.storage_backend.lower() == "emulator":
+            self.storage_name = "the Google Sheets emulator"
+            self.candidate_store = self._create_sheets_handler(
+                config,
+                client=get_emulator(
+                    latency=config.sheets_emulator_latency,
+                    read_quota_per_minute=config.sheets_emulator_read_quota,
+                    write_quota_per_minute=config.sheets_emulator_write_quota,
+                ),
+            )
+        else:
+            self.candidate_store = self._create_sheets_handler(config)
+        
+        # Scripts and older callers still look for the handler under this name
+        self.sheets_handler = self.candidate_store
+        
+        # Scheduled deletion of candidates past the retention period
+        if self.candidate_store and config.retention_sweep_interval > 0:
+            store_key = getattr(self.candidate_store, "db_path", None) or getattr(self.candidate_store, "sheet_id", "")
+            start_retention_sweeper(
+                f"{config.storage_backend}:{store_key}",
+                self.candidate_store,
+                interval=config.retention_sweep_interval,
+                retention_days=config.retention_days,
+                checkpoint_path=config.retention_checkpoint_path,
+            )
+        
+        # Initialize session if not exists
+        if 'conversation_session' not in st.session_state:
+            st.session_state.conversation_session = ConversationSession()
+    
+    def _sheets_handler_options(self, config: AppConfig) -> Dict[str, Any]:
+        """Persistence settings shared by real and emulated Sheets handlers"""
+        return dict(
+            write_behind=config.sheets_write_behind,
+            batch_size=config.sheets_batch_size,
+            flush_interval=config.sheets_flush_interval,
+            max_queue_size=config.sheets_max_queue_size,
+            outbox_path=config.outbox_path if self.outbox else None,
+            replay_interval=config.outbox_replay_interval,
+            snapshot_path=config.snapshot_cache_path if config.snapshot_cache_enabled else None,
+            snapshot_refresh_interval=config.snapshot_refresh_interval,
+            stats_reconcile_interval=config.stats_reconcile_interval,
+            shard_by=config.sheets_shard_by or None,
+            read_quota_per_minute=config.sheets_read_quota_per_minute or None,
+            write_quota_per_minute=config.sheets_write_quota_per_minute or None,
+            blind_index_key=config.secret_key,
+            data_key_store_path=config.data_key_store_path or None
+        )
+    
+    def _create_sheets_handler(self, config: AppConfig, client=None) -> Optional[SheetsHandler]:
+        """Initialize the Google Sheets handler if credentials (or an emulated client) are available"""
         try:
+            if client is not None:
+                sheets_handler = SheetsHandler(
+                    sheet_id=config.google_sheet_id or "emulated-sheet",
+                    service_account_json=None,
+                    client=client,
+                    **self._sheets_handler_options(config)
+                )
+                print("✅ Google Sheets emulator enabled")
+                return sheets_handler
+            
             # Only initialize if we have valid credentials
             if (hasattr(config, 'google_sheet_id') and 
                 hasattr(config, 'google_service_account_json') and
                 config.google_sheet_id and 
                 config.google_service_account_json):
-                
+            
                 # Parse service account JSON if it's a string
                 if isinstance(config.google_service_account_json, str):
                     service_account_data = json.loads(config.google_service_account_json)
                 else:
                     service_account_data = config.google_service_account_json
-                
+            
                 print(f"🔍 Attempting Google Sheets initialization...")
                 print(f"Sheet ID: {config.google_sheet_id}")
                 print(f"Service Account JSON type: {type(config.google_service_account_json)}")
                 print(f"Parsed JSON type: {type(service_account_data)}")
                 print(f"Has client_email: {'client_email' in service_account_data}")
                 print(f"Has token_uri: {'token_uri' in service_account_data}")
-                
-                self.sheets_handler = SheetsHandler(
+            
+                sheets_handler = SheetsHandler(
                     sheet_id=config.google_sheet_id,
-                    service_account_json=service_account_data
+                    service_account_json=service_account_data,
+                    **self._sheets_handler_options(config)
                 )
                 print("✅ Google Sheets integration enabled successfully!")
+                return sheets_handler
             else:
                 print("⚠️ Google Sheets integration disabled - missing credentials")
         except Exception as e:
             print(f"❌ Google Sheets integration failed: {str(e)}")
-            print("⚠️ Continuing without Google Sheets - data will be saved locally only")
-            self.sheets_handler = None
-        
-        # Initialize session if not exists
-        if 'conversation_session' not in st.session_state:
-            st.session_state.conversation_session = ConversationSession()
+            print("⚠️ Continuing without Google Sheets - data will be saved to the local outbox")
+        return None
     
     def get_session(self) -> ConversationSession:
         """Get current conversation session"""
@@ -978,10 +1082,10 @@ No one knows everything, and honesty is really appreciated in interviews.
             from src.config.settings import ConversationState
             session.current_state = ConversationState.SUMMARY
             
-            # CRITICAL FIX: Save data to Google Sheets when interview completes
-            if self.sheets_handler:
+            # CRITICAL FIX: Save data to storage when interview completes
+            if self.candidate_store:
                 try:
-                    print(f"🔄 Attempting to save candidate data to Google Sheets...")
+                    print(f"🔄 Attempting to save candidate data to {self.storage_name}...")
                     print(f"Session ID: {session.session_id}")
                     print(f"Candidate Info: {session.candidate_info is not None}")
                     print(f"Candidate Info Type: {type(session.candidate_info)}")
@@ -998,7 +1102,7 @@ No one knows everything, and honesty is really appreciated in interviews.
                         if 'email' in cleaned_info:
                             # Fix semicolon in email
                             cleaned_info['email'] = cleaned_info['email'].replace(';', '.')
-                            print(f"🔧 Fixed email: {cleaned_info['email']}")
+                            self._log(f"🔧 Fixed email: {cleaned_info['email']}")
                         
                         try:
                             # Convert to Pydantic model
@@ -1006,25 +1110,28 @@ No one knows everything, and honesty is really appreciated in interviews.
                             session.candidate_info = pydantic_candidate_info
                             print(f"✅ Successfully converted to Pydantic model")
                         except Exception as validation_error:
-                            print(f"⚠️ Pydantic validation failed: {str(validation_error)}")
+                            self._log(f"⚠️ Pydantic validation failed: {str(validation_error)}")
                             # Continue with dict format - sheets handler will handle it
                     
-                    success = self.sheets_handler.save_candidate_data(session)
+                    success = self.candidate_store.save_candidate_data(session)
                     if success:
-                        print(f"✅ Data saved successfully to Google Sheets!")
-                        st.success("✅ Your information has been saved to Google Sheets successfully!")
+                        print(f"✅ Data saved successfully to {self.storage_name}!")
+                        st.success(f"✅ Your information has been saved to {self.storage_name} successfully!")
                     else:
-                        print(f"❌ Failed to save data to Google Sheets")
-                        st.error("❌ Failed to save data to Google Sheets")
+                        print(f"❌ Failed to save data to {self.storage_name}")
+                        st.error(f"❌ Failed to save data to {self.storage_name}")
                         
                 except Exception as e:
-                    print(f"❌ Exception while saving to Google Sheets: {str(e)}")
+                    self._log(f"❌ Exception while saving to {self.storage_name}: {str(e)}")
                     import traceback
                     traceback.print_exc()
                     st.error(f"❌ Failed to save data: {str(e)}")
             else:
-                print(f"⚠️ No Google Sheets handler available - data not saved to sheets")
-                st.warning("⚠️ Google Sheets integration not available - data saved locally only")
+                print(f"⚠️ No candidate store available - data not saved to {self.storage_name}")
+                if self._save_to_local_outbox(session):
+                    st.warning(f"⚠️ Could not connect to {self.storage_name} - data saved locally only")
+                else:
+                    st.warning(f"⚠️ Could not connect to {self.storage_name} - data could not be saved")
             
             # Mark session as completed
             session.completed = True
@@ -1072,28 +1179,31 @@ No one knows everything, and honesty is really appreciated in interviews.
         """Handle summary phase"""
         session = self.get_session()
         
-        # Save data to sheets if available
-        if self.sheets_handler:
+        # Save data to storage if available
+        if self.candidate_store:
             try:
-                print(f"🔄 Attempting to save candidate data to Google Sheets...")
+                print(f"🔄 Attempting to save candidate data to {self.storage_name}...")
                 print(f"Session ID: {session.session_id}")
                 print(f"Candidate Info: {session.candidate_info is not None}")
                 
-                success = self.sheets_handler.save_candidate_data(session)
+                success = self.candidate_store.save_candidate_data(session)
                 if success:
-                    print(f"✅ Data saved successfully to Google Sheets!")
-                    st.success("✅ Your information has been saved to Google Sheets successfully!")
+                    print(f"✅ Data saved successfully to {self.storage_name}!")
+                    st.success(f"✅ Your information has been saved to {self.storage_name} successfully!")
                 else:
-                    print(f"❌ Failed to save data to Google Sheets")
-                    st.error("❌ Failed to save data to Google Sheets")
+                    print(f"❌ Failed to save data to {self.storage_name}")
+                    st.error(f"❌ Failed to save data to {self.storage_name}")
             except Exception as e:
-                print(f"❌ Exception while saving to Google Sheets: {str(e)}")
+                self._log(f"❌ Exception while saving to {self.storage_name}: {str(e)}")
                 import traceback
                 traceback.print_exc()
                 st.error(f"❌ Failed to save data: {str(e)}")
         else:
-            print(f"⚠️ No Google Sheets handler available - data not saved to sheets")
-            st.warning("⚠️ Google Sheets integration not available - data saved locally only")
+            print(f"⚠️ No candidate store available - data not saved to {self.storage_name}")
+            if self._save_to_local_outbox(session):
+                st.warning(f"⚠️ Could not connect to {self.storage_name} - data saved locally only")
+            else:
+                st.warning(f"⚠️ Could not connect to {self.storage_name} - data could not be saved")
         
         # Mark session as completed
         session.completed = True
@@ -1101,6 +1211,29 @@ No one knows everything, and honesty is really appreciated in interviews.
         
         return "Thank you for completing the interview! Your information has been recorded and our team will review it shortly. You should hear back from us within 2-3 business days. Have a great day!"
     
+    def _log(self, message: str):
+        """print() a diagnostic line with the current candidate's PII masked"""
+        redacted_print(message, PiiRedactor.for_candidate(self.get_session().candidate_info, mask=True))
+    
+    def _save_to_local_outbox(self, session: ConversationSession) -> bool:
+        """Record the candidate row in the local outbox (replayed by the next Sheets or SQLite store that starts)"""
+        if not self.outbox:
+            return False
+        try:
+            # Rows are replayed to Sheets as-is, encrypted under the candidate's own data key
+            built = CandidateRowBuilder(
+                self.outbox_compliance, blind_index_key=self.config.secret_key
+            ).build_row_with_hash(session)
+            if built is None:
+                return False
+            row_data, content_hash = built
+            self.outbox.add(session.session_id, row_data, content_hash)
+            print(f"💾 Candidate data saved to local outbox ({self.outbox.pending_count()} pending)")
+            return True
+        except Exception as e:
+            self._log(f"❌ Failed to save data to local outbox: {str(e)}")
+            return False
+    
     def _handle_conversation_end(self) -> str:
         """Handle conversation end request"""
         session = self.get_session()
@@ -1110,10 +1243,13 @@ No one knows everything, and honesty is really appreciated in interviews.
     
     def _handle_fallback(self, user_input: str) -> str:
         """Handle fallback cases"""
+        session = self.get_session()
         return self.llm_handler.generate_response(
             prompt=user_input,
             context_type="fallback",
-            conversation_history=self.get_session().chat_history
+            conversation_history=session.chat_history,
+            # Also redacts the candidate's name, which no pattern can recognise
+            redactor=PiiRedactor.for_candidate(session.candidate_info)
         )
     
     def _extract_candidate_info(self, text: str) -> Dict[str, Any]:
@@ -8,6 +8,9 @@ from groq import Groq
 import streamlit as st
 from src.config.prompts import SYSTEM_PROMPTS
 from src.config.settings import AppConfig
+from src.utils.constants import MAX_MESSAGE_LENGTH
+from src.utils.helpers import compact_markdown
+from src.utils.pii_redaction import PiiRedactor
 
 class LLMHandler:
     """Handles all LLM interactions using Groq API"""
@@ -30,10 +33,13 @@ class LLMHandler:
         prompt: str, 
         context_type: str = "greeting",
         conversation_history: Optional[List[Dict]] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        redactor: Optional[PiiRedactor] = None
     ) -> str:
-        """Generate response using Groq LLM"""
+        """Generate response using Groq LLM (PII is replaced by placeholders on the way out and restored on the way back)"""
         try:
+            redactor = redactor or PiiRedactor()
+            
             # Get system prompt based on context
             system_prompt = SYSTEM_PROMPTS.get(context_type, SYSTEM_PROMPTS["greeting"])
             
@@ -44,13 +50,17 @@ class LLMHandler:
             if conversation_history:
                 for msg in conversation_history[-5:]:  # Last 5 messages for context
                     if msg.get("role") in ["user", "assistant"]:
+                        content = msg["content"]
+                        if msg["role"] == "assistant":
+                            # Bot turns are long markdown; the model only needs their text
+                            content = compact_markdown(content, MAX_MESSAGE_LENGTH)
                         messages.append({
                             "role": msg["role"],
-                            "content": msg["content"]
+                            "content": redactor.redact(content)
                         })
             
             # Add current prompt
-            messages.append({"role": "user", "content": prompt})
+            messages.append({"role": "user", "content": redactor.redact(prompt)})
             
             # Make API call
             response = self.client.chat.completions.create(
@@ -61,7 +71,7 @@ class LLMHandler:
                 stream=False
             )
             
-            return response.choices[0].message.content.strip()
+            return redactor.restore(response.choices[0].message.content.strip())
             
         except Exception as e:
             st.error(f"LLM generation failed: {str(e)}")
@@ -300,7 +310,8 @@ Keep it concise and professional.
             return self.generate_response(
                 prompt=prompt,
                 context_type="summary",
-                max_tokens=400
+                max_tokens=400,
+                redactor=PiiRedactor.for_candidate(candidate_info)
             )
             
         except Exception as e:
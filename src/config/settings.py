@@ -34,6 +34,56 @@ class AppConfig(BaseSettings):
     max_response_time: float = 2.0
     max_concurrent_users: int = 10
 
+    # Candidate storage backend: "sheets" (Google Sheets), "sqlite" or "emulator" (offline Sheets emulator)
+    storage_backend: str = "sheets"
+    sqlite_db_path: str = "backups/candidates.db"
+
+    # Local Google Sheets emulator (load testing and offline benchmarks)
+    sheets_emulator_latency: float = 0.0
+    sheets_emulator_read_quota: int = 60
+    sheets_emulator_write_quota: int = 60
+
+    # Persistence Settings (write-behind batching for Google Sheets)
+    sheets_write_behind: bool = True
+    sheets_batch_size: int = 20
+    sheets_flush_interval: float = 2.0
+    sheets_max_queue_size: int = 500
+
+    # Password for the HR data panel (exports, subject access requests, imports); blank hides the panel
+    admin_password: str = ""
+
+    # Durable local outbox (rows are replayed to Google Sheets)
+    outbox_enabled: bool = True
+    outbox_path: str = "backups/candidate_outbox.db"
+    outbox_replay_interval: float = 30.0
+
+    # Append-only audit trail of personal data access
+    audit_log_path: str = "backups/audit_log.db"
+
+    # Per-candidate data keys so a delete crypto-shreds every copy (blank keeps master-key encryption and
+    # logs a warning at startup; the file must persist, or every enveloped value becomes unreadable)
+    data_key_store_path: str = ""
+
+    # Retention sweeper (deletes candidates older than the retention period; interval 0 disables it)
+    retention_days: int = 365
+    retention_sweep_interval: float = 86400.0
+    retention_checkpoint_path: str = "backups/retention_checkpoint.json"
+
+    # Local columnar snapshot of the candidate sheet for dashboard reads
+    snapshot_cache_enabled: bool = True
+    snapshot_cache_path: str = "backups/candidate_snapshot.npz"
+    snapshot_refresh_interval: float = 30.0
+
+    # Materialized statistics (full-scan reconciliation interval in seconds)
+    stats_reconcile_interval: float = 600.0
+
+    # Client-side Google Sheets API budget (requests per minute per quota; 0 disables the limit)
+    sheets_read_quota_per_minute: int = 60
+    sheets_write_quota_per_minute: int = 60
+
+    # Candidate worksheet sharding: "" (single sheet), "month" or "role"
+    sheets_shard_by: str = ""
+
     # UI Configuration
     app_title: str = "TalentScout Hiring Assistant"
     app_icon: str = "🤖"
@@ -89,9 +139,13 @@ SHEET_HEADERS = [
     "CGPA_10th", "CGPA_12th", "CGPA_Degree", "Tech_Stack", 
     "Work_Experience_Description", "Why_Good_Candidate", 
     "Technical_Questions", "Candidate_Responses", 
-    "Sentiment_Score", "Questions_Answered"
+    "Sentiment_Score", "Questions_Answered", "Status",
+    "Email_Index", "Phone_Index"
 ]
 
+# Keyed HMAC blind index column -> the encrypted column it indexes (lookups without decryption)
+BLIND_INDEX_COLUMNS = {"Email_Index": "Email", "Phone_Index": "Phone"}
+
 # Supported tech stacks
 TECH_STACKS = {
     "programming_languages": [
@@ -0,0 +1,192 @@
+"""
+Batch Anonymizer for TalentScout Hiring Assistant
+Streams candidate pages into a columnar analytics dataset with keyed pseudonyms and generalized fields
+"""
+
+import hashlib
+import hmac
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.projection import NUMERIC_COLUMNS, to_typed_column
+from src.data.retention import parse_timestamps
+from src.utils.gdpr_compliance import GDPRCompliance
+
+# Domain separation: analytics pseudonyms never equal the email blind index built from the same secret
+ANALYTICS_KEY_CONTEXT = b"talentscout-analytics-pseudonym"
+
+# Copied as-is: no direct identifiers and coarse enough on their own
+PASSTHROUGH_COLUMNS = [
+    "Gender", "Experience_Years", "Desired_Positions", "Graduation_Year", "CGPA_10th", "CGPA_12th",
+    "CGPA_Degree", "Tech_Stack", "Sentiment_Score", "Questions_Answered", "Status",
+]
+
+# Names, contact details, exact dates and free text never reach the dataset
+ANALYTICS_COLUMNS = ["Candidate_Key", "Application_Month", "Age_Band", "Region"] + PASSTHROUGH_COLUMNS
+
+AGE_BAND_WIDTH = 5
+AGE_BAND_MIN = 20
+AGE_BAND_MAX = 60
+
+# Lower-case city / state / country -> reporting region
+REGIONS = {
+    **dict.fromkeys(["mumbai", "pune", "ahmedabad", "surat", "nagpur", "goa", "maharashtra", "gujarat"], "West India"),
+    **dict.fromkeys(["delhi", "new delhi", "gurgaon", "gurugram", "noida", "jaipur", "lucknow", "chandigarh"], "North India"),
+    **dict.fromkeys(["bangalore", "bengaluru", "chennai", "hyderabad", "kochi", "coimbatore", "karnataka", "tamil nadu", "kerala", "telangana"], "South India"),
+    **dict.fromkeys(["kolkata", "bhubaneswar", "patna", "guwahati", "west bengal", "odisha"], "East India"),
+    **dict.fromkeys(["indore", "bhopal", "raipur", "madhya pradesh"], "Central India"),
+    **dict.fromkeys(["usa", "us", "united states", "canada"], "North America"),
+    **dict.fromkeys(["uk", "united kingdom", "germany", "france", "netherlands", "ireland"], "Europe"),
+    **dict.fromkeys(["singapore", "uae", "dubai", "japan", "australia"], "Asia Pacific & Middle East"),
+}
+UNKNOWN_REGION = "Other"
+
+
+def analytics_key(secret: str) -> bytes:
+    """Pseudonym key derived from the application secret"""
+    return hmac.new(secret.encode(), ANALYTICS_KEY_CONTEXT, hashlib.sha256).digest()
+
+
+def region_for(location: str) -> str:
+    """Generalize a free-text location to a reporting region (most specific part first)"""
+    parts = [part.strip().lower() for part in str(location or "").split(",") if part.strip()]
+    for part in parts:
+        if part in REGIONS:
+            return REGIONS[part]
+    if parts and parts[-1] == "india":
+        return "India"
+    return UNKNOWN_REGION if parts else ""
+
+
+def age_bands(birth_dates: pd.Series, reference: datetime) -> np.ndarray:
+    """Generalize parsed UTC birth dates to 5-year age bands ("" when unknown)"""
+    reference = pd.Timestamp(reference)
+    reference = reference.tz_localize("UTC") if reference.tzinfo is None else reference.tz_convert("UTC")
+    years = reference.year - birth_dates.dt.year
+    not_yet = (birth_dates.dt.month > reference.month) | (
+        (birth_dates.dt.month == reference.month) & (birth_dates.dt.day > reference.day)
+    )
+    ages = (years - not_yet.astype(int)).to_numpy(dtype=np.float64, na_value=np.nan)
+
+    bands = np.full(len(ages), "", dtype=object)
+    known = ~np.isnan(ages)
+    low = (np.clip(ages[known], AGE_BAND_MIN, AGE_BAND_MAX) // AGE_BAND_WIDTH * AGE_BAND_WIDTH).astype(int)
+    bands[known] = [
+        f"<{AGE_BAND_MIN}" if age < AGE_BAND_MIN else f"{AGE_BAND_MAX}+" if start >= AGE_BAND_MAX
+        else f"{start}-{start + AGE_BAND_WIDTH - 1}"
+        for age, start in zip(ages[known], low)
+    ]
+    return bands
+
+
+class BatchAnonymizer:
+    """Turns pages of candidate records into analytics columns; repeated values are hashed / parsed once"""
+
+    def __init__(
+        self,
+        key: bytes,
+        gdpr_compliance: Optional[GDPRCompliance] = None,
+        reference_date: Optional[datetime] = None,
+        cache_size: int = 100000,
+    ):
+        self.key = key
+        self.gdpr_compliance = gdpr_compliance or GDPRCompliance()
+        self.reference_date = reference_date or datetime.now()
+        self.cache_size = cache_size
+        self._pseudonyms: Dict[str, str] = {}
+        self._regions: Dict[str, str] = {}
+        self._age_bands: Dict[str, str] = {}
+
+    def pseudonym(self, value: str) -> str:
+        """128-bit keyed pseudonym of a normalized identifier (blank stays blank)"""
+        normalized = str(value or "").strip().lower()
+        if not normalized:
+            return ""
+        return hmac.new(self.key, normalized.encode(), hashlib.sha256).hexdigest()[:32]
+
+    def anonymize_page(self, records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Analytics columns for one page of stored (encrypted) records"""
+        # Only the fields that feed a pseudonym or a generalization are decrypted
+        records = self.gdpr_compliance.decrypt_records(records, ["Email", "Date_of_Birth"])
+        length = len(records)
+
+        def values(name: str) -> List[Any]:
+            return [record.get(name, "") for record in records]
+
+        emails = values("Email")
+        columns = {
+            # Keyed on the email so repeat applications link up; falls back to the session for blank emails
+            "Candidate_Key": self._memoized(
+                self._pseudonyms, [email or sid for email, sid in zip(emails, values("Session_ID"))], self.pseudonym
+            ),
+            "Application_Month": self._months(values("Timestamp")),
+            "Age_Band": self._memoized_batch(self._age_bands, values("Date_of_Birth"), self._age_bands_for),
+            "Region": self._memoized(self._regions, values("Location"), region_for),
+        }
+        for name in PASSTHROUGH_COLUMNS:
+            columns[name] = to_typed_column(name, values(name), length)
+        return {name: np.asarray(columns[name], dtype=np.float64 if name in NUMERIC_COLUMNS else object)
+                for name in ANALYTICS_COLUMNS}
+
+    def anonymize(self, pages: Iterable[List[Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+        """Analytics dataset for every page, as one array per column"""
+        parts = [self.anonymize_page(records) for records in pages if records]
+        if not parts:
+            return {name: np.empty(0, dtype=np.float64 if name in NUMERIC_COLUMNS else object) for name in ANALYTICS_COLUMNS}
+        return {name: np.concatenate([part[name] for part in parts]) for name in ANALYTICS_COLUMNS}
+
+    def _age_bands_for(self, birth_dates: List[str]) -> List[str]:
+        """Age bands for a batch of distinct birth date strings"""
+        return list(age_bands(parse_timestamps(np.asarray(birth_dates, dtype=object)), self.reference_date))
+
+    def _months(self, timestamps: List[Any]) -> np.ndarray:
+        """Application timestamps generalized to YYYY-MM"""
+        parsed = parse_timestamps(np.asarray(timestamps, dtype=object))
+        return parsed.dt.strftime("%Y-%m").fillna("").to_numpy(dtype=object)
+
+    def _memoized(self, cache: Dict[str, str], values: List[Any], compute: Callable[[str], str]) -> List[str]:
+        """Map values through a per-value function, computing each distinct value once"""
+        return self._memoized_batch(cache, values, lambda misses: [compute(value) for value in misses])
+
+    def _memoized_batch(
+        self, cache: Dict[str, str], values: List[Any], compute: Callable[[List[str]], List[str]]
+    ) -> List[str]:
+        """Map values through a batch function called only on distinct values missing from the cache"""
+        keys = ["" if value is None else str(value) for value in values]
+        misses = [key for key in dict.fromkeys(keys) if key not in cache]
+        if misses:
+            if len(cache) + len(misses) > self.cache_size:
+                cache.clear()
+            cache.update(zip(misses, compute(misses)))
+        return [cache[key] for key in keys]
+
+
+def write_analytics_dataset(
+    store, path: str, secret: str, page_size: int = 1000, reference_date: Optional[datetime] = None
+) -> int:
+    """Anonymize every candidate in a store into a columnar .npz dataset (written atomically); returns rows"""
+    anonymizer = BatchAnonymizer(
+        analytics_key(secret),
+        gdpr_compliance=getattr(store, "gdpr_compliance", None),
+        reference_date=reference_date,
+    )
+    columns = anonymizer.anonymize(store.iter_records(page_size=page_size))
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    arrays = {name: column if name in NUMERIC_COLUMNS else column.astype(str) for name, column in columns.items()}
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return len(columns["Candidate_Key"])
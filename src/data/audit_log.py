@@ -0,0 +1,172 @@
+"""
+Durable Audit Log for TalentScout Hiring Assistant
+Append-only SQLite audit trail written in batches by a background queue
+"""
+
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.data.write_queue import QueueItem, get_write_queue
+
+AUDIT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    data_type TEXT,
+    user_id TEXT,
+    ip_address TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_log (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log (timestamp);
+CREATE TRIGGER IF NOT EXISTS audit_log_no_update BEFORE UPDATE ON audit_log
+BEGIN SELECT RAISE(ABORT, 'audit log is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS audit_log_no_delete BEFORE DELETE ON audit_log
+BEGIN SELECT RAISE(ABORT, 'audit log is append-only'); END;
+"""
+
+AUDIT_FIELDS = ["timestamp", "action", "data_type", "user_id", "ip_address", "details"]
+
+DEFAULT_AUDIT_LOG_PATH = os.path.join("backups", "audit_log.db")
+
+
+class AuditLog:
+    """Append-only audit trail: entries are queued in memory and inserted in batches"""
+
+    def __init__(self, db_path: str, batch_size: int = 200, flush_interval: float = 1.0, max_queue_size: int = 10000):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(AUDIT_SCHEMA)
+
+        # Saves only pay for a queue put; the worker does the inserts. The shared registry drains it at exit
+        self.queue = get_write_queue(
+            f"audit:{os.path.abspath(db_path)}",
+            self._insert,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            max_queue_size=max_queue_size,
+            on_failure=self._insert_each,
+        )
+
+    def record(self, entry: Dict[str, Any]):
+        """Queue an audit entry (written synchronously only when the queue is full)"""
+        row = [entry.get(name) for name in AUDIT_FIELDS[:-1]]
+        extra = {key: value for key, value in entry.items() if key not in AUDIT_FIELDS}
+        details = entry.get("details", extra or None)
+        row.append(json.dumps(details, default=str) if details is not None else None)
+        if not self.queue.enqueue(str(next(self._sequence)), row, timeout=0):
+            # Never drop audit entries: fall back to a direct insert under backpressure
+            self._insert([row])
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until queued entries are on disk"""
+        return self.queue.flush(timeout)
+
+    def query(
+        self,
+        user_id: Optional[str] = None,
+        action: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = 1000,
+        user_ids: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Entries matching the filters, oldest first (ISO timestamps compare as text)"""
+        self.flush()
+        clauses, params = [], []
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            clauses.append(f"user_id IN ({', '.join('?' for _ in user_ids)})" if user_ids else "0")
+            params.extend(user_ids)
+        for clause, value in (
+            ("user_id = ?", user_id), ("action = ?", action), ("timestamp >= ?", since), ("timestamp < ?", until)
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT {', '.join(AUDIT_FIELDS)} FROM audit_log {where} ORDER BY timestamp, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        entries = []
+        for row in rows:
+            entry = dict(zip(AUDIT_FIELDS, row))
+            entry["details"] = json.loads(entry["details"]) if entry["details"] else None
+            entries.append(entry)
+        return entries
+
+    def count(self) -> int:
+        """Number of entries on disk"""
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+
+    def close(self):
+        """Drain the queue and close the database"""
+        self.queue.close()
+        with self._lock:
+            self._conn.close()
+
+    def _insert_each(self, batch: List[QueueItem], error: Exception):
+        """Last resort for a batch that kept failing: insert its entries one at a time"""
+        for _, row in batch:
+            try:
+                self._insert([row])
+            except Exception as e:
+                print(f"❌ Audit entry could not be written: {str(e)}")
+
+    def _insert(self, rows: List[List[Any]]) -> int:
+        """Insert a batch in one transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT INTO audit_log ({', '.join(AUDIT_FIELDS)}) VALUES ({', '.join('?' for _ in AUDIT_FIELDS)})",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+
+# Process-wide audit logs, one per database file, plus the default used by GDPRCompliance
+_audit_logs: Dict[str, AuditLog] = {}
+_default_path = DEFAULT_AUDIT_LOG_PATH
+_registry_lock = threading.Lock()
+
+
+def get_audit_log(db_path: Optional[str] = None) -> AuditLog:
+    """Get the shared audit log for a database file (the configured default when none is given)"""
+    key = os.path.abspath(db_path or _default_path)
+    with _registry_lock:
+        audit_log = _audit_logs.get(key)
+        if audit_log is None:
+            audit_log = AuditLog(key)
+            _audit_logs[key] = audit_log
+        return audit_log
+
+
+def set_default_audit_log_path(db_path: str):
+    """Choose the database the default audit log writes to (AppConfig.audit_log_path)"""
+    global _default_path
+    with _registry_lock:
+        _default_path = db_path
@@ -0,0 +1,175 @@
+"""
+Blind Index Lookups for TalentScout Hiring Assistant
+Keyed HMAC indexes of encrypted email and phone columns, an in-memory lookup table and a backfill job
+"""
+
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from src.config.settings import BLIND_INDEX_COLUMNS, SHEET_HEADERS
+from src.utils.gdpr_compliance import GDPRCompliance, compute_blind_index
+
+_SESSION_ID = SHEET_HEADERS.index("Session_ID")
+_INDEX_POSITIONS = {name: SHEET_HEADERS.index(name) for name in BLIND_INDEX_COLUMNS}
+
+
+def email_blind_index(email: str, key: str) -> str:
+    """Blind index of an email address (case-insensitive)"""
+    return compute_blind_index(email, key)
+
+
+def phone_blind_index(phone: str, key: str) -> str:
+    """Blind index of a phone number (digits only, so formatting does not matter)"""
+    return compute_blind_index(re.sub(r"\D", "", str(phone or "")), key)
+
+
+# Index column -> how its plaintext is normalized and hashed
+BLIND_INDEX_FUNCTIONS = {"Email_Index": email_blind_index, "Phone_Index": phone_blind_index}
+
+
+def blind_indexes(email: str, phone: str, key: Optional[str]) -> Dict[str, str]:
+    """Index column values for a candidate (blank when no key is configured)"""
+    if not key:
+        return {name: "" for name in BLIND_INDEX_COLUMNS}
+    return {"Email_Index": email_blind_index(email, key), "Phone_Index": phone_blind_index(phone, key)}
+
+
+class BlindIndexTable:
+    """In-memory blind index -> Session_IDs table, loaded with one column read and kept current on writes"""
+
+    def __init__(self, load_columns: Callable[[List[str]], Dict[str, Iterable[Any]]], refresh_interval: float = 30.0):
+        self.load_columns = load_columns
+        self.refresh_interval = refresh_interval
+        self._by_hash: Dict[str, Dict[str, Set[str]]] = {name: {} for name in BLIND_INDEX_COLUMNS}
+        self._by_session: Dict[str, Dict[str, str]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def refresh(self):
+        """Rebuild the table from the Session_ID and index columns"""
+        columns = self.load_columns(["Session_ID"] + list(BLIND_INDEX_COLUMNS))
+        with self._lock:
+            self._by_hash = {name: {} for name in BLIND_INDEX_COLUMNS}
+            self._by_session = {}
+            for values in zip(*(columns[name] for name in ["Session_ID"] + list(BLIND_INDEX_COLUMNS))):
+                if values[0]:
+                    self._add(values[0], dict(zip(BLIND_INDEX_COLUMNS, values[1:])))
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """Force a rebuild on the next lookup"""
+        with self._lock:
+            self._loaded_at = None
+
+    def lookup(self, column: str, value_hash: str) -> List[str]:
+        """Session_IDs whose index column holds the hash (rows written elsewhere show up within refresh_interval)"""
+        if not value_hash:
+            return []
+        with self._lock:
+            stale = self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_interval
+            found = self._by_hash[column].get(value_hash)
+            if found and self._loaded_at is not None:
+                return sorted(found)
+        if stale:
+            self.refresh()
+        with self._lock:
+            return sorted(self._by_hash[column].get(value_hash, ()))
+
+    def record_rows(self, rows: Iterable[List[Any]]):
+        """Index rows (SHEET_HEADERS order) written by this process"""
+        with self._lock:
+            for row in rows:
+                row = list(row) + [""] * (len(SHEET_HEADERS) - len(row))
+                session_id = row[_SESSION_ID]
+                self._remove(session_id)
+                self._add(session_id, {name: row[position] for name, position in _INDEX_POSITIONS.items()})
+
+    def forget(self, session_ids: Iterable[str]):
+        """Drop deleted sessions"""
+        with self._lock:
+            for session_id in session_ids:
+                self._remove(session_id)
+
+    def _add(self, session_id: str, hashes: Dict[str, str]):
+        """Index one session's hashes"""
+        self._by_session[session_id] = hashes
+        for name, value_hash in hashes.items():
+            if value_hash:
+                self._by_hash[name].setdefault(value_hash, set()).add(session_id)
+
+    def _remove(self, session_id: str):
+        """Unindex one session"""
+        for name, value_hash in self._by_session.pop(session_id, {}).items():
+            sessions = self._by_hash[name].get(value_hash)
+            if sessions:
+                sessions.discard(session_id)
+                if not sessions:
+                    del self._by_hash[name][value_hash]
+
+
+# Process-wide tables, one per candidate sheet
+_tables: Dict[str, BlindIndexTable] = {}
+_registry_lock = threading.Lock()
+
+
+def get_blind_index_table(key: str, **kwargs) -> BlindIndexTable:
+    """Get the shared blind index table for a sheet, creating it on first use"""
+    with _registry_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = BlindIndexTable(**kwargs)
+            _tables[key] = table
+        return table
+
+
+class BlindIndexBackfill:
+    """Fills blind index columns of rows saved before they existed (rows already indexed are skipped, so reruns are cheap)"""
+
+    def __init__(
+        self,
+        store,
+        blind_index_key: str,
+        gdpr_compliance: Optional[GDPRCompliance] = None,
+        page_size: int = 500,
+        rebuild: bool = False,
+    ):
+        self.store = store
+        self.blind_index_key = blind_index_key
+        self.gdpr_compliance = gdpr_compliance or getattr(store, "gdpr_compliance", None) or GDPRCompliance()
+        self.page_size = page_size
+        # Recompute every row, e.g. after SECRET_KEY changed
+        self.rebuild = rebuild
+
+    def run(self) -> Dict[str, int]:
+        """Index every unindexed row; returns scanned and updated counts"""
+        result = {"scanned": 0, "updated": 0}
+        for records in self.store.iter_records(page_size=self.page_size):
+            rows = self._index_page(records)
+            if rows:
+                self.store.insert_rows(rows)
+            result["scanned"] += len(records)
+            result["updated"] += len(rows)
+        print(f"🔎 Blind index backfill: {result['updated']} of {result['scanned']} rows indexed")
+        return result
+
+    def _index_page(self, records: List[Dict[str, Any]]) -> List[List[Any]]:
+        """Rows of the page whose index columns changed (decrypting one batch per column)"""
+        pending = [
+            record for record in records
+            if self.rebuild or any(
+                record.get(source) and not record.get(name) for name, source in BLIND_INDEX_COLUMNS.items()
+            )
+        ]
+        if not pending:
+            return []
+
+        plaintexts = self.gdpr_compliance.decrypt_records(pending, BLIND_INDEX_COLUMNS.values())
+        rows = []
+        for record, plain in zip(pending, plaintexts):
+            hashes = blind_indexes(plain.get("Email", ""), plain.get("Phone", ""), self.blind_index_key)
+            if any(str(record.get(name, "")) != value for name, value in hashes.items()):
+                record.update(hashes)
+                rows.append([record.get(name, "") for name in SHEET_HEADERS])
+        return rows
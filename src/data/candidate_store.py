@@ -0,0 +1,95 @@
+"""
+Candidate Storage Interface for TalentScout Hiring Assistant
+Common contract implemented by the Google Sheets and SQLite backends
+"""
+
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Iterator, Optional
+from src.config.settings import BLIND_INDEX_COLUMNS
+from src.data.models import ConversationSession
+
+
+def format_export(records: List[Dict[str, Any]], format_type: str) -> Optional[str]:
+    """Serialize candidate records as CSV or JSON (None for unknown formats)"""
+    # Blind index hashes are lookup keys, not candidate data
+    records = [
+        {name: value for name, value in record.items() if name not in BLIND_INDEX_COLUMNS}
+        for record in records
+    ]
+    if format_type.lower() == "csv":
+        output = io.StringIO()
+        if records:
+            writer = csv.DictWriter(output, fieldnames=records[0].keys())
+            writer.writeheader()
+            writer.writerows(records)
+
+        return output.getvalue()
+
+    elif format_type.lower() == "json":
+        return json.dumps(records, indent=2, default=str)
+
+    return None
+
+
+class CandidateStore(ABC):
+    """Abstract candidate storage backend"""
+
+    @abstractmethod
+    def save_candidate_data(self, session: ConversationSession) -> bool:
+        """Persist the candidate row for a finished interview"""
+
+    @abstractmethod
+    def insert_rows(self, rows: List[List[Any]]) -> int:
+        """Bulk insert prepared rows (SHEET_HEADERS order); returns how many were written"""
+
+    @abstractmethod
+    def get_candidate_data(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve candidate data by session ID"""
+
+    @abstractmethod
+    def update_candidate_status(self, session_id: str, new_status: str) -> bool:
+        """Update candidate status"""
+
+    @abstractmethod
+    def delete_candidate_data(self, session_id: str) -> bool:
+        """Delete candidate data (for GDPR compliance)"""
+
+    @abstractmethod
+    def get_all_candidates(self) -> List[Dict[str, Any]]:
+        """Get all candidate records"""
+
+    @abstractmethod
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get basic statistics from the data"""
+
+    @abstractmethod
+    def export_data(self, format_type: str = "csv") -> Optional[str]:
+        """Export data in specified format"""
+
+    def iter_records(self, page_size: int = 1000, after: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield candidate records in pages of at most page_size, starting after the given Session_ID (if present)"""
+        records = self.get_all_candidates()
+        if after:
+            session_ids = [record.get("Session_ID") for record in records]
+            if after in session_ids:
+                records = records[session_ids.index(after) + 1:]
+        for start in range(0, len(records), page_size):
+            yield records[start:start + page_size]
+
+    def delete_many(self, session_ids: List[str]) -> int:
+        """Delete several candidates; returns how many rows were removed"""
+        return sum(1 for session_id in session_ids if self.delete_candidate_data(session_id))
+
+    def update_status_many(self, statuses: Dict[str, str]) -> int:
+        """Set the status of several candidates; returns how many rows were updated"""
+        return sum(
+            1 for session_id, status in statuses.items()
+            if self.update_candidate_status(session_id, status)
+        )
+
+    def flush_pending_writes(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until buffered writes are durable (no-op for synchronous stores)"""
+        return True
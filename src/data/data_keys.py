@@ -0,0 +1,161 @@
+"""
+Per-candidate Data Keys for TalentScout Hiring Assistant
+Envelope encryption: one random key per Session_ID, wrapped by the master keyring, destroyed to erase
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from cryptography.fernet import Fernet
+
+from src.utils.keyring import EncryptionKeyring, get_keyring
+
+DATA_KEY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_keys (
+    session_id TEXT PRIMARY KEY,
+    wrapped_key TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# SQLite's IN (...) parameter budget per query
+_CHUNK = 500
+
+
+class DataKeyStore:
+    """SQLite table of wrapped data keys keyed on Session_ID, with an LRU of unwrapped keys"""
+
+    def __init__(self, db_path: str, keyring: Optional[EncryptionKeyring] = None, cache_size: int = 1024):
+        self.db_path = db_path
+        self._keyring = keyring
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Fernet]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        # Overwrite deleted keys on disk instead of just unlinking their pages
+        self._conn.execute("PRAGMA secure_delete=ON")
+        self._conn.executescript(DATA_KEY_SCHEMA)
+
+    @property
+    def keyring(self) -> EncryptionKeyring:
+        """Master keyring that wraps the data keys"""
+        return self._keyring or get_keyring()
+
+    def get_or_create_many(self, session_ids: Iterable[str]) -> Dict[str, Fernet]:
+        """Data keys for the sessions, generating and storing keys for new ones in one transaction"""
+        session_ids = list(dict.fromkeys(session_ids))
+        keys = self.get_many(session_ids)
+        missing = [sid for sid in session_ids if sid and sid not in keys]
+        if missing:
+            now = time.time()
+            created = {sid: Fernet.generate_key() for sid in missing}
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO data_keys (session_id, wrapped_key, created_at) VALUES (?, ?, ?)",
+                        [(sid, self.keyring.encrypt(key).decode(), now) for sid, key in created.items()],
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            # Re-read so a key another process stored first wins
+            keys.update(self.get_many(missing))
+        return keys
+
+    def get_many(self, session_ids: Iterable[str]) -> Dict[str, Fernet]:
+        """Existing data keys for the sessions (shredded or unknown sessions are absent)"""
+        keys: Dict[str, Fernet] = {}
+        lookup = []
+        with self._lock:
+            for session_id in dict.fromkeys(session_ids):
+                if session_id in self._cache:
+                    self._cache.move_to_end(session_id)
+                    keys[session_id] = self._cache[session_id]
+                elif session_id:
+                    lookup.append(session_id)
+
+            for start in range(0, len(lookup), _CHUNK):
+                chunk = lookup[start:start + _CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT session_id, wrapped_key FROM data_keys WHERE session_id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for session_id, wrapped_key in rows:
+                    fernet = Fernet(self.keyring.decrypt(wrapped_key.encode()))
+                    keys[session_id] = fernet
+                    self._remember(session_id, fernet)
+        return keys
+
+    def shred(self, session_ids: Iterable[str]) -> int:
+        """Destroy the sessions' data keys, making their ciphertexts unreadable everywhere; returns keys destroyed"""
+        session_ids = list(dict.fromkeys(session_ids))
+        destroyed = 0
+        with self._lock:
+            for session_id in session_ids:
+                self._cache.pop(session_id, None)
+            for start in range(0, len(session_ids), _CHUNK):
+                chunk = session_ids[start:start + _CHUNK]
+                cursor = self._conn.execute(
+                    f"DELETE FROM data_keys WHERE session_id IN ({', '.join('?' for _ in chunk)})", chunk
+                )
+                destroyed += cursor.rowcount
+        return destroyed
+
+    def rewrap(self) -> int:
+        """Re-wrap every data key under the master keyring's primary key (after a master key rotation)"""
+        rewrapped = 0
+        with self._lock:
+            rows = self._conn.execute("SELECT session_id, wrapped_key FROM data_keys").fetchall()
+            updates = [
+                (self.keyring.rotate(wrapped.encode()).decode(), session_id)
+                for session_id, wrapped in rows
+                if not self.keyring.is_current(wrapped.encode())
+            ]
+            if updates:
+                self._conn.execute("BEGIN")
+                self._conn.executemany("UPDATE data_keys SET wrapped_key = ? WHERE session_id = ?", updates)
+                self._conn.execute("COMMIT")
+                rewrapped = len(updates)
+        return rewrapped
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()
+
+    def _remember(self, session_id: str, fernet: Fernet):
+        """Cache an unwrapped key, evicting the least recently used"""
+        self._cache[session_id] = fernet
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+# Process-wide key stores, one per database file
+_stores: Dict[str, DataKeyStore] = {}
+_registry_lock = threading.Lock()
+
+
+def get_data_key_store(db_path: str) -> DataKeyStore:
+    """Get the shared data key store for a database file"""
+    key = os.path.abspath(db_path)
+    with _registry_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = DataKeyStore(db_path)
+            _stores[key] = store
+        return store
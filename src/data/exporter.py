@@ -0,0 +1,163 @@
+"""
+Streaming Candidate Export for TalentScout Hiring Assistant
+Pages through a candidate store and yields CSV / NDJSON chunks with bounded memory
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List
+
+from src.config.settings import BLIND_INDEX_COLUMNS, SHEET_HEADERS
+from src.data.projection import NUMERIC_COLUMNS
+from src.data.row_builder import ENCRYPTED_COLUMNS
+from src.utils.gdpr_compliance import GDPRCompliance
+from src.utils.pii_redaction import PiiRedactor
+
+# format -> (mime type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "ndjson": ("application/x-ndjson", ".ndjson"),
+}
+
+DEFAULT_PAGE_SIZE = 1000
+
+# Downloads are spooled in memory up to this size, then to an anonymous temporary file
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+# Blind index hashes are lookup keys, not candidate data - they stay out of exports
+EXPORT_COLUMNS = [name for name in SHEET_HEADERS if name not in BLIND_INDEX_COLUMNS]
+
+# Text columns that can carry PII (structural columns like Timestamp would only produce false matches)
+REDACTED_COLUMNS = [
+    name for name in EXPORT_COLUMNS
+    if name not in NUMERIC_COLUMNS and name not in ("Timestamp", "Session_ID", "Status", "Questions_Answered")
+]
+
+
+def csv_chunks(pages: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """One CSV chunk per page of records, header first"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for records in pages:
+        writer.writerows(records)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+def ndjson_chunks(pages: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """One newline-delimited JSON chunk per page of records"""
+    for records in pages:
+        if records:
+            yield "".join(
+                json.dumps({name: record.get(name, "") for name in EXPORT_COLUMNS}, default=str) + "\n"
+                for record in records
+            )
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def decrypted_pages(pages: Iterable[List[Dict[str, Any]]], gdpr_compliance) -> Iterator[List[Dict[str, Any]]]:
+    """Pages with their encrypted personal data columns decrypted in one batch per column"""
+    for records in pages:
+        yield gdpr_compliance.decrypt_records(records, ENCRYPTED_COLUMNS)
+
+
+def redacted_pages(pages: Iterable[List[Dict[str, Any]]], decrypted: bool = False) -> Iterator[List[Dict[str, Any]]]:
+    """Pages with PII masked in their text columns, using one compiled redactor per page"""
+    for records in pages:
+        # The page's own names (and, once decrypted, contact details) are the known PII for its free text
+        names = [str(record.get("Full_Name", "")) for record in records]
+        known = {"NAME": names + [part for name in names for part in name.split()]}
+        if decrypted:
+            known["EMAIL"] = [record.get("Email", "") for record in records]
+            known["PHONE"] = [record.get("Phone", "") for record in records]
+        redactor = PiiRedactor(known, mask=True)
+        columns = REDACTED_COLUMNS if decrypted else [name for name in REDACTED_COLUMNS if name not in ENCRYPTED_COLUMNS]
+        yield [
+            {**record, **{name: redactor.redact(str(record[name])) for name in columns if record.get(name)}}
+            for record in records
+        ]
+
+
+def stream_export(
+    store, format_type: str = "csv", compress: bool = False, page_size: int = DEFAULT_PAGE_SIZE,
+    decrypt: bool = False, redact: bool = False
+) -> Iterator[bytes]:
+    """Yield the export of every candidate in a store as encoded (optionally gzipped) chunks"""
+    format_type = format_type.lower()
+    if format_type not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {format_type}")
+
+    pages = store.iter_records(page_size=page_size)
+    if decrypt:
+        pages = decrypted_pages(pages, getattr(store, "gdpr_compliance", None) or GDPRCompliance())
+    if redact:
+        pages = redacted_pages(pages, decrypted=decrypt)
+    text_chunks = csv_chunks(pages) if format_type == "csv" else ndjson_chunks(pages)
+    byte_chunks = (chunk.encode("utf-8") for chunk in text_chunks)
+    return gzip_chunks(byte_chunks) if compress else byte_chunks
+
+
+def write_export(
+    store, path: str, format_type: str = "csv", compress: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE, decrypt: bool = False, redact: bool = False
+) -> int:
+    """Stream an export to a file (written atomically); returns the number of bytes written"""
+    return write_chunks(path, stream_export(store, format_type, compress, page_size, decrypt, redact))
+
+
+def write_chunks(path: str, chunks: Iterable[bytes]) -> int:
+    """Write a byte stream to a file atomically; returns the number of bytes written"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return written
+
+
+def read_chunks(chunks: Iterable[bytes], max_memory: int = SPOOL_MAX_MEMORY) -> bytes:
+    """Collect a byte stream for a download without leaving a file behind"""
+    with tempfile.SpooledTemporaryFile(max_size=max_memory) as spool:
+        for chunk in chunks:
+            spool.write(chunk)
+        spool.seek(0)
+        return spool.read()
+
+
+def export_filename(format_type: str = "csv", compress: bool = False) -> str:
+    """Download file name for an export"""
+    extension = EXPORT_FORMATS[format_type.lower()][1]
+    suffix = ".gz" if compress else ""
+    return f"talentscout_candidates_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}{suffix}"
+
+
+def export_mime_type(format_type: str = "csv", compress: bool = False) -> str:
+    """MIME type for an export"""
+    return "application/gzip" if compress else EXPORT_FORMATS[format_type.lower()][0]
@@ -0,0 +1,337 @@
+"""
+Bulk Candidate Import for TalentScout Hiring Assistant
+Loads CSV / JSON application dumps, validates every row column-wise and writes valid rows in batches
+"""
+
+import io
+import json
+import re
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from src.config.settings import SHEET_HEADERS
+from src.data.validator import DataValidator
+from src.data.blind_index import email_blind_index, phone_blind_index
+from src.data.retention import parse_timestamps
+from src.utils.constants import REGEX_PATTERNS
+from src.utils.gdpr_compliance import GDPRCompliance
+
+# Status given to imported applications (they have not been interviewed yet)
+IMPORTED_STATUS = "imported"
+
+# Namespace for Session_IDs derived from an application's keyed email index, so re-imports upsert
+# (Session_IDs in the source are ignored, so a crafted one can never overwrite an interview row)
+IMPORT_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-4f7a-9c1e-5b2d7e9a0c13")
+
+DEFAULT_BATCH_SIZE = 500
+
+# Source column name (normalized to lower_snake_case) -> CandidateInfo field
+COLUMN_ALIASES = {
+    "name": "full_name",
+    "candidate_name": "full_name",
+    "email_address": "email",
+    "phone_number": "phone",
+    "mobile": "phone",
+    "experience": "experience_years",
+    "years_of_experience": "experience_years",
+    "positions": "desired_positions",
+    "desired_position": "desired_positions",
+    "skills": "tech_stack",
+    "dob": "date_of_birth",
+    "cgpa_10": "cgpa_10th",
+    "cgpa_12": "cgpa_12th",
+    "applied_at": "timestamp",
+}
+
+REQUIRED_FIELDS = [
+    "full_name", "email", "phone", "experience_years", "desired_positions", "location",
+    "tech_stack", "gender", "date_of_birth", "graduation_year", "cgpa_10th", "cgpa_12th", "cgpa_degree",
+]
+OPTIONAL_FIELDS = ["work_experience_description", "why_good_candidate", "timestamp"]
+
+# field -> (minimum, maximum, must be a whole number)
+NUMERIC_RANGES = {
+    "experience_years": (0, 50, True),
+    "graduation_year": (1990, 2030, True),
+    "cgpa_10th": (0.0, 10.0, False),
+    "cgpa_12th": (0.0, 10.0, False),
+    "cgpa_degree": (0.0, 10.0, False),
+}
+
+# field -> (minimum, maximum) length of each comma-separated item
+LIST_ITEM_LENGTHS = {
+    "desired_positions": (2, 100),
+    "tech_stack": (2, 50),
+}
+
+_LIST_SEPARATORS = r"[,;|\n]+"
+_GENDER_PATTERN = re.compile(r"^(Male|Female|Transgender)$")
+
+ISO_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Imported application times may run slightly ahead of this server's clock
+MAX_TIMESTAMP_SKEW = pd.Timedelta(days=1)
+
+
+class ImportResult:
+    """Outcome of a bulk import: counts plus a per-row error report"""
+
+    def __init__(self, total: int, imported: int, errors: pd.DataFrame):
+        self.total = total
+        self.imported = imported
+        self.errors = errors
+
+    @property
+    def rejected(self) -> int:
+        """Number of rows that failed validation"""
+        return int(self.errors["row"].nunique()) if len(self.errors) else 0
+
+    def error_report_csv(self) -> str:
+        """Error report as CSV (row, field, message, value)"""
+        return self.errors.to_csv(index=False)
+
+    def __repr__(self) -> str:
+        return f"ImportResult(total={self.total}, imported={self.imported}, rejected={self.rejected})"
+
+
+def normalize_column(name: Any) -> str:
+    """Map a source column header to a CandidateInfo field name"""
+    key = re.sub(r"[^a-z0-9]+", "_", str(name).strip().lower()).strip("_")
+    return COLUMN_ALIASES.get(key, key)
+
+
+def load_applications(source: Union[str, bytes, io.IOBase], format_type: Optional[str] = None) -> pd.DataFrame:
+    """Read a CSV, JSON array or NDJSON dump (path, text, bytes or file object) as an all-text DataFrame"""
+    if isinstance(source, str) and format_type is None:
+        format_type = "json" if source.lower().endswith((".json", ".ndjson", ".jsonl")) else "csv"
+    format_type = (format_type or "csv").lower()
+
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    if format_type == "csv":
+        frame = pd.read_csv(source, dtype=str, keep_default_na=False)
+    elif format_type in ("json", "ndjson", "jsonl"):
+        if isinstance(source, str) and not source.lstrip().startswith(("[", "{")):
+            with open(source, "r", encoding="utf-8") as f:
+                text = f.read()
+        elif isinstance(source, str):
+            text = source
+        else:
+            text = source.read()
+            text = text.decode("utf-8") if isinstance(text, bytes) else text
+        stripped = text.lstrip()
+        records = json.loads(text) if stripped.startswith("[") else [
+            json.loads(line) for line in text.splitlines() if line.strip()
+        ]
+        frame = pd.DataFrame.from_records(records)
+        # Lists (e.g. tech_stack as a JSON array) become comma-separated text like CSV dumps
+        frame = frame.map(lambda v: ", ".join(map(str, v)) if isinstance(v, list) else v)
+        frame = frame.fillna("").astype(str)
+    else:
+        raise ValueError(f"Unsupported import format: {format_type}")
+
+    frame.columns = [normalize_column(column) for column in frame.columns]
+    return frame.loc[:, ~frame.columns.duplicated()]
+
+
+def _text(frame: pd.DataFrame, field: str) -> pd.Series:
+    """A column as stripped text ('' when the column is missing)"""
+    if field not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[field].fillna("").astype(str).str.strip()
+
+
+def _split_items(column: pd.Series) -> pd.Series:
+    """Explode a comma/semicolon/pipe separated column into one stripped item per row (index kept)"""
+    items = column.str.split(_LIST_SEPARATORS, regex=True).explode().str.strip()
+    return items[items.fillna("") != ""]
+
+
+def parse_birth_dates(column: pd.Series) -> pd.Series:
+    """Parse DD/MM/YYYY (any of / - . as separator) or YYYY-MM-DD dates; NaT when invalid"""
+    matches = column.str.match(REGEX_PATTERNS["date"])
+    iso = column.str.match(r"^\d{4}-")
+    day_first = pd.to_datetime(
+        column.where(matches & ~iso).str.replace(r"[\-.]", "/", regex=True), format="%d/%m/%Y", errors="coerce"
+    )
+    year_first = pd.to_datetime(column.where(matches & iso), format="%Y-%m-%d", errors="coerce")
+    return day_first.fillna(year_first)
+
+
+def validate_applications(
+    frame: pd.DataFrame, validator: Optional[DataValidator] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Validate every row column-wise with the DataValidator rules
+
+    Returns (clean, errors): clean holds normalized values of the valid rows (original index kept)
+    and errors has one line per failed check with the 1-based source row.
+    """
+    validator = validator or DataValidator()
+    clean = pd.DataFrame(index=frame.index)
+    problems: List[Tuple[pd.Series, str, str, pd.Series]] = []
+
+    def check(failed: pd.Series, field: str, message: str, values: pd.Series):
+        problems.append((failed.fillna(True).astype(bool), field, message, values))
+
+    # Required text fields
+    text = {field: _text(frame, field) for field in REQUIRED_FIELDS + OPTIONAL_FIELDS}
+    for field in REQUIRED_FIELDS:
+        check(text[field] == "", field, "is required", text[field])
+
+    name = text["full_name"]
+    check((name != "") & ~name.str.match(validator.name_pattern), "full_name",
+          "can only contain letters, spaces, hyphens, dots, and apostrophes (2-100 characters)", name)
+    check((name != "") & (name.str.split().str.len() < 2), "full_name",
+          "must include first and last name", name)
+    clean["full_name"] = name.str.title()
+
+    email = text["email"].str.lower()
+    check((email != "") & ~email.str.match(validator.email_pattern), "email",
+          "is not a valid email address", text["email"])
+    clean["email"] = email
+
+    phone_digits = text["phone"].str.replace(r"\D", "", regex=True)
+    digit_count = phone_digits.str.len()
+    check((text["phone"] != "") & ((digit_count < 10) | (digit_count > 15)), "phone",
+          "must have 10-15 digits", text["phone"])
+    clean["phone"] = phone_digits
+
+    location = text["location"]
+    check((location != "") & ((location.str.len() < 2) | (location.str.len() > 100)), "location",
+          "must be 2-100 characters", location)
+    clean["location"] = location
+
+    gender = text["gender"].str.title()
+    check((gender != "") & ~gender.str.match(_GENDER_PATTERN), "gender",
+          "must be Male, Female or Transgender", text["gender"])
+    clean["gender"] = gender
+
+    dob = text["date_of_birth"]
+    birth_dates = parse_birth_dates(dob)
+    check((dob != "") & birth_dates.isna(), "date_of_birth", "must be a date such as DD/MM/YYYY", dob)
+    check(birth_dates.notna() & (birth_dates > pd.Timestamp.now()), "date_of_birth",
+          "must not be in the future", dob)
+    clean["date_of_birth"] = dob
+
+    timestamp = text["timestamp"]
+    applied_at = parse_timestamps(timestamp.to_numpy()).set_axis(frame.index)
+    check((timestamp != "") & applied_at.isna(), "timestamp", "must be a date/time such as 2025-03-04T10:00:00", timestamp)
+    check(applied_at.notna() & (applied_at > pd.Timestamp.now(tz="UTC") + MAX_TIMESTAMP_SKEW), "timestamp",
+          "must not be in the future", timestamp)
+    # Stored as ISO text like CandidateRowBuilder writes, so month shards and timestamp range reads see it
+    clean["timestamp"] = applied_at.dt.tz_convert(None).dt.strftime(ISO_TIMESTAMP_FORMAT).fillna("")
+
+    for field, (low, high, whole) in NUMERIC_RANGES.items():
+        raw = text[field]
+        values = pd.to_numeric(raw, errors="coerce")
+        present = raw != ""
+        check(present & values.isna(), field, "must be a number", raw)
+        check(present & values.notna() & ((values < low) | (values > high)), field,
+              f"must be between {low} and {high}", raw)
+        if whole:
+            check(present & values.notna() & (values % 1 != 0), field, "must be a whole number", raw)
+        clean[field] = values
+
+    for field, (low, high) in LIST_ITEM_LENGTHS.items():
+        items = _split_items(text[field])
+        lengths = items.str.len()
+        bad_items = items[(lengths < low) | (lengths > high)]
+        bad_rows = pd.Series(frame.index.isin(bad_items.index), index=frame.index)
+        check(bad_rows, field, f"each entry must be {low}-{high} characters", text[field])
+        clean[field] = items.str.title().groupby(level=0).agg(", ".join).reindex(frame.index, fill_value="")
+
+    for field in ("work_experience_description", "why_good_candidate"):
+        clean[field] = text[field]
+
+    errors = pd.concat(
+        [
+            pd.DataFrame({
+                "row": failed.index[failed.to_numpy()] + 1,
+                "field": field,
+                "message": message,
+                "value": values[failed].to_numpy(),
+            })
+            for failed, field, message, values in problems if failed.any()
+        ] or [pd.DataFrame(columns=["row", "field", "message", "value"])],
+        ignore_index=True,
+    )
+    if len(errors):
+        errors = errors.sort_values(["row"], kind="stable").reset_index(drop=True)
+        clean = clean[~(clean.index + 1).isin(errors["row"])]
+    return clean, errors
+
+
+def build_import_rows(
+    clean: pd.DataFrame, gdpr_compliance: GDPRCompliance, blind_index_key: Optional[str] = None
+) -> List[List[Any]]:
+    """Storage rows (SHEET_HEADERS order) for validated applications"""
+    now = datetime.now().isoformat()
+    email_indexes = [email_blind_index(v, blind_index_key) if blind_index_key else "" for v in clean["email"]]
+    # Keyed, so a Session_ID cannot be recomputed from an email list; without a key re-imports cannot upsert
+    session_ids = [
+        f"import-{uuid.uuid5(IMPORT_NAMESPACE, email_index) if email_index else uuid.uuid4()}"
+        for email_index in email_indexes
+    ]
+
+    def encrypt(values) -> List[str]:
+        # Per-candidate data keys when envelope encryption is enabled, the master keyring otherwise
+        return gdpr_compliance.encrypt_for_sessions(session_ids, values)
+
+    def number(value: float, whole: bool) -> Any:
+        return int(value) if whole else float(value)
+
+    columns = {
+        "Timestamp": [ts or now for ts in clean["timestamp"]],
+        "Session_ID": session_ids,
+        "Full_Name": clean["full_name"].tolist(),
+        "Email": encrypt(clean["email"]),
+        "Phone": encrypt(clean["phone"]),
+        "Gender": clean["gender"].tolist(),
+        "Date_of_Birth": encrypt(clean["date_of_birth"]),
+        "Experience_Years": [number(v, True) for v in clean["experience_years"]],
+        "Desired_Positions": clean["desired_positions"].tolist(),
+        "Location": clean["location"].tolist(),
+        "Graduation_Year": [number(v, True) for v in clean["graduation_year"]],
+        "CGPA_10th": [number(v, False) for v in clean["cgpa_10th"]],
+        "CGPA_12th": [number(v, False) for v in clean["cgpa_12th"]],
+        "CGPA_Degree": [number(v, False) for v in clean["cgpa_degree"]],
+        "Tech_Stack": clean["tech_stack"].tolist(),
+        "Work_Experience_Description": clean["work_experience_description"].tolist(),
+        "Why_Good_Candidate": clean["why_good_candidate"].tolist(),
+        "Technical_Questions": [""] * len(clean),
+        "Candidate_Responses": [""] * len(clean),
+        "Sentiment_Score": [0.0] * len(clean),
+        "Questions_Answered": ["0/0"] * len(clean),
+        "Status": [IMPORTED_STATUS] * len(clean),
+        "Email_Index": email_indexes,
+        "Phone_Index": [phone_blind_index(v, blind_index_key) if blind_index_key else "" for v in clean["phone"]],
+    }
+    return [list(row) for row in zip(*(columns[name] for name in SHEET_HEADERS))]
+
+
+def import_applications(
+    store,
+    source: Union[str, bytes, io.IOBase, pd.DataFrame],
+    format_type: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    validator: Optional[DataValidator] = None,
+) -> ImportResult:
+    """Validate an application dump and write its valid rows to the store in batches"""
+    frame = source if isinstance(source, pd.DataFrame) else load_applications(source, format_type)
+    frame = frame.reset_index(drop=True)
+    frame.columns = [normalize_column(column) for column in frame.columns]
+
+    clean, errors = validate_applications(frame, validator)
+    gdpr_compliance = getattr(store, "gdpr_compliance", None) or GDPRCompliance()
+    rows = build_import_rows(clean, gdpr_compliance, getattr(store, "blind_index_key", None))
+
+    imported = 0
+    for start in range(0, len(rows), batch_size):
+        imported += store.insert_rows(rows[start:start + batch_size])
+
+    print(f"📥 Imported {imported}/{len(frame)} applications ({len(errors)} validation errors)")
+    return ImportResult(total=len(frame), imported=imported, errors=errors)
@@ -0,0 +1,278 @@
+"""
+Durable Local Outbox for TalentScout Hiring Assistant
+Every candidate row lands in SQLite first and is replayed to Google Sheets
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    session_id TEXT PRIMARY KEY,
+    row_json TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    content_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+class CandidateOutbox:
+    """SQLite (WAL-mode) outbox keyed on Session_ID"""
+
+    def __init__(self, db_path: str, max_backoff: float = 300.0):
+        self.db_path = db_path
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(OUTBOX_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "content_hash" not in columns:
+            # Outboxes created before rows carried a content hash
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN content_hash TEXT")
+
+    def add(self, session_id: str, row: List[Any], content_hash: Optional[str] = None) -> bool:
+        """Durably record a row; returns False if there is nothing new to deliver
+
+        Without a content hash a delivered session is never queued again. With one, a
+        changed row is re-queued for delivery and an unchanged row is ignored.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO outbox (session_id, row_json, status, created_at, updated_at, content_hash)
+                VALUES (?, ?, 'pending', ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    row_json = excluded.row_json,
+                    status = 'pending',
+                    attempts = 0,
+                    last_error = NULL,
+                    next_attempt_at = 0,
+                    updated_at = excluded.updated_at,
+                    content_hash = excluded.content_hash
+                WHERE (excluded.content_hash IS NULL AND outbox.status != 'sent')
+                   OR excluded.content_hash IS NOT outbox.content_hash
+                """,
+                (session_id, json.dumps(row, default=str), now, now, content_hash),
+            )
+            return cursor.rowcount > 0
+
+    def due(self, limit: int = 100, exclude: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, List[Any]]]:
+        """Pending rows whose retry delay has elapsed, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT session_id, row_json FROM outbox
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                ORDER BY created_at
+                LIMIT ?
+                """,
+                (time.time(), limit),
+            ).fetchall()
+
+        items = []
+        for session_id, row_json in rows:
+            if exclude and exclude(session_id):
+                continue
+            items.append((session_id, json.loads(row_json)))
+        return items
+
+    def mark_sent(self, session_ids: Iterable[str]):
+        """Record successful delivery"""
+        ids = list(session_ids)
+        if not ids:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET status = 'sent', last_error = NULL, updated_at = ? WHERE session_id = ?",
+                [(now, session_id) for session_id in ids],
+            )
+
+    def mark_failed(self, session_ids: Iterable[str], error: str):
+        """Record a failed attempt and schedule the next retry with exponential backoff"""
+        ids = list(session_ids)
+        if not ids:
+            return
+        now = time.time()
+        with self._lock:
+            for session_id in ids:
+                row = self._conn.execute(
+                    "SELECT attempts FROM outbox WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                attempts = (row[0] if row else 0) + 1
+                delay = min(self.max_backoff, 2 ** attempts)
+                self._conn.execute(
+                    """
+                    UPDATE outbox SET attempts = ?, last_error = ?, next_attempt_at = ?, updated_at = ?
+                    WHERE session_id = ? AND status != 'sent'
+                    """,
+                    (attempts, error[:500], now + delay, now, session_id),
+                )
+
+    def is_sent(self, session_id: str) -> bool:
+        """Check whether a session has already been delivered"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM outbox WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return bool(row) and row[0] == 'sent'
+
+    def find_rows(self, position: int, value: str) -> List[Tuple[str, List[Any], str]]:
+        """(session_id, row, status) of every row whose value at a SHEET_HEADERS position matches"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT session_id, row_json, status FROM outbox WHERE json_extract(row_json, ?) = ?",
+                (f"$[{int(position)}]", value),
+            ).fetchall()
+        return [(session_id, json.loads(row_json), status) for session_id, row_json, status in rows]
+
+    def pending_count(self) -> int:
+        """Number of rows still waiting for delivery"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status = 'pending'"
+            ).fetchone()[0]
+
+    def remove(self, session_ids: Iterable[str]) -> int:
+        """Delete sessions' rows whatever their status (erased candidates must never be replayed)"""
+        session_ids = list(session_ids)
+        if not session_ids:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM outbox WHERE session_id IN ({', '.join('?' for _ in session_ids)})", session_ids
+            )
+            return cursor.rowcount
+
+    def purge_sent(self, older_than: float = 7 * 24 * 3600) -> int:
+        """Remove delivered rows older than the given age in seconds"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM outbox WHERE status = 'sent' AND updated_at < ?",
+                (time.time() - older_than,),
+            )
+            return cursor.rowcount
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class OutboxReplayer:
+    """Background thread that drains pending outbox rows to the sheet"""
+
+    def __init__(
+        self,
+        outbox: CandidateOutbox,
+        deliver_fn: Callable[[List[Tuple[str, List[Any]]]], None],
+        existing_ids_fn: Optional[Callable[[], Set[str]]] = None,
+        in_flight_fn: Optional[Callable[[str], bool]] = None,
+        interval: float = 30.0,
+        batch_size: int = 100,
+        purge_interval: float = 3600.0,
+        sent_retention: float = 7 * 24 * 3600,
+    ):
+        self.outbox = outbox
+        self.deliver_fn = deliver_fn
+        self.existing_ids_fn = existing_ids_fn
+        self.in_flight_fn = in_flight_fn
+        self.interval = interval
+        self.batch_size = batch_size
+        # Delivered rows still hold personal data, so they are only kept for a short grace period
+        self.purge_interval = purge_interval
+        self.sent_retention = sent_retention
+        self._last_purge = 0.0
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="outbox-replayer", daemon=True)
+        self._thread.start()
+
+    def replay_once(self) -> int:
+        """Deliver one batch of due rows; returns how many were handed over"""
+        items = self.outbox.due(self.batch_size, exclude=self.in_flight_fn)
+        if not items:
+            return 0
+
+        try:
+            # Exactly-once: rows that reached the sheet before a crash are only marked sent
+            # (destinations that upsert on Session_ID pass no existing_ids_fn and take every row)
+            existing = self.existing_ids_fn() if self.existing_ids_fn else set()
+            already_sent = [session_id for session_id, _ in items if session_id in existing]
+            self.outbox.mark_sent(already_sent)
+
+            to_deliver = [(session_id, row) for session_id, row in items if session_id not in existing]
+            if to_deliver:
+                self.deliver_fn(to_deliver)
+            return len(to_deliver)
+        except Exception as e:
+            print(f"⚠️ Outbox replay failed, will retry: {str(e)}")
+            self.outbox.mark_failed([session_id for session_id, _ in items], str(e))
+            return 0
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the replay thread"""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def purge_once(self) -> int:
+        """Delete delivered rows past the grace period; returns how many were removed"""
+        self._last_purge = time.monotonic()
+        try:
+            return self.outbox.purge_sent(self.sent_retention)
+        except Exception as e:
+            print(f"⚠️ Outbox purge failed, will retry: {str(e)}")
+            return 0
+
+    def _run(self):
+        """Replay loop (delivered rows are purged every purge_interval)"""
+        while not self._stop.wait(self.interval):
+            while self.replay_once() >= self.batch_size and not self._stop.is_set():
+                pass
+            if time.monotonic() - self._last_purge >= self.purge_interval:
+                self.purge_once()
+
+
+# Process-wide outboxes and replayers
+_outboxes: Dict[str, CandidateOutbox] = {}
+_replayers: Dict[str, OutboxReplayer] = {}
+_registry_lock = threading.Lock()
+
+
+def get_outbox(db_path: str) -> CandidateOutbox:
+    """Get the shared outbox for a database file"""
+    key = os.path.abspath(db_path)
+    with _registry_lock:
+        outbox = _outboxes.get(key)
+        if outbox is None:
+            outbox = CandidateOutbox(db_path)
+            _outboxes[key] = outbox
+        return outbox
+
+
+def start_replayer(key: str, outbox: CandidateOutbox, **kwargs) -> OutboxReplayer:
+    """Start the replayer for a destination once per process"""
+    with _registry_lock:
+        replayer = _replayers.get(key)
+        if replayer is None:
+            replayer = OutboxReplayer(outbox, **kwargs)
+            _replayers[key] = replayer
+        return replayer
@@ -0,0 +1,88 @@
+"""
+Column Projection Helpers for TalentScout Hiring Assistant
+Typed columnar arrays for candidate data and statistics computed on them
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+from gspread.utils import rowcol_to_a1
+
+from src.config.settings import SHEET_HEADERS
+
+# Columns stored as float64 (NaN marks an empty or unparseable cell)
+NUMERIC_COLUMNS = {
+    "Experience_Years", "Graduation_Year", "CGPA_10th", "CGPA_12th",
+    "CGPA_Degree", "Sentiment_Score",
+}
+
+# Columns get_statistics needs
+STATISTICS_COLUMNS = ["Status", "Experience_Years", "Tech_Stack"]
+
+
+def column_letter(name: str) -> str:
+    """A1 column letter for a header in SHEET_HEADERS"""
+    if name not in SHEET_HEADERS:
+        raise KeyError(f"Unknown column: {name}")
+    return rowcol_to_a1(1, SHEET_HEADERS.index(name) + 1).rstrip("0123456789")
+
+
+def column_range(name: str, first_row: int = 2, last_row: Optional[int] = None) -> str:
+    """A1 range covering one column's data cells"""
+    letter = column_letter(name)
+    return f"{letter}{first_row}:{letter}{last_row if last_row else ''}"
+
+
+def to_float(value: Any) -> float:
+    """Parse a cell as float, NaN when it is empty or not numeric"""
+    if value is None or value == "":
+        return np.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def to_typed_column(name: str, values: Iterable[Any], length: int) -> np.ndarray:
+    """Convert raw cell values to a typed array padded to the given length"""
+    values = list(values)[:length]
+    values += [""] * (length - len(values))
+    if name in NUMERIC_COLUMNS:
+        return np.fromiter((to_float(v) for v in values), dtype=np.float64, count=length)
+    column = np.empty(length, dtype=object)
+    column[:] = ["" if v is None else str(v) for v in values]
+    return column
+
+
+def compute_statistics(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Candidate statistics from projected Status, Experience_Years and Tech_Stack columns"""
+    total = len(columns["Status"])
+    if total == 0:
+        return {
+            "total_candidates": 0,
+            "completed_interviews": 0,
+            "average_experience": 0,
+            "top_tech_stacks": []
+        }
+
+    completed = int(np.count_nonzero(columns["Status"] == "completed"))
+
+    experience = columns["Experience_Years"]
+    experience = experience[~np.isnan(experience)]
+    avg_exp = float(experience.mean()) if experience.size else 0
+
+    tech_counts = Counter(
+        tech.strip()
+        for tech_stack in columns["Tech_Stack"] if tech_stack
+        for tech in tech_stack.split(",") if tech.strip()
+    )
+    top_techs = sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+
+    return {
+        "total_candidates": total,
+        "completed_interviews": completed,
+        "completion_rate": (completed / total * 100) if total > 0 else 0,
+        "average_experience": round(avg_exp, 1),
+        "top_tech_stacks": top_techs
+    }
@@ -0,0 +1,262 @@
+"""
+Quota-aware Google API Scheduler for TalentScout Hiring Assistant
+Token buckets for read and write quotas, priority classes and adaptive backoff on 429
+"""
+
+import contextvars
+import functools
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import gspread
+
+
+class Priority(IntEnum):
+    """API call priority classes (lower runs first)"""
+    INTERACTIVE = 0     # candidate saves
+    STATUS_UPDATE = 1   # admin status updates and deletes
+    ANALYTICS = 2       # dashboard reads and statistics
+    EXPORT = 3          # bulk exports
+
+
+_current_priority: contextvars.ContextVar = contextvars.ContextVar(
+    "sheets_api_priority", default=Priority.ANALYTICS
+)
+
+
+def current_priority() -> Priority:
+    """Priority class of API calls made in the current context"""
+    return _current_priority.get()
+
+
+@contextmanager
+def api_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed API calls at the given priority"""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def with_priority(priority: Priority) -> Callable:
+    """Decorator form of api_priority"""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with api_priority(priority):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Whether an error is a 429 rate-limit response"""
+    return isinstance(error, gspread.exceptions.APIError) and error.code == 429
+
+
+class TokenBucket:
+    """Refilling token bucket sized so no rolling minute exceeds the quota (None means unlimited)"""
+
+    def __init__(self, quota_per_minute: Optional[int], burst: int = 10):
+        self.quota_per_minute = quota_per_minute
+        if quota_per_minute:
+            # Burst plus one minute of refill equals the quota
+            self.capacity = max(1, min(burst, quota_per_minute // 2))
+            self.rate = (quota_per_minute - self.capacity) / 60.0
+        else:
+            self.capacity = 0
+            self.rate = 0.0
+        self.tokens = float(self.capacity)
+        self.paused_until = 0.0
+        self._updated: Optional[float] = None
+
+    def take(self, now: float) -> float:
+        """Take a token if one is available; otherwise return the seconds until one will be"""
+        if now < self.paused_until:
+            return self.paused_until - now
+        if not self.quota_per_minute:
+            return 0.0
+
+        if self._updated is not None and now > self._updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now if self._updated is None else max(self._updated, now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def pause(self, now: float, seconds: float):
+        """Stop handing out tokens for a while and drain the burst (after a 429)"""
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self._updated = self.paused_until
+
+
+class QuotaScheduler:
+    """Admits API calls by priority within read and write quotas, backing off when Google returns 429"""
+
+    def __init__(
+        self,
+        read_quota_per_minute: Optional[int] = 60,
+        write_quota_per_minute: Optional[int] = 60,
+        burst: int = 10,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 64.0,
+        seed: Optional[int] = None,
+    ):
+        self.buckets = {
+            "read": TokenBucket(read_quota_per_minute, burst),
+            "write": TokenBucket(write_quota_per_minute, burst),
+        }
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._waiters: Dict[str, List[Tuple[int, int]]] = {kind: [] for kind in self.buckets}
+        self._backoff = {kind: 0.0 for kind in self.buckets}
+        self._throttled = {kind: 0 for kind in self.buckets}
+        self._waits = {
+            priority: {"calls": 0, "total_wait": 0.0, "max_wait": 0.0} for priority in Priority
+        }
+        self._sequence = itertools.count()
+        self._random = random.Random(seed)
+        self._cond = threading.Condition()
+
+    def call(self, kind: str, fn: Callable, *args, **kwargs) -> Any:
+        """Run one API call once the quota admits it, retrying with backoff on 429"""
+        priority = current_priority()
+        for attempt in range(self.max_retries + 1):
+            self._acquire(kind, priority)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_quota_error(e) or attempt == self.max_retries:
+                    raise
+                self._on_throttled(kind)
+                continue
+            self._on_success(kind)
+            return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue wait times per priority class plus throttling state per quota"""
+        with self._cond:
+            waits = {}
+            for priority, stats in self._waits.items():
+                calls = stats["calls"]
+                waits[priority.name.lower()] = {
+                    "calls": calls,
+                    "avg_wait": stats["total_wait"] / calls if calls else 0.0,
+                    "max_wait": stats["max_wait"],
+                    "total_wait": stats["total_wait"],
+                }
+            return {
+                "wait_times": waits,
+                "queued": {kind: len(waiters) for kind, waiters in self._waiters.items()},
+                "throttled": dict(self._throttled),
+                "backoff": dict(self._backoff),
+            }
+
+    def _acquire(self, kind: str, priority: Priority):
+        """Block until this call is the highest-priority waiter and a token is free"""
+        bucket = self.buckets[kind]
+        waiters = self._waiters[kind]
+        ticket = (int(priority), next(self._sequence))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(waiters, ticket)
+            try:
+                while True:
+                    delay = None
+                    if waiters[0] == ticket:
+                        delay = bucket.take(time.monotonic())
+                        if delay <= 0:
+                            break
+                    self._cond.wait(delay)
+            finally:
+                waiters.remove(ticket)
+                heapq.heapify(waiters)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            stats = self._waits[priority]
+            stats["calls"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def _on_throttled(self, kind: str):
+        """Double the backoff (with jitter) and pause the quota's bucket"""
+        with self._cond:
+            backoff = min(self.max_backoff, max(self.base_backoff, self._backoff[kind] * 2))
+            self._backoff[kind] = backoff
+            self._throttled[kind] += 1
+            delay = backoff + self._random.uniform(0, backoff / 4)
+            self.buckets[kind].pause(time.monotonic(), delay)
+            self._cond.notify_all()
+        print(f"⚠️ Google Sheets {kind} quota exceeded, backing off {delay:.1f}s")
+
+    def _on_success(self, kind: str):
+        """Reset the backoff once calls go through again"""
+        if self._backoff[kind]:
+            with self._cond:
+                self._backoff[kind] = 0.0
+
+
+# gspread calls that cost a read or a write request
+READ_CALLS = {
+    "open_by_key", "open", "open_by_url", "worksheets", "worksheet", "sheet1", "fetch_sheet_metadata",
+    "row_values", "col_values", "cell", "get_all_values", "get_all_records", "get", "batch_get",
+}
+WRITE_CALLS = {
+    "append_row", "append_rows", "update_cell", "update", "batch_update", "delete_rows",
+    "clear", "add_worksheet",
+}
+
+# Calls and attributes whose results are themselves spreadsheets or worksheets
+_WRAPPED_RESULTS = {
+    "open_by_key", "open", "open_by_url", "worksheets", "worksheet", "sheet1", "add_worksheet", "spreadsheet",
+}
+
+
+class ScheduledProxy:
+    """Wraps a gspread client, spreadsheet or worksheet so its API calls go through a QuotaScheduler"""
+
+    def __init__(self, target: Any, scheduler: QuotaScheduler):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_scheduler", scheduler)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "sheet1":
+            # A property that fetches spreadsheet metadata
+            return self._wrap(name, self._scheduler.call("read", getattr, self._target, name))
+
+        value = getattr(self._target, name)
+        if name in READ_CALLS or name in WRITE_CALLS:
+            kind = "read" if name in READ_CALLS else "write"
+
+            @functools.wraps(value)
+            def scheduled(*args, **kwargs):
+                return self._wrap(name, self._scheduler.call(kind, value, *args, **kwargs))
+            return scheduled
+        return self._wrap(name, value)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._target, name, value)
+
+    def __repr__(self) -> str:
+        return f"ScheduledProxy({self._target!r})"
+
+    def _wrap(self, name: str, value: Any) -> Any:
+        """Proxy spreadsheets and worksheets returned by the wrapped object"""
+        if name not in _WRAPPED_RESULTS or value is None:
+            return value
+        if isinstance(value, list):
+            return [ScheduledProxy(item, self._scheduler) for item in value]
+        return ScheduledProxy(value, self._scheduler)
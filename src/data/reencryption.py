@@ -0,0 +1,107 @@
+"""
+Re-encryption Job for TalentScout Hiring Assistant
+Resumable bulk rewrite of encrypted candidate fields under the keyring's primary key
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from src.config.settings import SHEET_HEADERS
+from src.data.candidate_store import CandidateStore
+from src.data.row_builder import ENCRYPTED_COLUMNS
+from src.utils.gdpr_compliance import GDPRCompliance
+from src.utils.keyring import EncryptionKeyring, get_keyring
+
+DEFAULT_CHECKPOINT_PATH = os.path.join("backups", "reencryption_checkpoint.json")
+
+
+class ReencryptionJob:
+    """Rotates old ciphertexts page by page, checkpointing so an interrupted run picks up where it stopped"""
+
+    def __init__(
+        self,
+        store: CandidateStore,
+        keyring: Optional[EncryptionKeyring] = None,
+        checkpoint_path: str = DEFAULT_CHECKPOINT_PATH,
+        page_size: int = 500,
+    ):
+        self.store = store
+        self.keyring = keyring or get_keyring()
+        self.gdpr_compliance = GDPRCompliance(self.keyring)
+        self.checkpoint_path = checkpoint_path
+        self.page_size = page_size
+
+    def run(self, max_pages: Optional[int] = None) -> Dict[str, Any]:
+        """Re-encrypt every stale field (stopping after max_pages new pages); returns the running totals"""
+        checkpoint = self._load_checkpoint()
+        # Resume after the last rewritten Session_ID: finished pages are never read again, and rows
+        # inserted or deleted between runs cannot shift the cursor
+        pages = self.store.iter_records(page_size=self.page_size, after=checkpoint["last_session_id"])
+        pages_this_run = 0
+
+        while max_pages is None or pages_this_run < max_pages:
+            records = next(pages, None)
+            if records is None:
+                checkpoint["completed"] = True
+                self._save_checkpoint(checkpoint)
+                print(f"🔑 Re-encryption to key {self.keyring.primary_version} complete: "
+                      f"{checkpoint['rotated']} of {checkpoint['scanned']} rows rewritten")
+                break
+
+            rows = self._rotate_page(records)
+            if rows:
+                self.store.insert_rows(rows)
+
+            checkpoint["pages_done"] += 1
+            checkpoint["scanned"] += len(records)
+            checkpoint["rotated"] += len(rows)
+            if records:
+                checkpoint["last_session_id"] = records[-1].get("Session_ID") or checkpoint["last_session_id"]
+            self._save_checkpoint(checkpoint)
+            pages_this_run += 1
+
+        return checkpoint
+
+    def _rotate_page(self, records: List[Dict[str, Any]]) -> List[List[Any]]:
+        """Rows of the page with at least one field re-encrypted (unchanged rows are not rewritten)"""
+        rows = []
+        for record in records:
+            changed = False
+            for column in ENCRYPTED_COLUMNS:
+                value = str(record.get(column, ""))
+                if self.gdpr_compliance.needs_rotation(value):
+                    record[column] = self.gdpr_compliance.rotate_sensitive_data(value)
+                    changed = changed or record[column] != value
+            if changed:
+                rows.append([record.get(name, "") for name in SHEET_HEADERS])
+        return rows
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """Progress of an earlier run towards the same primary key (a new key starts over)"""
+        fresh = {
+            "primary_version": self.keyring.primary_version,
+            "pages_done": 0,
+            "last_session_id": None,
+            "scanned": 0,
+            "rotated": 0,
+            "completed": False,
+        }
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return fresh
+        if checkpoint.get("primary_version") != fresh["primary_version"] or checkpoint.get("completed"):
+            return fresh
+        return {**fresh, **checkpoint}
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Atomically persist progress after each page"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
@@ -0,0 +1,185 @@
+"""
+Data Retention Sweeper for TalentScout Hiring Assistant
+Finds candidates past the retention period from two projected columns and deletes them in batches
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils.gdpr_compliance import GDPRCompliance, RETENTION_DAYS
+
+DEFAULT_CHECKPOINT_PATH = os.path.join("backups", "retention_checkpoint.json")
+
+# Audit user for deletions made by the sweeper rather than a person
+SWEEPER_USER = "retention-sweeper"
+
+
+def parse_timestamps(values: np.ndarray) -> pd.Series:
+    """Parse a Timestamp column as UTC (ISO strings in one vectorized pass, anything else as a fallback)"""
+    series = pd.Series(values, dtype=object).fillna("").astype(str).str.strip()
+    parsed = pd.to_datetime(series, format="ISO8601", errors="coerce", utc=True)
+    unparsed = parsed.isna() & (series != "")
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(
+            series[unparsed], format="mixed", dayfirst=True, errors="coerce", utc=True
+        )
+    return parsed
+
+
+def expired_session_ids(columns: Dict[str, np.ndarray], cutoff: datetime) -> List[str]:
+    """Session_IDs whose Timestamp is older than the cutoff (blank or unreadable timestamps never expire)"""
+    timestamps = parse_timestamps(columns["Timestamp"])
+    cutoff = pd.Timestamp(cutoff)
+    cutoff = cutoff.tz_localize("UTC") if cutoff.tzinfo is None else cutoff.tz_convert("UTC")
+    expired = (timestamps < cutoff).to_numpy(dtype=bool)
+    session_ids = np.asarray(columns["Session_ID"], dtype=object)
+    return [session_id for session_id in session_ids[expired] if session_id]
+
+
+class RetentionSweeper:
+    """Deletes expired candidates in batches, checkpointing the plan so an interrupted sweep resumes"""
+
+    def __init__(
+        self,
+        store,
+        retention_days: int = RETENTION_DAYS,
+        batch_size: int = 200,
+        checkpoint_path: str = DEFAULT_CHECKPOINT_PATH,
+        gdpr_compliance: Optional[GDPRCompliance] = None,
+        clock: Callable[[], datetime] = datetime.now,
+        full_scan_interval_days: int = 30,
+    ):
+        self.store = store
+        self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self.checkpoint_path = checkpoint_path
+        self.gdpr_compliance = gdpr_compliance or getattr(store, "gdpr_compliance", None) or GDPRCompliance()
+        self.clock = clock
+        # Rows the incremental window cannot see (unreadable or non-ISO timestamps) are caught by this full scan
+        self.full_scan_interval = timedelta(days=full_scan_interval_days)
+
+    def run(self) -> Dict[str, Any]:
+        """Delete every expired candidate; returns the sweep's checkpoint"""
+        checkpoint = self._load_checkpoint()
+        if not checkpoint.get("pending"):
+            # Nothing left over from an interrupted sweep - plan a new one
+            now = self.clock()
+            cutoff = now - timedelta(days=self.retention_days)
+            since = self._scan_since(checkpoint, now)
+            if since is None:
+                columns = self.store.get_columns(["Session_ID", "Timestamp"])
+                full_scan_at = now.isoformat()
+            else:
+                # Everything older than the last completed cutoff is already gone - read only the new window
+                columns = self.store.get_columns_between("Timestamp", since, cutoff, ["Session_ID", "Timestamp"])
+                full_scan_at = checkpoint["full_scan_at"]
+            checkpoint = {
+                "cutoff": cutoff.isoformat(),
+                "since": since.isoformat() if since else None,
+                "pending": expired_session_ids(columns, cutoff),
+                "scanned": len(columns["Session_ID"]),
+                "deleted": 0,
+                "started_at": now.isoformat(),
+                "completed_at": None,
+                "full_scan_at": full_scan_at,
+            }
+            self._save_checkpoint(checkpoint)
+
+        while checkpoint["pending"]:
+            batch = checkpoint["pending"][:self.batch_size]
+            deleted = self.store.delete_many(batch)
+            self.gdpr_compliance.log_data_access(
+                "retention_delete", "candidate_info", SWEEPER_USER,
+                details={"cutoff": checkpoint["cutoff"], "session_ids": batch, "deleted": deleted},
+            )
+            # Rows another process already removed count as done; a failed batch stops the sweep for a retry
+            if deleted == 0 and self.store.get_candidate_data(batch[0]) is not None:
+                print(f"⚠️ Retention sweep stopped: failed to delete {len(batch)} expired row(s)")
+                return checkpoint
+            checkpoint["pending"] = checkpoint["pending"][len(batch):]
+            checkpoint["deleted"] += deleted
+            self._save_checkpoint(checkpoint)
+
+        checkpoint["completed_at"] = self.clock().isoformat()
+        self._save_checkpoint(checkpoint)
+        if checkpoint["deleted"]:
+            print(f"🗑️ Retention sweep deleted {checkpoint['deleted']} candidate(s) older than {checkpoint['cutoff']}")
+        return checkpoint
+
+    def _scan_since(self, checkpoint: Dict[str, Any], now: datetime) -> Optional[datetime]:
+        """High-water mark for an incremental scan (the last completed cutoff), None for a full scan"""
+        if not hasattr(self.store, "get_columns_between") or not checkpoint.get("completed_at"):
+            return None
+        try:
+            since = datetime.fromisoformat(checkpoint["cutoff"])
+            full_scan_at = datetime.fromisoformat(checkpoint["full_scan_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return since if now - full_scan_at < self.full_scan_interval else None
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """The last sweep's checkpoint ({} before the first sweep)"""
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Atomically persist sweep progress after each batch"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+
+class RetentionScheduler:
+    """Background thread that runs the sweeper at a fixed interval"""
+
+    def __init__(self, sweeper: RetentionSweeper, interval: float = 86400.0, initial_delay: float = 60.0):
+        self.sweeper = sweeper
+        self.interval = interval
+        self.initial_delay = initial_delay
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="retention-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the sweep thread"""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Sweep loop"""
+        delay = self.initial_delay
+        while not self._stop.wait(delay):
+            try:
+                self.sweeper.run()
+            except Exception as e:
+                print(f"⚠️ Retention sweep failed, will retry: {str(e)}")
+            delay = self.interval
+
+
+# Process-wide schedulers, one per candidate store
+_schedulers: Dict[str, RetentionScheduler] = {}
+_registry_lock = threading.Lock()
+
+
+def start_retention_sweeper(key: str, store, interval: float = 86400.0, **kwargs) -> RetentionScheduler:
+    """Start the retention sweeper for a store once per process"""
+    with _registry_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            scheduler = RetentionScheduler(RetentionSweeper(store, **kwargs), interval=interval)
+            _schedulers[key] = scheduler
+        return scheduler
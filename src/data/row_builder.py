@@ -0,0 +1,203 @@
+"""
+Candidate Row Builder for TalentScout Hiring Assistant
+Turns a conversation session into the storage row described by SHEET_HEADERS
+"""
+
+import hashlib
+import json
+from typing import List, Any, Optional, Tuple
+from datetime import datetime
+from src.data.models import ConversationSession
+from src.chatbot.sentiment_analyzer import SentimentAnalyzer
+from src.config.settings import SHEET_HEADERS
+from src.data.blind_index import blind_indexes
+from src.utils.gdpr_compliance import GDPRCompliance
+
+# Sheet columns holding encrypted personal data
+ENCRYPTED_COLUMNS = ["Email", "Phone", "Date_of_Birth"]
+ENCRYPTED_INDEXES = [SHEET_HEADERS.index(name) for name in ENCRYPTED_COLUMNS]
+
+def row_content_hash(row: List[Any]) -> str:
+    """Stable hash of a plaintext row's content (the save Timestamp is ignored)"""
+    payload = json.dumps(list(row[1:]), default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class CandidateRowBuilder:
+    """Builds encrypted candidate rows shared by every persistence path"""
+    
+    def __init__(self, gdpr_compliance: Optional[GDPRCompliance] = None, blind_index_key: Optional[str] = None):
+        self.gdpr_compliance = gdpr_compliance or GDPRCompliance()
+        # Key for the email / phone blind indexes (left blank without one, for a later backfill)
+        self.blind_index_key = blind_index_key
+        # Initialize sentiment analyzer for sheet metrics
+        self.sentiment_analyzer = SentimentAnalyzer()
+    
+    def build_row(self, session: ConversationSession) -> Optional[List[Any]]:
+        """Build the sheet row for a session (None when there is no candidate info)"""
+        built = self.build_row_with_hash(session)
+        return built[0] if built else None
+    
+    def build_row_with_hash(self, session: ConversationSession) -> Optional[Tuple[List[Any], str]]:
+        """Build the sheet row plus a content hash of its plaintext (encryption is randomized, so rows differ per build)"""
+        if not session.candidate_info:
+            return None
+        
+        candidate = session.candidate_info
+        
+        # Handle both Pydantic model and dict formats
+        if hasattr(candidate, 'full_name'):
+            # Pydantic model format
+            full_name = candidate.full_name
+            email = candidate.email
+            phone = candidate.phone
+            gender = getattr(candidate, 'gender', '')
+            date_of_birth = getattr(candidate, 'date_of_birth', '')
+            experience_years = candidate.experience_years
+            desired_positions = ', '.join(candidate.desired_positions)
+            location = candidate.location
+            graduation_year = getattr(candidate, 'graduation_year', '')
+            cgpa_10th = getattr(candidate, 'cgpa_10th', '')
+            cgpa_12th = getattr(candidate, 'cgpa_12th', '')
+            cgpa_degree = getattr(candidate, 'cgpa_degree', '')
+            tech_stack = ', '.join(candidate.tech_stack)
+            work_experience_description = getattr(candidate, 'work_experience_description', '')
+            why_good_candidate = getattr(candidate, 'why_good_candidate', '')
+        else:
+            # Dict format
+            full_name = candidate.get('full_name', '')
+            email = candidate.get('email', '')
+            phone = candidate.get('phone', '')
+            gender = candidate.get('gender', '')
+            date_of_birth = candidate.get('date_of_birth', '')
+            experience_years = candidate.get('experience_years', 0)
+            desired_positions = ', '.join(candidate.get('desired_positions', []))
+            location = candidate.get('location', '')
+            graduation_year = candidate.get('graduation_year', '')
+            cgpa_10th = candidate.get('cgpa_10th', '')
+            cgpa_12th = candidate.get('cgpa_12th', '')
+            cgpa_degree = candidate.get('cgpa_degree', '')
+            tech_stack = ', '.join(candidate.get('tech_stack', []))
+            work_experience_description = candidate.get('work_experience_description', '')
+            why_good_candidate = candidate.get('why_good_candidate', '')
+        
+        indexes = blind_indexes(email, phone, self.blind_index_key)
+        
+        # Prepare row data (sensitive fields are encrypted below, once the content hash is taken)
+        row_data = [
+            datetime.now().isoformat(),  # Timestamp
+            session.session_id,  # Session_ID
+            full_name,  # Full_Name (not encrypted - needed for HR)
+            email,  # Email (encrypted)
+            phone,  # Phone (encrypted)
+            gender,  # Gender
+            date_of_birth,  # Date_of_Birth (encrypted)
+            experience_years,  # Experience_Years
+            desired_positions,  # Desired_Positions
+            location,  # Location
+            graduation_year,  # Graduation_Year
+            cgpa_10th,  # CGPA_10th
+            cgpa_12th,  # CGPA_12th
+            cgpa_degree,  # CGPA_Degree
+            tech_stack,  # Tech_Stack
+            work_experience_description,  # Work_Experience_Description
+            why_good_candidate,  # Why_Good_Candidate
+            self._format_technical_questions(session.technical_questions),  # Technical_Questions
+            self._format_responses(session.technical_questions),  # Candidate_Responses
+            self._calculate_average_sentiment(session.chat_history),  # Sentiment_Score
+            self._calculate_questions_answered(session.technical_questions),  # Questions_Answered
+            "completed",  # Status (initial value only - stores keep HR's Status when a row is re-saved)
+            indexes["Email_Index"],  # Email_Index (keyed HMAC for lookups)
+            indexes["Phone_Index"],  # Phone_Index (keyed HMAC for lookups)
+        ]
+        content_hash = row_content_hash(row_data)
+        
+        # Encrypt sensitive personal data for GDPR compliance
+        encrypted = self.gdpr_compliance.encrypt_for_sessions(
+            [session.session_id] * len(ENCRYPTED_INDEXES), (row_data[index] for index in ENCRYPTED_INDEXES)
+        )
+        for index, value in zip(ENCRYPTED_INDEXES, encrypted):
+            row_data[index] = value
+        
+        # Log data access for audit trail
+        self.gdpr_compliance.log_data_access("data_save", "candidate_info", session.session_id)
+        
+        return row_data, content_hash
+    
+    def _format_technical_questions(self, technical_questions_data) -> str:
+        """Format technical questions for storage in Q1, Q2 format"""
+        if not technical_questions_data:
+            return ""
+        
+        # Handle both dict format (from session) and list format
+        if isinstance(technical_questions_data, dict):
+            questions = technical_questions_data.get('questions', [])
+        else:
+            questions = technical_questions_data
+        
+        if not questions:
+            return ""
+        
+        formatted = []
+        for i, question in enumerate(questions, 1):
+            if hasattr(question, 'question'):
+                formatted.append(f"Q{i}: {question.question}")
+            else:
+                formatted.append(f"Q{i}: {str(question)}")
+        
+        return "\n".join(formatted)
+    
+    def _format_responses(self, technical_questions_data) -> str:
+        """Format candidate responses for storage in A1, A2 format"""
+        if not technical_questions_data:
+            return ""
+        
+        # Handle both dict format (from session) and list format
+        if isinstance(technical_questions_data, dict):
+            responses = technical_questions_data.get('responses', [])
+        else:
+            responses = technical_questions_data
+        
+        if not responses:
+            return ""
+        
+        formatted = []
+        for i, response in enumerate(responses, 1):
+            if hasattr(response, 'response'):
+                formatted.append(f"A{i}: {response.response}")
+            else:
+                formatted.append(f"A{i}: {str(response)}")
+        
+        return "\n".join(formatted)
+    
+    def _calculate_average_sentiment(self, chat_history: List[dict]) -> float:
+        """Calculate average sentiment score across user messages using TextBlob."""
+        if not chat_history:
+            return 0.0
+        user_msgs = [m for m in chat_history if m.get("role") == "user" and m.get("content", "").strip()]
+        if not user_msgs:
+            return 0.0
+
+        # Use existing SentimentAnalyzer for consistency
+        scores = []
+        for m in user_msgs:
+            analysis = self.sentiment_analyzer.analyze_sentiment(m["content"])
+            scores.append(analysis.sentiment_score)
+        if not scores:
+            return 0.0
+        return round(sum(scores) / len(scores), 3)
+    
+    def _calculate_questions_answered(self, technical_questions_data) -> str:
+        """Calculate questions answered in format like '5/5'"""
+        if not technical_questions_data:
+            return "0/0"
+        
+        # Handle both dict format (from session) and list format
+        if isinstance(technical_questions_data, dict):
+            total_questions = len(technical_questions_data.get('questions', []))
+            answered_questions = len(technical_questions_data.get('responses', []))
+        else:
+            # Fallback for list format
+            total_questions = len(technical_questions_data) if technical_questions_data else 0
+            answered_questions = total_questions  # Assume all answered if in list format
+        
+        return f"{answered_questions}/{total_questions}"
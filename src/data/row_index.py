@@ -0,0 +1,141 @@
+"""
+Session Row Index for TalentScout Hiring Assistant
+Maps Session_ID to its row number so single-candidate operations skip full sheet reads
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Matches the first row number of an A1 range such as "Sheet1!A5:U7"
+_RANGE_START_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+def parse_append_start_row(response: Any) -> Optional[int]:
+    """Extract the first written row from a values.append API response"""
+    if not isinstance(response, dict):
+        return None
+    updated_range = response.get("updates", {}).get("updatedRange", "")
+    match = _RANGE_START_ROW.search(updated_range)
+    return int(match.group(1)) if match else None
+
+
+def descending_row_ranges(rows: Iterable[int]) -> List[Tuple[int, int]]:
+    """Merge row numbers into inclusive (start, end) runs, bottom-most first so deletes never shift pending runs"""
+    ranges: List[Tuple[int, int]] = []
+    for row in sorted(set(rows), reverse=True):
+        if ranges and ranges[-1][0] == row + 1:
+            ranges[-1] = (row, ranges[-1][1])
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class SessionRowIndex:
+    """In-memory Session_ID -> row number index, built from the Session_ID column only"""
+
+    def __init__(self, load_column: Callable[[], List[str]], header_rows: int = 1):
+        self.load_column = load_column
+        self.header_rows = header_rows
+        self._rows: Dict[str, int] = {}
+        self._last_row = header_rows
+        self._built = False
+        self._lock = threading.RLock()
+
+    def refresh(self):
+        """Rebuild the index with a single column read"""
+        self.load(self.load_column())
+
+    def load(self, column: List[str]):
+        """Rebuild the index from an already-read Session_ID column (header included)"""
+        with self._lock:
+            self._rows = {
+                session_id: row
+                for row, session_id in enumerate(column, start=1)
+                if row > self.header_rows and session_id
+            }
+            self._last_row = max(len(column), self.header_rows)
+            self._built = True
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index reflects the sheet as of its last read plus local changes"""
+        with self._lock:
+            return self._built
+
+    def invalidate(self):
+        """Force a rebuild on the next lookup"""
+        with self._lock:
+            self._built = False
+
+    def get(self, session_id: str) -> Optional[int]:
+        """Row number for a session, refreshing once on a miss"""
+        with self._lock:
+            if self._built and session_id in self._rows:
+                return self._rows[session_id]
+        self.refresh()
+        with self._lock:
+            return self._rows.get(session_id)
+
+    def contains(self, session_id: str) -> bool:
+        """Check membership without touching the sheet (builds the index if needed)"""
+        with self._lock:
+            if self._built:
+                return session_id in self._rows
+        self.refresh()
+        with self._lock:
+            return session_id in self._rows
+
+    def rows_for(self, session_ids: Iterable[str]) -> Dict[str, int]:
+        """Row numbers of the indexed sessions among session_ids (no refresh on misses)"""
+        with self._lock:
+            return {sid: self._rows[sid] for sid in session_ids if sid in self._rows}
+
+    def session_ids(self) -> List[str]:
+        """All indexed session IDs in sheet order"""
+        with self._lock:
+            return sorted(self._rows, key=self._rows.get)
+
+    @property
+    def last_row(self) -> int:
+        """Last occupied row number known to the index"""
+        with self._lock:
+            return self._last_row
+
+    def record_append(self, session_ids: Iterable[str], start_row: Optional[int] = None):
+        """Register rows appended to the end of the sheet"""
+        with self._lock:
+            if not self._built:
+                return
+            if start_row is None:
+                # Without the API's updated range we cannot be sure where rows landed
+                self._built = False
+                return
+            row = start_row
+            for session_id in session_ids:
+                self._rows[session_id] = row
+                row += 1
+            self._last_row = max(self._last_row, row - 1)
+
+    def record_delete(self, row: int):
+        """Drop a deleted row and shift every row below it up by one"""
+        self.record_delete_many([row])
+
+    def record_delete_many(self, rows: Iterable[int]):
+        """Drop several deleted rows and shift the remaining rows up accordingly"""
+        with self._lock:
+            if not self._built:
+                return
+            deleted = sorted(set(rows))
+            removed = set(deleted)
+            self._rows = {
+                session_id: r - bisect_left(deleted, r)
+                for session_id, r in self._rows.items()
+                if r not in removed
+            }
+            self._last_row = max(self.header_rows, self._last_row - len(deleted))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
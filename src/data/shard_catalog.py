@@ -0,0 +1,273 @@
+"""
+Candidate Shard Catalog for TalentScout Hiring Assistant
+Routes candidate rows to per-month or per-role worksheets and tracks which shard holds each session
+"""
+
+import contextvars
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import gspread
+
+from src.config.settings import SHEET_HEADERS
+from src.data.row_index import SessionRowIndex
+
+# Worksheets named with this prefix hold candidate rows
+SHARD_PREFIX = "Candidates_"
+
+# Catalog key of the spreadsheet's first worksheet (legacy, unsharded rows)
+DEFAULT_SHARD = "sheet1"
+
+_TIMESTAMP = SHEET_HEADERS.index("Timestamp")
+_DESIRED_POSITIONS = SHEET_HEADERS.index("Desired_Positions")
+
+
+def month_shard_title(row: List[Any]) -> str:
+    """Shard per interview month, e.g. Candidates_2025-03"""
+    timestamp = str(row[_TIMESTAMP]) if len(row) > _TIMESTAMP else ""
+    month = timestamp[:7] if re.match(r"\d{4}-\d{2}", timestamp) else datetime.now().strftime("%Y-%m")
+    return f"{SHARD_PREFIX}{month}"
+
+
+def role_shard_title(row: List[Any]) -> str:
+    """Shard per first desired position, e.g. Candidates_Data Analyst"""
+    positions = str(row[_DESIRED_POSITIONS]) if len(row) > _DESIRED_POSITIONS else ""
+    role = re.sub(r"[^A-Za-z0-9 _-]", "", positions.split(",")[0]).strip()[:50]
+    return f"{SHARD_PREFIX}{role or 'Unspecified'}"
+
+
+SHARD_STRATEGIES: Dict[str, Callable[[List[Any]], str]] = {
+    "month": month_shard_title,
+    "role": role_shard_title,
+}
+
+
+class CandidateShard:
+    """One candidate worksheet and its Session_ID row index"""
+
+    def __init__(self, key: str, worksheet_fn: Callable[[], Any], index_column: int):
+        self.key = key
+        self._worksheet_fn = worksheet_fn
+        self.row_index = SessionRowIndex(lambda: self.worksheet.col_values(index_column))
+        self.data_rows = 0
+
+    @property
+    def worksheet(self):
+        """The shard's worksheet"""
+        return self._worksheet_fn()
+
+
+class ShardCatalog:
+    """Session_ID -> shard map over the default worksheet plus on-demand shard worksheets"""
+
+    def __init__(
+        self,
+        default_sheet_fn: Callable[[], Any],
+        index_column: int,
+        shard_by: Optional[str] = None,
+        max_workers: int = 8,
+    ):
+        if shard_by and shard_by not in SHARD_STRATEGIES:
+            raise ValueError(f"Unknown shard strategy: {shard_by}")
+        self.default_sheet_fn = default_sheet_fn
+        self.index_column = index_column
+        self.route = SHARD_STRATEGIES[shard_by] if shard_by else None
+        self.max_workers = max_workers
+
+        self._shards: Dict[str, CandidateShard] = {
+            DEFAULT_SHARD: CandidateShard(DEFAULT_SHARD, default_sheet_fn, index_column)
+        }
+        self._worksheets: Dict[str, Any] = {}
+        self._locations: Dict[str, str] = {}
+        # Session_ID -> content hash of the row this process last wrote for it
+        self._content_hashes: Dict[str, str] = {}
+        # Session_ID -> content hash of a queued row, recorded only once the write succeeds
+        self._pending_hashes: Dict[str, str] = {}
+        self._discovered = False
+        self._lock = threading.RLock()
+
+    @property
+    def sharded(self) -> bool:
+        """Whether new rows are routed to shard worksheets"""
+        return self.route is not None
+
+    def shards(self) -> List[CandidateShard]:
+        """All shards in read order: the default worksheet first, then shard worksheets by title"""
+        with self._lock:
+            if self.sharded and not self._discovered:
+                self._discover()
+            named = sorted(key for key in self._shards if key != DEFAULT_SHARD)
+            return [self._shards[DEFAULT_SHARD]] + [self._shards[key] for key in named]
+
+    def shard_for_row(self, row: List[Any]) -> CandidateShard:
+        """The shard a new row belongs to, creating its worksheet if needed"""
+        if not self.sharded:
+            return self._shards[DEFAULT_SHARD]
+        title = self.route(row)
+        with self._lock:
+            self.shards()
+            if title not in self._shards:
+                self._create(title)
+            return self._shards[title]
+
+    def locate(self, session_id: str) -> Optional[CandidateShard]:
+        """The shard holding a session, refreshing the catalog once on a miss"""
+        shard = self.known_shard(session_id)
+        if shard is None:
+            self.refresh()
+            shard = self.known_shard(session_id)
+        return shard
+
+    def known_shard(self, session_id: str) -> Optional[CandidateShard]:
+        """The shard holding a session as far as the catalog knows, without any reads"""
+        with self._lock:
+            key = self._locations.get(session_id)
+            return self._shards.get(key) if key else None
+
+    def ensure_loaded(self):
+        """Read the Session_ID columns unless every shard's index is already current"""
+        if not all(shard.row_index.loaded for shard in self.shards()):
+            self.refresh()
+
+    def refresh(self) -> List[List[str]]:
+        """Re-read every shard's Session_ID column in parallel; returns the raw columns in shard order"""
+        shards = self.shards()
+        columns = self.map(lambda shard: shard.worksheet.col_values(self.index_column), shards)
+        with self._lock:
+            self._locations = {}
+            for shard, column in zip(shards, columns):
+                shard.row_index.load(column)
+                shard.data_rows = max(len(column) - 1, 0)
+                for session_id in shard.row_index.session_ids():
+                    self._locations[session_id] = shard.key
+        return columns
+
+    def session_ids(self) -> List[str]:
+        """Known session IDs in shard order"""
+        with self._lock:
+            return [sid for shard in self.shards() for sid in shard.row_index.session_ids()]
+
+    def spans(self, first: int, last: int) -> List[Tuple[CandidateShard, int, int]]:
+        """Map a range of positions in the concatenated shards (2-based, like sheet rows) to per-shard row ranges"""
+        result = []
+        offset = 0
+        for shard in self.shards():
+            start = max(first - offset, 2)
+            end = min(last - offset, shard.data_rows + 1)
+            if start <= end:
+                result.append((shard, start, end))
+            offset += shard.data_rows
+        return result
+
+    def record_append(self, shard: CandidateShard, session_ids: List[str], start_row: Optional[int]):
+        """Register rows appended to a shard"""
+        with self._lock:
+            shard.row_index.record_append(session_ids, start_row)
+            shard.data_rows += len(session_ids)
+            for session_id in session_ids:
+                self._locations[session_id] = shard.key
+
+    def content_hash(self, session_id: str) -> Optional[str]:
+        """Content hash of the row last written for a session by this process"""
+        with self._lock:
+            return self._content_hashes.get(session_id)
+
+    def record_content_hash(self, session_id: str, content_hash: str):
+        """Remember what was written for a session so unchanged re-saves can be skipped"""
+        with self._lock:
+            self._content_hashes[session_id] = content_hash
+
+    def stage_content_hash(self, session_id: str, content_hash: str):
+        """Hold the content hash of a queued row until its write succeeds"""
+        with self._lock:
+            self._pending_hashes[session_id] = content_hash
+
+    def commit_content_hashes(self, session_ids: Iterable[str]):
+        """Record the staged hashes of rows that reached the sheet"""
+        with self._lock:
+            for session_id in session_ids:
+                content_hash = self._pending_hashes.pop(session_id, None)
+                if content_hash:
+                    self._content_hashes[session_id] = content_hash
+
+    def discard_content_hashes(self, session_ids: Iterable[str]):
+        """Drop the staged hashes of rows whose write failed"""
+        with self._lock:
+            for session_id in session_ids:
+                self._pending_hashes.pop(session_id, None)
+
+    def forget(self, session_ids: Iterable[str]):
+        """Drop deleted sessions from the catalog"""
+        with self._lock:
+            for session_id in session_ids:
+                self._content_hashes.pop(session_id, None)
+                self._pending_hashes.pop(session_id, None)
+                key = self._locations.pop(session_id, None)
+                if key in self._shards:
+                    self._shards[key].data_rows = max(self._shards[key].data_rows - 1, 0)
+
+    def invalidate(self):
+        """Forget cached worksheets and indexes (after a reconnect)"""
+        with self._lock:
+            self._worksheets = {}
+            self._locations = {}
+            self._discovered = False
+            for shard in self._shards.values():
+                shard.row_index.invalidate()
+
+    def map(self, fn: Callable[[CandidateShard], Any], shards: Optional[List[CandidateShard]] = None) -> List[Any]:
+        """Apply fn to each shard in parallel, returning results in shard order"""
+        shards = self.shards() if shards is None else shards
+        if len(shards) <= 1:
+            return [fn(shard) for shard in shards]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as pool:
+            # Each task runs in a copy of the caller's context so API priorities carry over
+            futures = [pool.submit(contextvars.copy_context().run, fn, shard) for shard in shards]
+            return [future.result() for future in futures]
+
+    def _spreadsheet(self):
+        """The spreadsheet that owns the default worksheet"""
+        return self.default_sheet_fn().spreadsheet
+
+    def _discover(self):
+        """Register existing shard worksheets with one metadata read"""
+        for worksheet in self._spreadsheet().worksheets():
+            if worksheet.title.startswith(SHARD_PREFIX):
+                self._register(worksheet)
+        self._discovered = True
+
+    def _register(self, worksheet):
+        """Track a shard worksheet"""
+        title = worksheet.title
+        self._worksheets[title] = worksheet
+        if title not in self._shards:
+            self._shards[title] = CandidateShard(title, lambda: self._worksheet(title), self.index_column)
+
+    def _worksheet(self, title: str):
+        """Cached worksheet for a shard title"""
+        with self._lock:
+            worksheet = self._worksheets.get(title)
+            if worksheet is None:
+                worksheet = self._spreadsheet().worksheet(title)
+                self._worksheets[title] = worksheet
+            return worksheet
+
+    def _create(self, title: str):
+        """Create a shard worksheet with the candidate headers"""
+        spreadsheet = self._spreadsheet()
+        try:
+            worksheet = spreadsheet.add_worksheet(title, rows=1000, cols=len(SHEET_HEADERS))
+            worksheet.update([SHEET_HEADERS], "A1")
+            created = True
+            print(f"✅ Created candidate shard worksheet: {title}")
+        except gspread.exceptions.APIError:
+            # Another process created it first
+            worksheet = spreadsheet.worksheet(title)
+            created = False
+        self._register(worksheet)
+        if created:
+            # A brand-new shard holds only the header row - no need to read its index
+            self._shards[title].row_index.load([SHEET_HEADERS[self.index_column - 1]])
@@ -0,0 +1,380 @@
+"""
+Google Sheets Emulator for TalentScout Hiring Assistant
+In-process stand-in for the gspread client with latency and quota simulation
+"""
+
+import json
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import gspread
+import requests
+from gspread.cell import Cell
+from gspread.utils import a1_range_to_grid_range, numericise_all, rowcol_to_a1
+
+# Google's default per-user quotas (requests per minute)
+DEFAULT_READ_QUOTA = 60
+DEFAULT_WRITE_QUOTA = 60
+QUOTA_WINDOW_SECONDS = 60.0
+
+
+def quota_exceeded_error(kind: str, limit: int) -> gspread.exceptions.APIError:
+    """Build the APIError gspread raises for an HTTP 429 response"""
+    response = requests.Response()
+    response.status_code = 429
+    response._content = json.dumps({
+        "error": {
+            "code": 429,
+            "message": (
+                f"Quota exceeded for quota metric '{kind.title()} requests' "
+                f"and limit '{kind.title()} requests per minute per user' ({limit})"
+            ),
+            "status": "RESOURCE_EXHAUSTED",
+        }
+    }).encode("utf-8")
+    return gspread.exceptions.APIError(response)
+
+
+def _format_value(value: Any) -> str:
+    """Render a stored value the way the API returns FORMATTED_VALUE cells"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _trim(values: List[str]) -> List[str]:
+    """Drop trailing empty cells, as the API does"""
+    end = len(values)
+    while end and values[end - 1] == "":
+        end -= 1
+    return values[:end]
+
+
+class SheetsEmulator:
+    """Emulated gspread client holding spreadsheets in memory"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        read_quota_per_minute: Optional[int] = DEFAULT_READ_QUOTA,
+        write_quota_per_minute: Optional[int] = DEFAULT_WRITE_QUOTA,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.quotas = {"read": read_quota_per_minute, "write": write_quota_per_minute}
+        self.clock = clock
+        self.sleep = sleep
+
+        self._random = random.Random(seed)
+        self._windows: Dict[str, Deque[float]] = {"read": deque(), "write": deque()}
+        self._spreadsheets: Dict[str, "EmulatedSpreadsheet"] = {}
+        self._lock = threading.RLock()
+
+        # Call counters for benchmarks
+        self.calls: Dict[str, int] = {}
+        self.throttled = 0
+
+    def open_by_key(self, key: str) -> "EmulatedSpreadsheet":
+        """Open a spreadsheet, creating an empty one on first use"""
+        self._charge("read", "open_by_key")
+        with self._lock:
+            spreadsheet = self._spreadsheets.get(key)
+            if spreadsheet is None:
+                spreadsheet = EmulatedSpreadsheet(self, key)
+                self._spreadsheets[key] = spreadsheet
+            return spreadsheet
+
+    def _charge(self, kind: str, method: str):
+        """Apply simulated latency and count the call against the per-minute quota"""
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            self.sleep(delay)
+
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            limit = self.quotas.get(kind)
+            if not limit:
+                return
+
+            now = self.clock()
+            window = self._windows[kind]
+            while window and now - window[0] >= QUOTA_WINDOW_SECONDS:
+                window.popleft()
+            if len(window) >= limit:
+                self.throttled += 1
+                raise quota_exceeded_error(kind, limit)
+            window.append(now)
+
+    def reset_stats(self):
+        """Clear call counters and quota windows between benchmark runs"""
+        with self._lock:
+            self.calls.clear()
+            self.throttled = 0
+            for window in self._windows.values():
+                window.clear()
+
+    @property
+    def total_calls(self) -> int:
+        """Total API calls made against the emulator"""
+        return sum(self.calls.values())
+
+
+class EmulatedSpreadsheet:
+    """Emulated gspread Spreadsheet"""
+
+    def __init__(self, client: SheetsEmulator, key: str):
+        self.client = client
+        self.id = key
+        self.title = key
+        self._worksheets: List[EmulatedWorksheet] = [EmulatedWorksheet(client, self, "Sheet1", 0)]
+
+    @property
+    def sheet1(self) -> "EmulatedWorksheet":
+        """The first worksheet"""
+        return self._worksheets[0]
+
+    def worksheets(self) -> List["EmulatedWorksheet"]:
+        """All worksheets in order"""
+        self.client._charge("read", "worksheets")
+        return list(self._worksheets)
+
+    def worksheet(self, title: str) -> "EmulatedWorksheet":
+        """Find a worksheet by title"""
+        self.client._charge("read", "worksheet")
+        for worksheet in self._worksheets:
+            if worksheet.title == title:
+                return worksheet
+        raise gspread.exceptions.WorksheetNotFound(title)
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26) -> "EmulatedWorksheet":
+        """Add an empty worksheet"""
+        self.client._charge("write", "add_worksheet")
+        worksheet = EmulatedWorksheet(self.client, self, title, len(self._worksheets))
+        self._worksheets.append(worksheet)
+        return worksheet
+
+    def batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply structural requests in order (only row deleteDimension is supported)"""
+        self.client._charge("write", "spreadsheet_batch_update")
+        by_id = {worksheet.id: worksheet for worksheet in self._worksheets}
+        replies = []
+        for request in body.get("requests", []):
+            if "deleteDimension" not in request:
+                raise NotImplementedError(f"Emulator does not support request {list(request)}")
+            target = request["deleteDimension"]["range"]
+            if target.get("dimension") != "ROWS":
+                raise NotImplementedError("Emulator only deletes ROWS")
+            worksheet = by_id[target["sheetId"]]
+            with worksheet._lock:
+                del worksheet.rows[target["startIndex"]:target["endIndex"]]
+            replies.append({})
+        return {"spreadsheetId": self.id, "replies": replies}
+
+
+class EmulatedWorksheet:
+    """Emulated gspread Worksheet backed by a list of rows"""
+
+    def __init__(self, client: SheetsEmulator, spreadsheet: EmulatedSpreadsheet, title: str, sheet_id: int):
+        self.client = client
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.rows: List[List[str]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def row_count(self) -> int:
+        """Number of used rows"""
+        return len(self.rows)
+
+    # -- reads -----------------------------------------------------------
+
+    def row_values(self, row: int, **kwargs) -> List[str]:
+        """Values of a 1-based row"""
+        self.client._charge("read", "row_values")
+        with self._lock:
+            return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def col_values(self, col: int, **kwargs) -> List[str]:
+        """Values of a 1-based column"""
+        self.client._charge("read", "col_values")
+        with self._lock:
+            return _trim([r[col - 1] if col <= len(r) else "" for r in self.rows])
+
+    def cell(self, row: int, col: int, **kwargs) -> Cell:
+        """A single cell"""
+        self.client._charge("read", "cell")
+        with self._lock:
+            value = ""
+            if row <= len(self.rows) and col <= len(self.rows[row - 1]):
+                value = self.rows[row - 1][col - 1]
+        return Cell(row, col, value)
+
+    def get_all_values(self, **kwargs) -> List[List[str]]:
+        """Every used row"""
+        self.client._charge("read", "get_all_values")
+        with self._lock:
+            return [list(r) for r in self.rows]
+
+    def get_all_records(self, **kwargs) -> List[Dict[str, Any]]:
+        """Rows below the header as dicts, with numbers converted"""
+        self.client._charge("read", "get_all_records")
+        with self._lock:
+            if not self.rows:
+                return []
+            headers = self.rows[0]
+            return [
+                dict(zip(headers, numericise_all(list(r) + [""] * (len(headers) - len(r)))))
+                for r in self.rows[1:]
+            ]
+
+    def get(self, range_name: Optional[str] = None, **kwargs) -> List[List[str]]:
+        """Values in an A1 range"""
+        self.client._charge("read", "get")
+        with self._lock:
+            return self._read_range(range_name, kwargs.get("major_dimension"))
+
+    def batch_get(self, ranges: List[str], **kwargs) -> List[List[List[str]]]:
+        """Values for several A1 ranges in one call"""
+        self.client._charge("read", "batch_get")
+        with self._lock:
+            return [self._read_range(r, kwargs.get("major_dimension")) for r in ranges]
+
+    # -- writes ----------------------------------------------------------
+
+    def append_row(self, values: List[Any], **kwargs) -> Dict[str, Any]:
+        """Append one row after the last used row"""
+        return self._append([values], "append_row")
+
+    def append_rows(self, values: List[List[Any]], **kwargs) -> Dict[str, Any]:
+        """Append several rows after the last used row"""
+        return self._append(values, "append_rows")
+
+    def update_cell(self, row: int, col: int, value: Any) -> Dict[str, Any]:
+        """Write a single cell"""
+        self.client._charge("write", "update_cell")
+        with self._lock:
+            self._write(row, col, [[value]])
+        return {"updatedRange": f"{self.title}!{rowcol_to_a1(row, col)}"}
+
+    def update(self, values: List[List[Any]], range_name: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Write a block of values starting at the top-left of an A1 range"""
+        self.client._charge("write", "update")
+        with self._lock:
+            grid = a1_range_to_grid_range(self._strip_title(range_name or "A1"))
+            self._write(grid.get("startRowIndex", 0) + 1, grid.get("startColumnIndex", 0) + 1, values)
+        return {"updatedRange": f"{self.title}!{range_name or 'A1'}"}
+
+    def batch_update(self, data: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """Write several value ranges in one call"""
+        self.client._charge("write", "batch_update")
+        with self._lock:
+            for value_range in data:
+                grid = a1_range_to_grid_range(self._strip_title(value_range["range"]))
+                self._write(
+                    grid.get("startRowIndex", 0) + 1,
+                    grid.get("startColumnIndex", 0) + 1,
+                    value_range["values"],
+                )
+        return {"totalUpdatedRanges": len(data)}
+
+    def delete_rows(self, start_index: int, end_index: Optional[int] = None) -> Dict[str, Any]:
+        """Delete rows start_index..end_index (1-based, inclusive)"""
+        self.client._charge("write", "delete_rows")
+        with self._lock:
+            del self.rows[start_index - 1:(end_index or start_index)]
+        return {}
+
+    def clear(self) -> Dict[str, Any]:
+        """Remove every value"""
+        self.client._charge("write", "clear")
+        with self._lock:
+            self.rows = []
+        return {}
+
+    # -- helpers ---------------------------------------------------------
+
+    def _append(self, values: List[List[Any]], method: str) -> Dict[str, Any]:
+        """Append rows and report the updated range like the API does"""
+        self.client._charge("write", method)
+        with self._lock:
+            start = len(self.rows) + 1
+            for row in values:
+                self.rows.append(_trim([_format_value(v) for v in row]))
+            end = len(self.rows)
+        width = max((len(r) for r in values), default=1) or 1
+        return {
+            "updates": {
+                "updatedRange": f"{self.title}!A{start}:{rowcol_to_a1(end, width)}",
+                "updatedRows": len(values),
+            }
+        }
+
+    def _write(self, row: int, col: int, values: List[List[Any]]):
+        """Write a block of values with its top-left corner at (row, col)"""
+        for r_offset, row_values in enumerate(values):
+            target_row = row + r_offset
+            while len(self.rows) < target_row:
+                self.rows.append([])
+            current = self.rows[target_row - 1]
+            for c_offset, value in enumerate(row_values):
+                target_col = col + c_offset
+                if len(current) < target_col:
+                    current.extend([""] * (target_col - len(current)))
+                current[target_col - 1] = _format_value(value)
+            self.rows[target_row - 1] = _trim(current)
+
+    def _strip_title(self, range_name: str) -> str:
+        """Remove a leading 'Sheet'! prefix from an A1 range"""
+        return range_name.split("!", 1)[1] if "!" in range_name else range_name
+
+    def _read_range(self, range_name: Optional[str], major_dimension: Optional[str]) -> List[List[str]]:
+        """Values in an A1 range, trimmed like the API response"""
+        grid = a1_range_to_grid_range(self._strip_title(range_name)) if range_name else {}
+        start_row = grid.get("startRowIndex", 0)
+        end_row = grid.get("endRowIndex", len(self.rows))
+        start_col = grid.get("startColumnIndex", 0)
+        end_col = grid.get("endColumnIndex")
+
+        block = [
+            _trim(list(r[start_col:end_col] if end_col is not None else r[start_col:]))
+            for r in self.rows[start_row:end_row]
+        ]
+        while block and not block[-1]:
+            block.pop()
+
+        if major_dimension and major_dimension.upper() == "COLUMNS":
+            width = max((len(r) for r in block), default=0)
+            block = [
+                _trim([r[c] if c < len(r) else "" for r in block]) for c in range(width)
+            ]
+        return block
+
+
+# Process-wide emulators so every session sees the same in-memory spreadsheets
+_emulators: Dict[str, SheetsEmulator] = {}
+_registry_lock = threading.Lock()
+
+
+def get_emulator(name: str = "default", **kwargs) -> SheetsEmulator:
+    """Get the shared emulator for a name, creating it on first use"""
+    with _registry_lock:
+        emulator = _emulators.get(name)
+        if emulator is None:
+            emulator = SheetsEmulator(**kwargs)
+            _emulators[name] = emulator
+        return emulator
@@ -4,38 +4,172 @@ Google Sheets Integration for TalentScout Hiring Assistant
 
 import json
 import gspread
+import numpy as np
 from google.oauth2.service_account import Credentials
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 import streamlit as st
 from src.data.models import CandidateInfo, ConversationSession
-from src.chatbot.sentiment_analyzer import SentimentAnalyzer
 from src.config.settings import SHEET_HEADERS
 from src.utils.gdpr_compliance import GDPRCompliance
+from src.data.candidate_store import CandidateStore, format_export
+from src.data.row_builder import CandidateRowBuilder
+from src.data.blind_index import email_blind_index, get_blind_index_table, phone_blind_index
+from src.data.data_keys import get_data_key_store
+from src.data.write_queue import get_write_queue
+from src.data.outbox import get_outbox, start_replayer
+from src.data.row_index import descending_row_ranges, parse_append_start_row
+from src.data.shard_catalog import CandidateShard
+from src.data.projection import (
+    STATISTICS_COLUMNS, column_letter, column_range, compute_statistics, to_typed_column
+)
+from src.data.snapshot_cache import get_snapshot
+from src.data.sheets_pool import get_connection
+from src.data.quota_scheduler import Priority, api_priority, with_priority
+from src.data.stats_materializer import (
+    aggregates_to_rows, get_stats_materializer, row_stat_values, rows_to_aggregates
+)
 
-class SheetsHandler:
+# 1-based column of Session_ID in the sheet
+SESSION_ID_COLUMN = SHEET_HEADERS.index("Session_ID") + 1
+
+# 1-based column of Status in the sheet
+STATUS_COLUMN = SHEET_HEADERS.index("Status") + 1
+
+# Worksheet holding the materialized candidate statistics
+STATS_WORKSHEET = "Stats"
+
+class SheetsHandler(CandidateStore):
     """Handles Google Sheets operations for candidate data storage"""
     
-    def __init__(self, sheet_id: str, service_account_json):
+    def __init__(
+        self,
+        sheet_id: str,
+        service_account_json,
+        write_behind: bool = True,
+        batch_size: int = 20,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 500,
+        outbox_path: Optional[str] = None,
+        replay_interval: float = 30.0,
+        snapshot_path: Optional[str] = None,
+        snapshot_refresh_interval: float = 30.0,
+        client=None,
+        health_check_interval: float = 300.0,
+        materialize_stats: bool = True,
+        stats_reconcile_interval: float = 600.0,
+        shard_by: Optional[str] = None,
+        read_quota_per_minute: Optional[int] = None,
+        write_quota_per_minute: Optional[int] = None,
+        blind_index_key: Optional[str] = None,
+        data_key_store_path: Optional[str] = None,
+    ):
         self.sheet_id = sheet_id
-        self.gdpr_compliance = GDPRCompliance()
+        self.blind_index_key = blind_index_key
+        # Envelope encryption: each candidate's fields use their own data key, so erasure is one key delete
+        self.gdpr_compliance = GDPRCompliance(
+            data_keys=get_data_key_store(data_key_store_path) if data_key_store_path else None
+        )
         
-        # Handle both string and dict formats
-        if isinstance(service_account_json, str):
+        # Handle both string and dict formats (an injected client, e.g. the emulator, needs neither)
+        if client is not None:
+            self.service_account_info = None
+        elif isinstance(service_account_json, str):
             self.service_account_info = json.loads(service_account_json)
         elif isinstance(service_account_json, dict):
             self.service_account_info = service_account_json
         else:
             raise ValueError("service_account_json must be a string or dict")
             
-        self.client = None
-        self.sheet = None
-        self._initialize_client()
-        # Initialize sentiment analyzer for sheet metrics
-        self.sentiment_analyzer = SentimentAnalyzer()
+        # Shared connection: authorized, opened and header-checked once per process
+        connection_key = self.sheet_id if client is None else f"{self.sheet_id}:{id(client)}"
+        self.connection = get_connection(
+            connection_key,
+            sheet_id=self.sheet_id,
+            client_factory=(lambda: client) if client is not None else self._authorize,
+            index_column=SESSION_ID_COLUMN,
+            prepare=self._ensure_headers,
+            health_check_interval=health_check_interval,
+            shard_by=shard_by or None,
+            read_quota_per_minute=read_quota_per_minute,
+            write_quota_per_minute=write_quota_per_minute,
+        )
+        
+        # Admits every API call by priority within the read/write quotas
+        self.scheduler = self.connection.scheduler
+        
+        # Session_ID -> shard worksheet and row number, built lazily from the Session_ID columns
+        self.catalog = self.connection.catalog
+        
+        # Connect now so configuration errors surface when the handler is created
+        self.connection.sheet
+        self.row_builder = CandidateRowBuilder(self.gdpr_compliance, blind_index_key)
+        
+        # Email / phone blind index -> Session_IDs, so lookups skip decrypting every row
+        self.blind_indexes = get_blind_index_table(
+            connection_key, load_columns=self.get_columns
+        )
+        
+        # Local columnar mirror used by dashboard-style reads
+        self.snapshot = None
+        if snapshot_path:
+            self.snapshot = get_snapshot(
+                snapshot_path,
+                load_session_column=self._load_session_column,
+                fetch_rows=self._fetch_rows,
+                refresh_interval=snapshot_refresh_interval,
+            )
+        
+        # Running aggregates so get_statistics does not rescan the sheet
+        self.stats = None
+        self._stats_sheet = None
+        self._stats_rows_written = 0
+        if materialize_stats:
+            self.stats = get_stats_materializer(
+                connection_key,
+                load_fn=self._load_stats,
+                save_fn=self._save_stats,
+                scan_fn=self._read_columns,
+                reconcile_interval=stats_reconcile_interval,
+            )
+        
+        # Durable local outbox - every row is recorded here before it is sent to Sheets
+        self.outbox = get_outbox(outbox_path) if outbox_path else None
+        
+        # Shared write-behind queue so the final interview turn does not wait on the API
+        self.write_queue = None
+        if write_behind:
+            self.write_queue = get_write_queue(
+                f"sheets:{self.sheet_id}",
+                self._write_queued_rows,
+                batch_size=batch_size,
+                flush_interval=flush_interval,
+                max_queue_size=max_queue_size,
+                on_success=self._on_rows_written,
+                on_failure=self._on_rows_failed,
+            )
+        
+        if self.outbox:
+            start_replayer(
+                f"sheets:{self.sheet_id}",
+                self.outbox,
+                deliver_fn=self._deliver_outbox_rows,
+                in_flight_fn=self.write_queue.is_pending if self.write_queue else None,
+                interval=replay_interval,
+            )
+    
+    @property
+    def sheet(self):
+        """The shared worksheet (reconnected lazily after connection failures)"""
+        return self.connection.sheet
+    
+    @property
+    def client(self):
+        """The shared gspread client"""
+        return self.connection.client
     
-    def _initialize_client(self):
-        """Initialize Google Sheets client"""
+    def _authorize(self):
+        """Create an authorized Google Sheets client from the service account"""
         try:
             # Define the scope
             scopes = [
@@ -62,13 +196,7 @@ class SheetsHandler:
             )
             
             # Authorize the client
-            self.client = gspread.authorize(credentials)
-            
-            # Open the spreadsheet
-            self.sheet = self.client.open_by_key(self.sheet_id).sheet1
-            
-            # Initialize headers if needed
-            self._ensure_headers()
+            return gspread.authorize(credentials)
             
         except ValueError as e:
             if "Could not deserialize key data" in str(e):
@@ -85,16 +213,14 @@ class SheetsHandler:
                         temp_file = f.name
                     
                     credentials = Credentials.from_service_account_file(temp_file, scopes=scopes)
-                    self.client = gspread.authorize(credentials)
-                    self.sheet = self.client.open_by_key(self.sheet_id).sheet1
-                    self._ensure_headers()
+                    client = gspread.authorize(credentials)
                     
                     # Clean up temp file
                     import os
                     os.unlink(temp_file)
                     
                     print("✅ Alternative authentication successful!")
-                    return
+                    return client
                     
                 except Exception as alt_e:
                     print(f"❌ Alternative method also failed: {str(alt_e)}")
@@ -107,319 +233,562 @@ class SheetsHandler:
             st.error(f"Failed to initialize Google Sheets: {str(e)}")
             raise e
     
-    def _ensure_headers(self):
-        """Ensure the sheet has proper headers"""
+    def _ensure_headers(self, sheet):
+        """Ensure the sheet has proper headers (runs once per connection)"""
         try:
             # Get the first row
-            first_row = self.sheet.row_values(1)
+            first_row = sheet.row_values(1)
+            
+            # Older sheets only lack trailing columns - extend the header row without touching data
+            if first_row and len(first_row) < len(SHEET_HEADERS) and first_row == SHEET_HEADERS[:len(first_row)]:
+                sheet.update([SHEET_HEADERS], "A1")
+                return
             
             # If empty or doesn't match our headers, set them
             if not first_row or first_row != SHEET_HEADERS:
-                self.sheet.clear()
-                self.sheet.append_row(SHEET_HEADERS)
+                sheet.clear()
+                sheet.append_row(SHEET_HEADERS)
                 
         except Exception as e:
             st.error(f"Failed to set headers: {str(e)}")
     
+    @with_priority(Priority.INTERACTIVE)
     def save_candidate_data(self, session: ConversationSession) -> bool:
-        """Save candidate data to Google Sheets"""
+        """Save candidate data to Google Sheets (an upsert keyed on Session_ID)"""
         try:
-            if not session.candidate_info:
+            built = self.row_builder.build_row_with_hash(session)
+            if built is None:
                 return False
-            
-            candidate = session.candidate_info
-            
-            # Handle both Pydantic model and dict formats
-            if hasattr(candidate, 'full_name'):
-                # Pydantic model format
-                full_name = candidate.full_name
-                email = candidate.email
-                phone = candidate.phone
-                gender = getattr(candidate, 'gender', '')
-                date_of_birth = getattr(candidate, 'date_of_birth', '')
-                experience_years = candidate.experience_years
-                desired_positions = ', '.join(candidate.desired_positions)
-                location = candidate.location
-                graduation_year = getattr(candidate, 'graduation_year', '')
-                cgpa_10th = getattr(candidate, 'cgpa_10th', '')
-                cgpa_12th = getattr(candidate, 'cgpa_12th', '')
-                cgpa_degree = getattr(candidate, 'cgpa_degree', '')
-                tech_stack = ', '.join(candidate.tech_stack)
-                work_experience_description = getattr(candidate, 'work_experience_description', '')
-                why_good_candidate = getattr(candidate, 'why_good_candidate', '')
-            else:
-                # Dict format
-                full_name = candidate.get('full_name', '')
-                email = candidate.get('email', '')
-                phone = candidate.get('phone', '')
-                gender = candidate.get('gender', '')
-                date_of_birth = candidate.get('date_of_birth', '')
-                experience_years = candidate.get('experience_years', 0)
-                desired_positions = ', '.join(candidate.get('desired_positions', []))
-                location = candidate.get('location', '')
-                graduation_year = candidate.get('graduation_year', '')
-                cgpa_10th = candidate.get('cgpa_10th', '')
-                cgpa_12th = candidate.get('cgpa_12th', '')
-                cgpa_degree = candidate.get('cgpa_degree', '')
-                tech_stack = ', '.join(candidate.get('tech_stack', []))
-                work_experience_description = candidate.get('work_experience_description', '')
-                why_good_candidate = candidate.get('why_good_candidate', '')
-            
-            # Encrypt sensitive personal data for GDPR compliance
-            encrypted_email = self.gdpr_compliance.encrypt_sensitive_data(email)
-            encrypted_phone = self.gdpr_compliance.encrypt_sensitive_data(phone)
-            encrypted_dob = self.gdpr_compliance.encrypt_sensitive_data(date_of_birth)
-            
-            # Log data access for audit trail
-            self.gdpr_compliance.log_data_access("data_save", "candidate_info", session.session_id)
-            
-            # Prepare row data
-            row_data = [
-                datetime.now().isoformat(),  # Timestamp
-                session.session_id,  # Session_ID
-                full_name,  # Full_Name (not encrypted - needed for HR)
-                encrypted_email,  # Email (encrypted)
-                encrypted_phone,  # Phone (encrypted)
-                gender,  # Gender
-                encrypted_dob,  # Date_of_Birth (encrypted)
-                experience_years,  # Experience_Years
-                desired_positions,  # Desired_Positions
-                location,  # Location
-                graduation_year,  # Graduation_Year
-                cgpa_10th,  # CGPA_10th
-                cgpa_12th,  # CGPA_12th
-                cgpa_degree,  # CGPA_Degree
-                tech_stack,  # Tech_Stack
-                work_experience_description,  # Work_Experience_Description
-                why_good_candidate,  # Why_Good_Candidate
-                self._format_technical_questions(session.technical_questions),  # Technical_Questions
-                self._format_responses(session.technical_questions),  # Candidate_Responses
-                self._calculate_average_sentiment(session.chat_history),  # Sentiment_Score
-                self._calculate_questions_answered(session.technical_questions)  # Questions_Answered
-            ]
-                
-            # Append to sheet
-            self.sheet.append_row(row_data)
+            row_data, content_hash = built
+            
+            session_id = session.session_id
+            if self.catalog.content_hash(session_id) == content_hash:
+                # Saved before with identical content - nothing to write
+                return True
+            if self.outbox and not self.outbox.add(session_id, row_data, content_hash):
+                # Identical row already delivered or waiting for delivery (recorded only once it is in the sheet)
+                if self.outbox.is_sent(session_id):
+                    self.catalog.record_content_hash(session_id, content_hash)
+                return True
+            
+            # Hand the row to the write-behind queue; fall back to a direct write under backpressure
+            if self.write_queue:
+                self.catalog.stage_content_hash(session_id, content_hash)
+                if self.write_queue.enqueue(session_id, row_data, unique=True):
+                    return True
+                self.catalog.discard_content_hashes([session_id])
+            
+            # Append to sheet, or overwrite the session's existing row in place
+            try:
+                self._upsert_rows([row_data])
+            except Exception as e:
+                self.connection.report_error(e)
+                if not self.outbox:
+                    raise
+                # The row is safe in the outbox; the replayer will deliver it later
+                self.outbox.mark_failed([session_id], str(e))
+                print(f"⚠️ Sheets write failed, row kept in local outbox for replay: {str(e)}")
+                return True
+            
+            self.catalog.record_content_hash(session_id, content_hash)
+            if self.outbox:
+                self.outbox.mark_sent([session_id])
             return True
             
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to save data to sheets: {str(e)}")
             return False
     
-    def _format_technical_questions(self, technical_questions_data) -> str:
-        """Format technical questions for storage in Q1, Q2 format"""
-        if not technical_questions_data:
-            return ""
-        
-        # Handle both dict format (from session) and list format
-        if isinstance(technical_questions_data, dict):
-            questions = technical_questions_data.get('questions', [])
-        else:
-            questions = technical_questions_data
-        
-        if not questions:
-            return ""
-        
-        formatted = []
-        for i, question in enumerate(questions, 1):
-            if hasattr(question, 'question'):
-                formatted.append(f"Q{i}: {question.question}")
-            else:
-                formatted.append(f"Q{i}: {str(question)}")
+    @with_priority(Priority.INTERACTIVE)
+    def _write_queued_rows(self, rows: List[List[Any]]) -> int:
+        """Flush function of the write-behind queue (queued rows are interactive saves)"""
+        return self._upsert_rows(rows)
+    
+    def _on_rows_written(self, batch: List[Tuple[str, List[Any]]], written: int):
+        """Mark rows flushed by the write-behind queue as delivered and remember their content"""
+        self.catalog.commit_content_hashes(session_id for session_id, _ in batch)
+        if self.outbox:
+            self.outbox.mark_sent(session_id for session_id, _ in batch)
+    
+    def _on_rows_failed(self, batch: List[Tuple[str, List[Any]]], error: Exception):
+        """Leave failed rows pending in the outbox for the replayer"""
+        self.catalog.discard_content_hashes(session_id for session_id, _ in batch)
+        self.connection.report_error(error)
+        if self.outbox:
+            self.outbox.mark_failed([session_id for session_id, _ in batch], str(error))
+    
+    @with_priority(Priority.INTERACTIVE)
+    def _deliver_outbox_rows(self, items: List[Tuple[str, List[Any]]]):
+        """Send replayed outbox rows through the same batching path as live saves"""
+        if self.write_queue:
+            for session_id, row in items:
+                if not self.write_queue.enqueue(session_id, row, timeout=1.0, unique=True):
+                    self.outbox.mark_failed([session_id], "write queue full")
+            return
         
-        return "\n".join(formatted)
+        self._upsert_rows([row for _, row in items])
+        self.outbox.mark_sent(session_id for session_id, _ in items)
+    
+    def _load_session_column(self) -> List[str]:
+        """Read the Session_ID column of every shard, concatenated in shard order behind one header"""
+        columns = self.catalog.refresh()
+        return ["Session_ID"] + [session_id for column in columns for session_id in column[1:]]
     
-    def _format_responses(self, technical_questions_data) -> str:
-        """Format candidate responses for storage in A1, A2 format"""
-        if not technical_questions_data:
-            return ""
+    def _fetch_rows(self, first_row: int, last_row: int) -> List[List[Any]]:
+        """Read full rows in the given (inclusive) range of concatenated shard positions"""
+        last_column = column_letter(SHEET_HEADERS[-1])
+        spans = self.catalog.spans(first_row, last_row)
         
-        # Handle both dict format (from session) and list format
-        if isinstance(technical_questions_data, dict):
-            responses = technical_questions_data.get('responses', [])
-        else:
-            responses = technical_questions_data
+        def fetch(span):
+            shard, start, end = span
+            rows = shard.worksheet.get(f"A{start}:{last_column}{end}")
+            # Trailing blank rows are omitted by the API - pad so later shards stay aligned
+            return list(rows) + [[]] * (end - start + 1 - len(rows))
         
-        if not responses:
-            return ""
+        parts = self.catalog.map(fetch, spans)
+        return [row for part in parts for row in part]
+    
+    def _read_columns(self, names: List[str]) -> Dict[str, np.ndarray]:
+        """Typed columns from the local snapshot when enabled, else a projected sheet read"""
+        if self.snapshot:
+            self.snapshot.refresh()
+            return self.snapshot.get_columns(names)
+        return self.get_columns(names)
+    
+    def _read_records(self) -> List[Dict[str, Any]]:
+        """All records from the local snapshot when enabled, else from the sheet"""
+        if self.snapshot:
+            self.snapshot.refresh()
+            return self.snapshot.records()
+        parts = self.catalog.map(lambda shard: shard.worksheet.get_all_records())
+        return [record for part in parts for record in part]
+    
+    def _locate_row(self, session_id: str) -> Tuple[Optional[CandidateShard], Optional[int], List[Any]]:
+        """Find a session's shard and row via the catalog, returning them with the row's current values"""
+        shard = self.catalog.locate(session_id)
+        row = shard.row_index.get(session_id) if shard else None
+        if row is None:
+            return None, None, []
         
-        formatted = []
-        for i, response in enumerate(responses, 1):
-            if hasattr(response, 'response'):
-                formatted.append(f"A{i}: {response.response}")
-            else:
-                formatted.append(f"A{i}: {str(response)}")
+        values = shard.worksheet.row_values(row)
+        if len(values) < SESSION_ID_COLUMN or values[SESSION_ID_COLUMN - 1] != session_id:
+            # Another process may have shifted rows since the index was built - rebuild once and retry
+            shard.row_index.refresh()
+            row = shard.row_index.get(session_id)
+            if row is None:
+                return None, None, []
+            values = shard.worksheet.row_values(row)
+        return shard, row, values
+    
+    def _batch_read_rows(self, shard: CandidateShard, rows: List[int]) -> List[List[Any]]:
+        """Read several full rows of one shard with one batch_get"""
+        last_column = column_letter(SHEET_HEADERS[-1])
+        value_ranges = shard.worksheet.batch_get([f"A{row}:{last_column}{row}" for row in rows])
+        return [value_range[0] if value_range else [] for value_range in value_ranges]
+    
+    def _record_new_rows(self, rows: List[List[Any]]):
+        """Count freshly written rows into the materialized statistics"""
+        if self.stats:
+            self.stats.record_rows(rows)
+    
+    def _stats_worksheet(self):
+        """The statistics worksheet, created on first use"""
+        if self._stats_sheet is None:
+            spreadsheet = self.sheet.spreadsheet
+            try:
+                self._stats_sheet = spreadsheet.worksheet(STATS_WORKSHEET)
+            except gspread.exceptions.WorksheetNotFound:
+                self._stats_sheet = spreadsheet.add_worksheet(STATS_WORKSHEET, rows=100, cols=2)
+        return self._stats_sheet
+    
+    def _load_stats(self) -> Optional[Tuple[Dict[str, Any], Optional[float]]]:
+        """Read persisted aggregates from the statistics worksheet"""
+        try:
+            values = self.sheet.spreadsheet.worksheet(STATS_WORKSHEET).get_all_values()
+        except gspread.exceptions.WorksheetNotFound:
+            return None
+        self._stats_rows_written = len(values)
+        return rows_to_aggregates(values)
+    
+    def _save_stats(self, data: Dict[str, Any]):
+        """Overwrite the statistics worksheet with one update (blank rows clear stale keys)"""
+        rows = aggregates_to_rows(data)
+        padded = rows + [["", ""]] * max(0, self._stats_rows_written - len(rows))
+        self._stats_worksheet().update(padded, "A1")
+        self._stats_rows_written = len(rows)
+    
+    def _row_to_record(self, values: List[Any]) -> Dict[str, Any]:
+        """Convert raw row values to the record shape returned by get_all_records"""
+        values = gspread.utils.numericise_all(list(values))
+        values += [""] * (len(SHEET_HEADERS) - len(values))
+        return dict(zip(SHEET_HEADERS, values))
+    
+    def insert_rows(self, rows: List[List[Any]]) -> int:
+        """Bulk upsert prepared rows with at most one append and one update call per shard"""
+        if not rows:
+            return 0
+        return self._upsert_rows(rows)
+    
+    def _upsert_rows(self, rows: List[List[Any]]) -> int:
+        """Append new sessions and overwrite known ones in place; returns the number of rows written"""
+        # The last row per session wins, so a batch never writes one session twice
+        latest = {row[SESSION_ID_COLUMN - 1]: row for row in rows}
+        self.catalog.ensure_loaded()
         
-        return "\n".join(formatted)
-    
-    def _calculate_average_sentiment(self, chat_history: List[dict]) -> float:
-        """Calculate average sentiment score across user messages using TextBlob."""
-        if not chat_history:
-            return 0.0
-        user_msgs = [m for m in chat_history if m.get("role") == "user" and m.get("content", "").strip()]
-        if not user_msgs:
-            return 0.0
-
-        # Use existing SentimentAnalyzer for consistency
-        scores = []
-        for m in user_msgs:
-            analysis = self.sentiment_analyzer.analyze_sentiment(m["content"])
-            scores.append(analysis.sentiment_score)
-        if not scores:
-            return 0.0
-        return round(sum(scores) / len(scores), 3)
-    
-    def _calculate_questions_answered(self, technical_questions_data) -> str:
-        """Calculate questions answered in format like '5/5'"""
-        if not technical_questions_data:
-            return "0/0"
+        existing = self._current_rows(list(latest))
+        last_column = column_letter(SHEET_HEADERS[-1])
+        status_column = SHEET_HEADERS.index("Status")
+        for shard, located, old_rows in existing:
+            new_rows = []
+            for session_id, old_row in zip(located, old_rows):
+                row = list(latest[session_id])
+                # Status belongs to HR once the row exists, so a re-save never resets it
+                if len(old_row) > status_column and old_row[status_column] != "":
+                    row[status_column] = old_row[status_column]
+                new_rows.append(row)
+            shard.worksheet.batch_update(
+                [
+                    {"range": f"A{row}:{last_column}{row}", "values": [new_row]}
+                    for row, new_row in zip(located.values(), new_rows)
+                ],
+                value_input_option='RAW',
+            )
+            if self.snapshot:
+                self.snapshot.replace_rows(new_rows)
+            self.blind_indexes.record_rows(new_rows)
+            if self.stats:
+                self.stats.record_rows(old_rows, sign=-1)
+                self.stats.record_rows(new_rows)
         
-        # Handle both dict format (from session) and list format
-        if isinstance(technical_questions_data, dict):
-            total_questions = len(technical_questions_data.get('questions', []))
-            answered_questions = len(technical_questions_data.get('responses', []))
-        else:
-            # Fallback for list format
-            total_questions = len(technical_questions_data) if technical_questions_data else 0
-            answered_questions = total_questions  # Assume all answered if in list format
+        updated = {session_id for _, located, _ in existing for session_id in located}
+        groups: Dict[str, Tuple[CandidateShard, List[List[Any]]]] = {}
+        for session_id, row in latest.items():
+            if session_id not in updated:
+                shard = self.catalog.shard_for_row(row)
+                groups.setdefault(shard.key, (shard, []))[1].append(row)
         
-        return f"{answered_questions}/{total_questions}"
+        for shard, group in groups.values():
+            response = shard.worksheet.append_rows(group, value_input_option='RAW')
+            self.catalog.record_append(
+                shard, [row[SESSION_ID_COLUMN - 1] for row in group], parse_append_start_row(response)
+            )
+            self._record_new_rows(group)
+            self.blind_indexes.record_rows(group)
+        return len(latest)
+    
+    def _current_rows(
+        self, session_ids: List[str]
+    ) -> List[Tuple[CandidateShard, Dict[str, int], List[List[Any]]]]:
+        """Sessions that already have a row, grouped by shard with their row numbers and current values"""
+        for _ in range(2):
+            groups: Dict[str, Tuple[CandidateShard, List[str]]] = {}
+            for session_id in session_ids:
+                shard = self.catalog.known_shard(session_id)
+                if shard:
+                    groups.setdefault(shard.key, (shard, []))[1].append(session_id)
+            located = [(shard, shard.row_index.rows_for(ids)) for shard, ids in groups.values()]
+            located = [(shard, rows) for shard, rows in located if rows]
+            current = self.catalog.map(
+                lambda item: self._batch_read_rows(item[0], list(item[1].values())), located
+            )
+            # Verify before overwriting: another process may have shifted rows since the index was read
+            if all(
+                values[SESSION_ID_COLUMN - 1:SESSION_ID_COLUMN] == [session_id]
+                for (_, rows), part in zip(located, current)
+                for session_id, values in zip(rows, part)
+            ):
+                return [(shard, rows, part) for (shard, rows), part in zip(located, current)]
+            self.catalog.refresh()
+        raise RuntimeError("Candidate rows moved while saving; retry later")
     
+    def flush_pending_writes(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until queued rows have been written to the sheet"""
+        if not self.write_queue:
+            return True
+        return self.write_queue.flush(timeout)
+    
+    def _wait_for_pending(self, session_id: str):
+        """Flush queued rows first if this session's row has not reached the sheet yet"""
+        if self.write_queue and self.write_queue.is_pending(session_id):
+            self.write_queue.flush()
+    
+    @with_priority(Priority.ANALYTICS)
     def get_candidate_data(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve candidate data by session ID"""
         try:
-            # Get all records
-            records = self.sheet.get_all_records()
+            self._wait_for_pending(session_id)
             
-            # Find matching session
-            for record in records:
-                if record.get('Session_ID') == session_id:
-                    return record
+            shard, row, values = self._locate_row(session_id)
+            if row is None:
+                return None
             
-            return None
+            return self._row_to_record(values)
             
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to retrieve data: {str(e)}")
             return None
     
+    @with_priority(Priority.INTERACTIVE)
+    def find_by_email(self, email: str) -> List[Dict[str, Any]]:
+        """Find candidates by email through the blind index (no decryption scan)"""
+        return self._find_by_index("Email_Index", email_blind_index(email, self.blind_index_key or ""))
+    
+    @with_priority(Priority.INTERACTIVE)
+    def find_by_phone(self, phone: str) -> List[Dict[str, Any]]:
+        """Find candidates by phone number through the blind index (no decryption scan)"""
+        return self._find_by_index("Phone_Index", phone_blind_index(phone, self.blind_index_key or ""))
+    
+    def _find_by_index(self, column: str, value_hash: str) -> List[Dict[str, Any]]:
+        """Records of the sessions a blind index hash points to, read with one batch_get per shard"""
+        if not self.blind_index_key or not value_hash:
+            return []
+        try:
+            self.flush_pending_writes()
+            session_ids = self.blind_indexes.lookup(column, value_hash)
+            if not session_ids:
+                return []
+            self.catalog.ensure_loaded()
+            records = [
+                self._row_to_record(values)
+                for _, _, part in self._current_rows(session_ids)
+                for values in part
+            ]
+            # Verify against the row itself: the table may predate another process's update
+            return [record for record in records if record.get(column) == value_hash]
+            
+        except Exception as e:
+            self.connection.report_error(e)
+            st.error(f"Failed to look up candidates: {str(e)}")
+            return []
+    
+    def iter_records(self, page_size: int = 1000, after: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield records page by page, reading fixed-size row ranges (after a Session_ID's row if given)"""
+        self.flush_pending_writes()
+        # Scoped per read so the caller's code between pages keeps its own priority
+        with api_priority(Priority.EXPORT):
+            session_column = self._load_session_column()
+        last_row = len(session_column)
+        # The Session_ID column's header is row 1, so the row after the one at index i is i + 2
+        start_row = session_column.index(after) + 2 if after and after in session_column[1:] else 2
+        for first_row in range(start_row, last_row + 1, page_size):
+            with api_priority(Priority.EXPORT):
+                rows = self._fetch_rows(first_row, min(first_row + page_size - 1, last_row))
+            yield [self._row_to_record(values) for values in rows if values]
+    
+    @with_priority(Priority.ANALYTICS)
     def get_all_candidates(self) -> List[Dict[str, Any]]:
         """Get all candidate records"""
         try:
-            return self.sheet.get_all_records()
+            return self._read_records()
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to retrieve all candidates: {str(e)}")
             return []
     
+    @with_priority(Priority.STATUS_UPDATE)
     def update_candidate_status(self, session_id: str, new_status: str) -> bool:
         """Update candidate status"""
         try:
-            # Find the row with matching session_id
-            records = self.sheet.get_all_records()
+            self._wait_for_pending(session_id)
             
-            for i, record in enumerate(records, start=2):  # Start from row 2 (after headers)
-                if record.get('Session_ID') == session_id:
-                    # Update the status column (last column)
-                    self.sheet.update_cell(i, len(SHEET_HEADERS), new_status)
-                    return True
+            # Find the row with matching session_id
+            shard, row, values = self._locate_row(session_id)
+            if row is None:
+                return False
             
-            return False
+            # Update the status column
+            shard.worksheet.update_cell(row, STATUS_COLUMN, new_status)
+            if self.snapshot:
+                self.snapshot.patch(session_id, "Status", new_status)
+            if self.stats:
+                self.stats.record_status_changes([(row_stat_values(values)[0], new_status)])
+            return True
             
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to update status: {str(e)}")
             return False
     
+    @with_priority(Priority.STATUS_UPDATE)
     def delete_candidate_data(self, session_id: str) -> bool:
         """Delete candidate data (for GDPR compliance)"""
         try:
-            # Find and delete the row with matching session_id
-            records = self.sheet.get_all_records()
+            self._wait_for_pending(session_id)
+            # Drop the local copy too, even if the row never reached the sheet, so it is not replayed
+            if self.outbox:
+                self.outbox.remove([session_id])
+            # Shred first: the key must go even when the row only ever existed in the outbox
+            self.gdpr_compliance.shred([session_id])
             
-            for i, record in enumerate(records, start=2):  # Start from row 2
-                if record.get('Session_ID') == session_id:
-                    self.sheet.delete_rows(i)
-                    return True
+            # Find and delete the row with matching session_id
+            shard, row, values = self._locate_row(session_id)
+            if row is None:
+                return False
             
-            return False
+            shard.worksheet.delete_rows(row)
+            shard.row_index.record_delete(row)
+            self.catalog.forget([session_id])
+            self.blind_indexes.forget([session_id])
+            if self.snapshot:
+                self.snapshot.remove(session_id)
+            if self.stats:
+                self.stats.record_rows([values], sign=-1)
+            return True
             
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to delete data: {str(e)}")
             return False
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get basic statistics from the data"""
+    def _locate_rows(self, session_ids: List[str]) -> List[Tuple[CandidateShard, Dict[str, int]]]:
+        """Rows of several sessions grouped by shard, from one fresh read of the Session_ID columns"""
+        if self.write_queue and any(self.write_queue.is_pending(sid) for sid in session_ids):
+            self.write_queue.flush()
+        self.catalog.refresh()
+        
+        groups: Dict[str, Tuple[CandidateShard, List[str]]] = {}
+        for session_id in session_ids:
+            shard = self.catalog.known_shard(session_id)
+            if shard:
+                groups.setdefault(shard.key, (shard, []))[1].append(session_id)
+        return [(shard, shard.row_index.rows_for(ids)) for shard, ids in groups.values()]
+    
+    @with_priority(Priority.STATUS_UPDATE)
+    def delete_many(self, session_ids: List[str]) -> int:
+        """Delete several candidates with one batch_update across shards (bottom-most rows first)"""
         try:
-            records = self.sheet.get_all_records()
-            
-            if not records:
-                return {
-                    "total_candidates": 0,
-                    "completed_interviews": 0,
-                    "average_experience": 0,
-                    "top_tech_stacks": []
+            session_ids = list(session_ids)
+            located = self._locate_rows(session_ids)
+            # Drop the local copies too, even for rows that never reached the sheet, so they are not replayed
+            if self.outbox:
+                self.outbox.remove(session_ids)
+            # Shred every requested session, including ones that never reached the sheet
+            self.gdpr_compliance.shred(session_ids)
+            if not located:
+                return 0
+            
+            # Read the doomed rows (one call per shard) so the statistics can count them out
+            deleted_rows = []
+            if self.stats:
+                parts = self.catalog.map(
+                    lambda item: self._batch_read_rows(item[0], list(item[1].values())), located
+                )
+                deleted_rows = [row for part in parts for row in part]
+            
+            requests = [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": shard.worksheet.id,
+                            "dimension": "ROWS",
+                            "startIndex": start - 1,
+                            "endIndex": end,
+                        }
+                    }
                 }
+                for shard, rows in located
+                for start, end in descending_row_ranges(rows.values())
+            ]
+            self.sheet.spreadsheet.batch_update({"requests": requests})
+            
+            deleted_ids = []
+            for shard, rows in located:
+                shard.row_index.record_delete_many(rows.values())
+                deleted_ids.extend(rows)
+            self.catalog.forget(deleted_ids)
+            self.blind_indexes.forget(deleted_ids)
+            if self.snapshot:
+                self.snapshot.remove_many(deleted_ids)
+            if self.stats:
+                self.stats.record_rows(deleted_rows, sign=-1)
+            return len(deleted_ids)
             
-            # Calculate statistics
-            total = len(records)
-            completed = len([r for r in records if r.get('Status') == 'completed'])
+        except Exception as e:
+            self.connection.report_error(e)
+            st.error(f"Failed to delete data: {str(e)}")
+            return 0
+    
+    @with_priority(Priority.STATUS_UPDATE)
+    def update_status_many(self, statuses: Dict[str, str]) -> int:
+        """Set several candidates' status with one batch_update per shard"""
+        try:
+            located = self._locate_rows(list(statuses))
+            if not located:
+                return 0
+            
+            status_column = column_letter("Status")
+            
+            def update_shard(item) -> List[Tuple[str, str]]:
+                shard, rows = item
+                old_statuses = [""] * len(rows)
+                if self.stats:
+                    value_ranges = shard.worksheet.batch_get([f"{status_column}{row}" for row in rows.values()])
+                    old_statuses = [vr[0][0] if vr and vr[0] else "" for vr in value_ranges]
+                shard.worksheet.batch_update([
+                    {"range": f"{status_column}{row}", "values": [[statuses[session_id]]]}
+                    for session_id, row in rows.items()
+                ])
+                return list(zip(old_statuses, (statuses[sid] for sid in rows)))
+            
+            changes = [change for part in self.catalog.map(update_shard, located) for change in part]
+            updated = [sid for _, rows in located for sid in rows]
+            
+            if self.snapshot:
+                self.snapshot.patch_many("Status", {sid: statuses[sid] for sid in updated})
+            if self.stats:
+                self.stats.record_status_changes(changes)
+            return len(updated)
             
-            # Average experience
-            exp_values = []
-            for record in records:
-                try:
-                    exp = float(record.get('Experience_Years', 0))
-                    exp_values.append(exp)
-                except (ValueError, TypeError):
-                    continue
-            
-            avg_exp = sum(exp_values) / len(exp_values) if exp_values else 0
-            
-            # Top tech stacks
-            tech_counts = {}
-            for record in records:
-                tech_stack = record.get('Tech_Stack', '')
-                if tech_stack:
-                    techs = [t.strip() for t in tech_stack.split(',')]
-                    for tech in techs:
-                        tech_counts[tech] = tech_counts.get(tech, 0) + 1
-            
-            top_techs = sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            
-            return {
-                "total_candidates": total,
-                "completed_interviews": completed,
-                "completion_rate": (completed / total * 100) if total > 0 else 0,
-                "average_experience": round(avg_exp, 1),
-                "top_tech_stacks": top_techs
-            }
+        except Exception as e:
+            self.connection.report_error(e)
+            st.error(f"Failed to update status: {str(e)}")
+            return 0
+    
+    @with_priority(Priority.ANALYTICS)
+    def get_columns(self, names: List[str]) -> Dict[str, np.ndarray]:
+        """Fetch only the named columns (one batch_get per shard, in parallel), as typed arrays"""
+        # Session_ID is always fetched: it is never blank, so it fixes each shard's row count
+        fetch = ["Session_ID"] + [name for name in names if name != "Session_ID"]
+        
+        def fetch_shard(shard: CandidateShard) -> Dict[str, np.ndarray]:
+            value_ranges = shard.worksheet.batch_get(
+                [column_range(name) for name in fetch], major_dimension="COLUMNS"
+            )
+            raw = {}
+            for name, value_range in zip(fetch, value_ranges):
+                raw[name] = value_range[0] if value_range and value_range[0] else []
+            length = len(raw["Session_ID"])
+            return {name: to_typed_column(name, raw[name], length) for name in names}
+        
+        parts = self.catalog.map(fetch_shard)
+        return {name: np.concatenate([part[name] for part in parts]) for name in names}
+    
+    def api_metrics(self) -> Dict[str, Any]:
+        """Scheduler queue wait times and throttling counters for this spreadsheet"""
+        return self.scheduler.metrics()
+    
+    @with_priority(Priority.ANALYTICS)
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get basic statistics from the data"""
+        try:
+            if self.stats:
+                return self.stats.statistics()
+            return compute_statistics(self._read_columns(STATISTICS_COLUMNS))
             
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to get statistics: {str(e)}")
             return {}
     
+    @with_priority(Priority.EXPORT)
     def export_data(self, format_type: str = "csv") -> Optional[str]:
         """Export data in specified format"""
         try:
-            records = self.sheet.get_all_records()
-            
-            if format_type.lower() == "csv":
-                import csv
-                import io
-                
-                output = io.StringIO()
-                if records:
-                    writer = csv.DictWriter(output, fieldnames=records[0].keys())
-                    writer.writeheader()
-                    writer.writerows(records)
-                
-                return output.getvalue()
-            
-            elif format_type.lower() == "json":
-                import json
-                return json.dumps(records, indent=2, default=str)
-            
-            else:
-                return None
+            return format_export(self._read_records(), format_type)
                 
         except Exception as e:
+            self.connection.report_error(e)
             st.error(f"Failed to export data: {str(e)}")
             return None
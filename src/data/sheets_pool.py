@@ -0,0 +1,128 @@
+"""
+Shared Google Sheets Connections for TalentScout Hiring Assistant
+Process-wide, thread-safe worksheet connections opened once and reused by every session
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import gspread
+import requests
+
+from src.data.quota_scheduler import QuotaScheduler, ScheduledProxy
+from src.data.shard_catalog import ShardCatalog
+
+# API errors that mean the connection itself is bad rather than the request
+RECONNECT_STATUS_CODES = {401, 403}
+
+
+def is_connection_error(error: Exception) -> bool:
+    """Whether an error should drop the shared connection so the next call reconnects"""
+    if isinstance(error, gspread.exceptions.APIError):
+        return error.code in RECONNECT_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+class SheetsConnection:
+    """Lazily (re)connected worksheet shared by all sessions writing to one spreadsheet"""
+
+    def __init__(
+        self,
+        sheet_id: str,
+        client_factory: Callable[[], Any],
+        index_column: int,
+        prepare: Optional[Callable[[Any], None]] = None,
+        health_check_interval: float = 300.0,
+        shard_by: Optional[str] = None,
+        read_quota_per_minute: Optional[int] = None,
+        write_quota_per_minute: Optional[int] = None,
+    ):
+        self.sheet_id = sheet_id
+        self.client_factory = client_factory
+        self.prepare = prepare
+        self.health_check_interval = health_check_interval
+
+        self.client = None
+        self._sheet = None
+        self._last_check = 0.0
+        self._lock = threading.RLock()
+
+        # Every API call made through this connection is admitted by one shared scheduler
+        self.scheduler = QuotaScheduler(read_quota_per_minute, write_quota_per_minute)
+
+        # Session_ID -> shard and row number, shared so each session does not rebuild it
+        self.catalog = ShardCatalog(lambda: self.sheet, index_column, shard_by)
+
+    @property
+    def sheet(self):
+        """The worksheet, connecting (or reconnecting) on demand"""
+        sheet = self._sheet
+        if sheet is not None and time.monotonic() - self._last_check < self.health_check_interval:
+            return sheet
+        with self._lock:
+            if self._sheet is None:
+                self._connect()
+            elif time.monotonic() - self._last_check >= self.health_check_interval:
+                self._check_health()
+            return self._sheet
+
+    @property
+    def connected(self) -> bool:
+        """Whether a worksheet is currently open"""
+        return self._sheet is not None
+
+    def _connect(self):
+        """Authorize, open the spreadsheet and prepare the worksheet"""
+        if self.client is None:
+            self.client = ScheduledProxy(self.client_factory(), self.scheduler)
+        sheet = self.client.open_by_key(self.sheet_id).sheet1
+        if self.prepare:
+            self.prepare(sheet)
+        self._sheet = sheet
+        self._last_check = time.monotonic()
+        self.catalog.invalidate()
+        print(f"✅ Google Sheets connection opened: {self.sheet_id}")
+
+    def _check_health(self):
+        """Refresh an expiring token and probe the worksheet, reconnecting if either fails"""
+        try:
+            self._refresh_token()
+            self._sheet.row_values(1)
+            self._last_check = time.monotonic()
+        except Exception as e:
+            print(f"⚠️ Google Sheets health check failed, reconnecting: {str(e)}")
+            self.client = None
+            self._sheet = None
+            self._connect()
+
+    def _refresh_token(self):
+        """Refresh the OAuth token up front so concurrent requests do not all refresh it"""
+        http_client = getattr(self.client, "http_client", None)
+        credentials = getattr(http_client, "auth", None)
+        if credentials is not None and hasattr(credentials, "valid") and not credentials.valid:
+            from google.auth.transport.requests import Request
+            credentials.refresh(Request())
+
+    def report_error(self, error: Exception):
+        """Drop the connection after auth or transport failures; the next call reconnects"""
+        if is_connection_error(error):
+            with self._lock:
+                self.client = None
+                self._sheet = None
+            print(f"⚠️ Google Sheets connection reset: {str(error)}")
+
+
+# Process-wide connections, one per spreadsheet (and injected client)
+_connections: Dict[str, SheetsConnection] = {}
+_registry_lock = threading.Lock()
+
+
+def get_connection(key: str, **kwargs) -> SheetsConnection:
+    """Get the shared connection for a key, creating it on first use"""
+    with _registry_lock:
+        connection = _connections.get(key)
+        if connection is None:
+            connection = SheetsConnection(**kwargs)
+            _connections[key] = connection
+        return connection
@@ -0,0 +1,274 @@
+"""
+Candidate Snapshot Cache for TalentScout Hiring Assistant
+Mirrors the candidate sheet into a local columnar .npz file refreshed incrementally
+"""
+
+import atexit
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.config.settings import SHEET_HEADERS
+from src.data.projection import NUMERIC_COLUMNS, to_typed_column
+
+# Text columns are stored as concatenated utf-8 bytes plus end offsets, so no cell is padded
+TEXT_DATA_SUFFIX = ".utf8"
+TEXT_OFFSETS_SUFFIX = ".offsets"
+
+
+class CandidateSnapshot:
+    """Local columnar copy of the candidate sheet"""
+
+    def __init__(
+        self,
+        path: str,
+        load_session_column: Callable[[], List[str]],
+        fetch_rows: Callable[[int, int], List[List[Any]]],
+        refresh_interval: float = 30.0,
+        full_resync_interval: float = 3600.0,
+        save_delay: float = 5.0,
+    ):
+        self.path = path
+        self.load_session_column = load_session_column
+        self.fetch_rows = fetch_rows
+        self.refresh_interval = refresh_interval
+        self.full_resync_interval = full_resync_interval
+        # Writes only mark the snapshot dirty; one background save covers every write in this window
+        self.save_delay = save_delay
+
+        self.columns: Dict[str, np.ndarray] = self._build_columns([])
+        self._last_refresh = 0.0
+        self._last_full_resync = 0.0
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._load()
+
+    @property
+    def row_count(self) -> int:
+        """Number of candidate rows in the snapshot"""
+        return len(self.columns["Session_ID"])
+
+    def refresh(self, force: bool = False):
+        """Bring the snapshot up to date, fetching only rows appended since the last refresh"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.refresh_interval:
+                return
+
+            sheet_ids = self.load_session_column()[1:]
+            cached_ids = self.columns["Session_ID"]
+            count = len(cached_ids)
+
+            needs_full = (
+                now - self._last_full_resync >= self.full_resync_interval
+                or len(sheet_ids) < count
+                or list(sheet_ids[:count]) != cached_ids.tolist()
+            )
+            if needs_full:
+                # Rows were deleted or shifted underneath us - rebuild from scratch
+                rows = self.fetch_rows(2, len(sheet_ids) + 1) if sheet_ids else []
+                self.columns = self._build_columns(rows, len(sheet_ids))
+                self._last_full_resync = now
+                self._save()
+            elif len(sheet_ids) > count:
+                rows = self.fetch_rows(count + 2, len(sheet_ids) + 1)
+                new_columns = self._build_columns(rows, len(sheet_ids) - count)
+                self.columns = {
+                    name: np.concatenate([self.columns[name], new_columns[name]])
+                    for name in SHEET_HEADERS
+                }
+                self._save()
+
+            self._last_refresh = now
+
+    def get_columns(self, names: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Typed columns from the snapshot"""
+        with self._lock:
+            return {name: self.columns[name] for name in (names or SHEET_HEADERS)}
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Rows in the shape returned by get_all_records"""
+        with self._lock:
+            columns = [self._record_values(name) for name in SHEET_HEADERS]
+        return [dict(zip(SHEET_HEADERS, values)) for values in zip(*columns)]
+
+    def patch(self, session_id: str, column: str, value: Any):
+        """Apply a local cell update so it is visible before the next full resync"""
+        self.patch_many(column, {session_id: value})
+
+    def patch_many(self, column: str, values: Dict[str, Any]):
+        """Apply local updates to one column for several sessions, saving once"""
+        with self._lock:
+            positions = {sid: i for i, sid in enumerate(self.columns["Session_ID"].tolist())}
+            changed = False
+            for session_id, value in values.items():
+                position = positions.get(session_id)
+                if position is not None:
+                    self.columns[column][position] = to_typed_column(column, [value], 1)[0]
+                    changed = True
+            if changed:
+                self._save()
+
+    def replace_rows(self, rows: List[List[Any]]):
+        """Apply locally overwritten rows (SHEET_HEADERS order), saving once"""
+        with self._lock:
+            positions = {sid: i for i, sid in enumerate(self.columns["Session_ID"].tolist())}
+            new_columns = self._build_columns(rows)
+            changed = False
+            for i, session_id in enumerate(new_columns["Session_ID"].tolist()):
+                position = positions.get(session_id)
+                if position is not None:
+                    for name in SHEET_HEADERS:
+                        self.columns[name][position] = new_columns[name][i]
+                    changed = True
+            if changed:
+                self._save()
+
+    def remove(self, session_id: str):
+        """Drop a locally deleted row so the next refresh does not need a full resync"""
+        self.remove_many([session_id])
+
+    def remove_many(self, session_ids: List[str]):
+        """Drop several locally deleted rows, saving once"""
+        with self._lock:
+            keep = ~np.isin(self.columns["Session_ID"], list(session_ids))
+            if not keep.all():
+                self.columns = {name: column[keep] for name, column in self.columns.items()}
+                self._save()
+
+    def flush(self):
+        """Write pending changes to disk now"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            # Copies, because patches update the column arrays in place
+            columns = {name: column.copy() for name, column in self.columns.items()}
+            self._dirty = False
+        try:
+            self._write(columns)
+        except Exception as e:
+            with self._lock:
+                self._dirty = True
+            print(f"⚠️ Failed to save snapshot {self.path}: {str(e)}")
+
+    def _record_values(self, name: str) -> List[Any]:
+        """Column values converted back to sheet-style scalars"""
+        column = self.columns[name]
+        if name not in NUMERIC_COLUMNS:
+            return column.tolist()
+        return [
+            "" if np.isnan(v) else (int(v) if float(v).is_integer() else float(v))
+            for v in column
+        ]
+
+    def _build_columns(self, rows: List[List[Any]], length: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Transpose raw sheet rows into typed columns"""
+        length = len(rows) if length is None else length
+        rows = [list(row) + [""] * (len(SHEET_HEADERS) - len(row)) for row in rows]
+        return {
+            name: to_typed_column(name, [row[i] for row in rows], length)
+            for i, name in enumerate(SHEET_HEADERS)
+        }
+
+    def _load(self):
+        """Load the snapshot file if one exists and matches the current headers"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                names = {name.split(".", 1)[0] for name in data.files}
+                if names != set(SHEET_HEADERS):
+                    return
+                self.columns = {
+                    name: data[name] if name in NUMERIC_COLUMNS else self._decode_text(data, name)
+                    for name in SHEET_HEADERS
+                }
+            self._last_full_resync = time.monotonic()
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable snapshot {self.path}: {str(e)}")
+
+    @staticmethod
+    def _decode_text(data, name: str) -> np.ndarray:
+        """Object array of one text column (older snapshots stored fixed-width unicode)"""
+        if name + TEXT_OFFSETS_SUFFIX not in data.files:
+            return data[name].astype(object)
+        raw = data[name + TEXT_DATA_SUFFIX].tobytes()
+        ends = data[name + TEXT_OFFSETS_SUFFIX].tolist()
+        column = np.empty(len(ends), dtype=object)
+        column[:] = [raw[start:end].decode("utf-8") for start, end in zip([0] + ends[:-1], ends)]
+        return column
+
+    @staticmethod
+    def _encode_text(column: np.ndarray) -> Dict[str, np.ndarray]:
+        """Variable-length utf-8 bytes and end offsets for one text column"""
+        encoded = ["" if value is None else str(value) for value in column.tolist()]
+        encoded = [value.encode("utf-8") for value in encoded]
+        return {
+            TEXT_DATA_SUFFIX: np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            TEXT_OFFSETS_SUFFIX: np.cumsum([len(value) for value in encoded], dtype=np.int64),
+        }
+
+    def _save(self):
+        """Mark the snapshot dirty and schedule one debounced background write"""
+        self._dirty = True
+        if self.save_delay <= 0:
+            self.flush()
+        elif self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _write(self, columns: Dict[str, np.ndarray]):
+        """Write a set of columns to the snapshot file atomically"""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        arrays = {}
+        for name, column in columns.items():
+            if name in NUMERIC_COLUMNS:
+                arrays[name] = column
+            else:
+                for suffix, array in self._encode_text(column).items():
+                    arrays[name + suffix] = array
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+# Process-wide snapshots, one per cache file
+_snapshots: Dict[str, CandidateSnapshot] = {}
+_registry_lock = threading.Lock()
+
+
+def get_snapshot(path: str, **kwargs) -> CandidateSnapshot:
+    """Get the shared snapshot for a cache file, loading it on first use"""
+    key = os.path.abspath(path)
+    with _registry_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = CandidateSnapshot(path, **kwargs)
+            _snapshots[key] = snapshot
+        return snapshot
+
+
+def flush_snapshots():
+    """Write every snapshot with pending changes (runs at interpreter exit)"""
+    with _registry_lock:
+        snapshots = list(_snapshots.values())
+    for snapshot in snapshots:
+        snapshot.flush()
+
+
+atexit.register(flush_snapshots)
@@ -0,0 +1,408 @@
+"""
+SQLite Candidate Store for TalentScout Hiring Assistant
+Indexed local system of record implementing the CandidateStore interface
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import numpy as np
+import streamlit as st
+from src.config.settings import BLIND_INDEX_COLUMNS, SHEET_HEADERS
+from src.data.candidate_store import CandidateStore, format_export
+from src.data.models import ConversationSession
+from src.data.projection import NUMERIC_COLUMNS, to_typed_column
+from src.data.blind_index import email_blind_index, phone_blind_index
+from src.data.data_keys import get_data_key_store
+from src.data.outbox import get_outbox, start_replayer
+from src.data.row_builder import CandidateRowBuilder
+from src.data.stats_materializer import get_stats_materializer, release_stats_materializer
+from src.utils.gdpr_compliance import GDPRCompliance
+
+# Blind index columns for encrypted email and phone lookups
+EMAIL_INDEX_COLUMN = "Email_Index"
+PHONE_INDEX_COLUMN = "Phone_Index"
+
+# Set when a row is first written, then changed only by HR
+STATUS_COLUMN = "Status"
+
+
+def _quote(name: str) -> str:
+    """Quote a column name for SQL"""
+    return f'"{name}"'
+
+
+class _SharedConnection:
+    """One WAL connection and its lock, shared by every store opened on the same file"""
+
+    def __init__(self, db_path: str):
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.Lock()
+        self.refs = 0
+
+
+# Process-wide connections, one per database file
+_connections: Dict[str, _SharedConnection] = {}
+_connections_lock = threading.Lock()
+
+
+def _acquire_connection(db_path: str) -> _SharedConnection:
+    """Get the shared connection for a database file, opening it on first use"""
+    key = os.path.abspath(db_path)
+    with _connections_lock:
+        shared = _connections.get(key)
+        if shared is None:
+            shared = _SharedConnection(db_path)
+            _connections[key] = shared
+        shared.refs += 1
+        return shared
+
+
+def _release_connection(db_path: str) -> Optional[_SharedConnection]:
+    """Drop one reference to a shared connection; returns it (for closing) once unused"""
+    key = os.path.abspath(db_path)
+    with _connections_lock:
+        shared = _connections.get(key)
+        if shared is None:
+            return None
+        shared.refs -= 1
+        if shared.refs > 0:
+            return None
+        del _connections[key]
+        return shared
+
+
+class SQLiteCandidateStore(CandidateStore):
+    """Stores candidate rows in an indexed SQLite table"""
+
+    def __init__(
+        self,
+        db_path: str,
+        blind_index_key: str,
+        stats_reconcile_interval: float = 600.0,
+        data_key_store_path: Optional[str] = None,
+        outbox_path: Optional[str] = None,
+        replay_interval: float = 30.0,
+    ):
+        self.db_path = db_path
+        self.blind_index_key = blind_index_key
+        # Envelope encryption: each candidate's fields use their own data key, so erasure is one key delete
+        self.gdpr_compliance = GDPRCompliance(
+            data_keys=get_data_key_store(data_key_store_path) if data_key_store_path else None
+        )
+        self.row_builder = CandidateRowBuilder(self.gdpr_compliance, blind_index_key)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._shared = _acquire_connection(db_path)
+        self._conn = self._shared.conn
+        self._lock = self._shared.lock
+        self._closed = False
+        self._create_schema()
+        
+        # Running aggregates persisted in candidate_stats so get_statistics is a single-row read
+        self._stats_key = f"sqlite:{os.path.abspath(db_path)}"
+        self.stats = get_stats_materializer(
+            self._stats_key,
+            load_fn=self._load_stats,
+            save_fn=self._save_stats,
+            scan_fn=self.get_columns,
+            reconcile_interval=stats_reconcile_interval,
+            persist_interval=0.0,
+        )
+
+        # Rows saved to the local outbox while no store was available are drained into the table
+        self.outbox = get_outbox(outbox_path) if outbox_path else None
+        if self.outbox:
+            start_replayer(
+                self._stats_key,
+                self.outbox,
+                deliver_fn=self._deliver_outbox_rows,
+                interval=replay_interval,
+            )
+
+    def _create_schema(self):
+        """Create the candidates table and its indexes"""
+        columns = [
+            f"{_quote(name)} {'REAL' if name in NUMERIC_COLUMNS else 'TEXT'}"
+            + (" NOT NULL UNIQUE" if name == "Session_ID" else "")
+            for name in SHEET_HEADERS
+        ]
+        with self._lock, self._conn:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS candidates ({', '.join(columns)})")
+            # Databases created before a column was added to the layout get it appended
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(candidates)")}
+            for name in SHEET_HEADERS:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE candidates ADD COLUMN {_quote(name)} TEXT")
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_candidates_timestamp ON candidates ("Timestamp")')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_candidates_status ON candidates ("Status")')
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_candidates_email_index ON candidates ({_quote(EMAIL_INDEX_COLUMN)})')
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS idx_candidates_phone_index ON candidates ({_quote(PHONE_INDEX_COLUMN)})')
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS candidate_stats ("
+                "id INTEGER PRIMARY KEY CHECK (id = 1), aggregates TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+    
+    def _load_stats(self) -> Optional[tuple]:
+        """Read the persisted aggregates row"""
+        with self._lock:
+            row = self._conn.execute("SELECT aggregates, updated_at FROM candidate_stats WHERE id = 1").fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+    
+    def _save_stats(self, data: Dict[str, Any]):
+        """Persist the aggregates row"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO candidate_stats (id, aggregates, updated_at) VALUES (1, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET aggregates = excluded.aggregates, updated_at = excluded.updated_at",
+                (json.dumps(data), time.time()),
+            )
+    
+    def _stat_values(self, session_ids: List[str]) -> Dict[str, tuple]:
+        """Current (Status, Experience_Years, Tech_Stack) of existing sessions"""
+        found = {}
+        session_ids = list(session_ids)
+        with self._lock:
+            for start in range(0, len(session_ids), 500):
+                chunk = session_ids[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                for row in self._conn.execute(
+                    f'SELECT "Session_ID", "Status", "Experience_Years", "Tech_Stack" '
+                    f'FROM candidates WHERE "Session_ID" IN ({placeholders})', chunk
+                ):
+                    found[row[0]] = row[1:]
+        return found
+
+    def _upsert(self, rows: List[List[Any]]):
+        """Insert rows, replacing any existing row with the same Session_ID (its Status is kept)"""
+        placeholders = ", ".join("?" for _ in SHEET_HEADERS)
+        # Rows written without a blind index (no key configured, older bulk rows) keep the stored one;
+        # Status belongs to HR once the row exists, so a re-save never resets it
+        updates = ", ".join(
+            f"{_quote(name)} = COALESCE(NULLIF(excluded.{_quote(name)}, ''), candidates.{_quote(name)})"
+            if name in BLIND_INDEX_COLUMNS else f"{_quote(name)} = excluded.{_quote(name)}"
+            for name in SHEET_HEADERS if name not in ("Session_ID", STATUS_COLUMN)
+        )
+        sql = (
+            f"INSERT INTO candidates ({', '.join(_quote(n) for n in SHEET_HEADERS)}) VALUES ({placeholders}) "
+            f'ON CONFLICT("Session_ID") DO UPDATE SET {updates}'
+        )
+        params = {}
+        session_column = SHEET_HEADERS.index("Session_ID")
+        for row in rows:
+            values = list(row) + [""] * (len(SHEET_HEADERS) - len(row))
+            params[values[session_column]] = values[:len(SHEET_HEADERS)]
+        
+        replaced = self._stat_values(params)
+        status_column = SHEET_HEADERS.index(STATUS_COLUMN)
+        for session_id, (status, _, _) in replaced.items():
+            params[session_id][status_column] = status
+        with self._lock, self._conn:
+            self._conn.executemany(sql, list(params.values()))
+        
+        # Replaced rows are counted out before their new values are counted in
+        self.stats.record_values(replaced.values(), sign=-1)
+        self.stats.record_rows(params.values())
+
+    def save_candidate_data(self, session: ConversationSession) -> bool:
+        """Save candidate data to the SQLite store"""
+        try:
+            row_data = self.row_builder.build_row(session)
+            if row_data is None:
+                return False
+
+            self._upsert([row_data])
+            return True
+
+        except Exception as e:
+            st.error(f"Failed to save data to database: {str(e)}")
+            return False
+
+    def insert_rows(self, rows: List[List[Any]]) -> int:
+        """Bulk insert prepared rows in a single transaction"""
+        if not rows:
+            return 0
+        self._upsert(rows)
+        return len(rows)
+
+    def _deliver_outbox_rows(self, items: List[Tuple[str, List[Any]]]):
+        """Upsert replayed outbox rows (Session_ID is unique, so a repeated delivery is harmless)"""
+        self._upsert([row for _, row in items])
+        self.outbox.mark_sent(session_id for session_id, _ in items)
+
+    def _records(self, where: str = "", params: tuple = ()) -> List[Dict[str, Any]]:
+        """Fetch rows as sheet-style records"""
+        columns = ", ".join(_quote(name) for name in SHEET_HEADERS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM candidates {where} ORDER BY rowid", params
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
+
+    def _to_record(self, row: tuple) -> Dict[str, Any]:
+        """Convert a database row to the record shape returned by get_all_records"""
+        record = {}
+        for name, value in zip(SHEET_HEADERS, row):
+            if value is None:
+                value = ""
+            elif isinstance(value, float) and value.is_integer():
+                value = int(value)
+            record[name] = value
+        return record
+
+    def get_candidate_data(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve candidate data by session ID"""
+        try:
+            records = self._records('WHERE "Session_ID" = ?', (session_id,))
+            return records[0] if records else None
+        except Exception as e:
+            st.error(f"Failed to retrieve data: {str(e)}")
+            return None
+
+    def iter_records(self, page_size: int = 1000, after: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield records in rowid order, one keyset-paginated query per page (after a Session_ID's row if given)"""
+        columns = ", ".join(_quote(name) for name in SHEET_HEADERS)
+        last_rowid = 0
+        if after:
+            with self._lock:
+                found = self._conn.execute('SELECT rowid FROM candidates WHERE "Session_ID" = ?', (after,)).fetchone()
+            last_rowid = found[0] if found else 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT rowid, {columns} FROM candidates WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, page_size),
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield [self._to_record(row[1:]) for row in rows]
+
+    def find_by_email(self, email: str) -> List[Dict[str, Any]]:
+        """Find candidates by email through the blind index (no decryption needed)"""
+        email_index = email_blind_index(email, self.blind_index_key)
+        if not email_index:
+            return []
+        return self._records(f"WHERE {_quote(EMAIL_INDEX_COLUMN)} = ?", (email_index,))
+
+    def find_by_phone(self, phone: str) -> List[Dict[str, Any]]:
+        """Find candidates by phone number through the blind index (no decryption needed)"""
+        phone_index = phone_blind_index(phone, self.blind_index_key)
+        if not phone_index:
+            return []
+        return self._records(f"WHERE {_quote(PHONE_INDEX_COLUMN)} = ?", (phone_index,))
+
+    def get_all_candidates(self) -> List[Dict[str, Any]]:
+        """Get all candidate records"""
+        try:
+            return self._records()
+        except Exception as e:
+            st.error(f"Failed to retrieve all candidates: {str(e)}")
+            return []
+
+    def update_candidate_status(self, session_id: str, new_status: str) -> bool:
+        """Update candidate status"""
+        return self.update_status_many({session_id: new_status}) > 0
+
+    def delete_candidate_data(self, session_id: str) -> bool:
+        """Delete candidate data (for GDPR compliance)"""
+        return self.delete_many([session_id]) > 0
+
+    def delete_many(self, session_ids: List[str]) -> int:
+        """Delete several candidates in one transaction"""
+        try:
+            session_ids = list(session_ids)
+            # Drop the local copies too, even for rows that never reached the table, so they are not replayed
+            if self.outbox:
+                self.outbox.remove(session_ids)
+            # Shred every requested session, even one whose row is already gone
+            self.gdpr_compliance.shred(session_ids)
+            existing = self._stat_values(session_ids)
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    'DELETE FROM candidates WHERE "Session_ID" = ?',
+                    [(session_id,) for session_id in existing],
+                )
+            self.stats.record_values(existing.values(), sign=-1)
+            return len(existing)
+        except Exception as e:
+            st.error(f"Failed to delete data: {str(e)}")
+            return 0
+
+    def update_status_many(self, statuses: Dict[str, str]) -> int:
+        """Set several candidates' status in one transaction"""
+        try:
+            existing = self._stat_values(list(statuses))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    'UPDATE candidates SET "Status" = ? WHERE "Session_ID" = ?',
+                    [(statuses[session_id], session_id) for session_id in existing],
+                )
+            self.stats.record_status_changes(
+                (values[0], statuses[session_id]) for session_id, values in existing.items()
+            )
+            return len(existing)
+        except Exception as e:
+            st.error(f"Failed to update status: {str(e)}")
+            return 0
+
+    def get_columns(self, names: List[str]) -> Dict[str, np.ndarray]:
+        """Fetch only the named columns, as typed arrays"""
+        columns = ", ".join(_quote(name) for name in names)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {columns} FROM candidates ORDER BY rowid").fetchall()
+        return {
+            name: to_typed_column(name, [row[i] for row in rows], len(rows))
+            for i, name in enumerate(names)
+        }
+
+    def get_columns_between(
+        self, column: str, start: Any, end: Any, names: List[str]
+    ) -> Dict[str, np.ndarray]:
+        """Named columns of rows whose column value (ISO text) falls in [start, end), read through its index"""
+        start, end = (value.isoformat() if hasattr(value, "isoformat") else str(value) for value in (start, end))
+        columns = ", ".join(_quote(name) for name in names)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM candidates WHERE {_quote(column)} >= ? AND {_quote(column)} < ? ORDER BY rowid",
+                (start, end),
+            ).fetchall()
+        return {
+            name: to_typed_column(name, [row[i] for row in rows], len(rows))
+            for i, name in enumerate(names)
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get basic statistics from the data"""
+        try:
+            return self.stats.statistics()
+        except Exception as e:
+            st.error(f"Failed to get statistics: {str(e)}")
+            return {}
+
+    def export_data(self, format_type: str = "csv") -> Optional[str]:
+        """Export data in specified format"""
+        try:
+            return format_export(self._records(), format_type)
+        except Exception as e:
+            st.error(f"Failed to export data: {str(e)}")
+            return None
+
+    def close(self):
+        """Release the shared connection, closing it when no other store uses it"""
+        if self._closed:
+            return
+        self._closed = True
+        shared = _release_connection(self.db_path)
+        if shared is not None:
+            release_stats_materializer(self._stats_key)
+            with shared.lock:
+                shared.conn.close()
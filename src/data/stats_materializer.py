@@ -0,0 +1,295 @@
+"""
+Materialized Candidate Statistics for TalentScout Hiring Assistant
+Running aggregates updated on every write so get_statistics is a constant-time read
+"""
+
+import atexit
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.config.settings import SHEET_HEADERS
+from src.data.projection import STATISTICS_COLUMNS, to_float
+
+_STATUS = SHEET_HEADERS.index("Status")
+_EXPERIENCE = SHEET_HEADERS.index("Experience_Years")
+_TECH_STACK = SHEET_HEADERS.index("Tech_Stack")
+
+
+def split_tech_stack(tech_stack: Any) -> List[str]:
+    """Individual technologies from a comma-separated Tech_Stack cell"""
+    if not tech_stack:
+        return []
+    return [tech.strip() for tech in str(tech_stack).split(",") if tech.strip()]
+
+
+def row_stat_values(row: List[Any]) -> Tuple[str, Any, str]:
+    """(Status, Experience_Years, Tech_Stack) from a row in SHEET_HEADERS order"""
+    row = list(row) + [""] * (len(SHEET_HEADERS) - len(row))
+    return row[_STATUS], row[_EXPERIENCE], row[_TECH_STACK]
+
+
+class CandidateAggregates:
+    """Counts, experience sum/count, tech-stack and per-status counters"""
+
+    def __init__(
+        self,
+        total: int = 0,
+        experience_sum: float = 0.0,
+        experience_count: int = 0,
+        tech_counts: Optional[Dict[str, int]] = None,
+        status_counts: Optional[Dict[str, int]] = None,
+    ):
+        self.total = total
+        self.experience_sum = experience_sum
+        self.experience_count = experience_count
+        self.tech_counts = Counter(tech_counts or {})
+        self.status_counts = Counter(status_counts or {})
+
+    def add(self, status: Any, experience: Any, tech_stack: Any, sign: int = 1):
+        """Count one candidate in (sign=1) or out (sign=-1) of the aggregates"""
+        self.total += sign
+        self.status_counts[str(status or "")] += sign
+
+        value = to_float(experience)
+        if not np.isnan(value):
+            self.experience_sum += sign * value
+            self.experience_count += sign
+
+        for tech in split_tech_stack(tech_stack):
+            self.tech_counts[tech] += sign
+        self._drop_zero_counts()
+
+    def change_status(self, old_status: Any, new_status: Any):
+        """Move one candidate between status buckets"""
+        self.status_counts[str(old_status or "")] -= 1
+        self.status_counts[str(new_status or "")] += 1
+        self._drop_zero_counts()
+
+    def _drop_zero_counts(self):
+        """Keep counters free of zero entries"""
+        self.tech_counts = +self.tech_counts
+        self.status_counts = +self.status_counts
+
+    def statistics(self) -> Dict[str, Any]:
+        """Statistics in the shape returned by compute_statistics"""
+        if self.total <= 0:
+            return {
+                "total_candidates": 0,
+                "completed_interviews": 0,
+                "average_experience": 0,
+                "top_tech_stacks": []
+            }
+
+        completed = self.status_counts.get("completed", 0)
+        avg_exp = self.experience_sum / self.experience_count if self.experience_count else 0
+        top_techs = sorted(self.tech_counts.items(), key=lambda x: (-x[1], x[0]))[:5]
+
+        return {
+            "total_candidates": self.total,
+            "completed_interviews": completed,
+            "completion_rate": completed / self.total * 100,
+            "average_experience": round(avg_exp, 1),
+            "top_tech_stacks": top_techs
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form"""
+        return {
+            "total": self.total,
+            "experience_sum": self.experience_sum,
+            "experience_count": self.experience_count,
+            "tech_counts": dict(self.tech_counts),
+            "status_counts": dict(self.status_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CandidateAggregates":
+        """Rebuild aggregates from to_dict output"""
+        return cls(**{key: data[key] for key in cls().to_dict() if key in data})
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "CandidateAggregates":
+        """Full recomputation from projected Status, Experience_Years and Tech_Stack columns"""
+        experience = columns["Experience_Years"]
+        experience = experience[~np.isnan(experience)]
+        return cls(
+            total=len(columns["Status"]),
+            experience_sum=float(experience.sum()),
+            experience_count=int(experience.size),
+            tech_counts=Counter(
+                tech for tech_stack in columns["Tech_Stack"] for tech in split_tech_stack(tech_stack)
+            ),
+            status_counts=Counter(str(status) for status in columns["Status"]),
+        )
+
+
+class StatsMaterializer:
+    """Keeps candidate aggregates current, persists them and periodically reconciles with a full scan"""
+
+    def __init__(
+        self,
+        load_fn: Callable[[], Optional[Tuple[Dict[str, Any], Optional[float]]]],
+        save_fn: Callable[[Dict[str, Any]], None],
+        scan_fn: Callable[[List[str]], Dict[str, np.ndarray]],
+        reconcile_interval: float = 600.0,
+        persist_interval: float = 60.0,
+    ):
+        self.load_fn = load_fn
+        self.save_fn = save_fn
+        self.scan_fn = scan_fn
+        self.reconcile_interval = reconcile_interval
+        self.persist_interval = persist_interval
+
+        self.aggregates: Optional[CandidateAggregates] = None
+        self._last_reconcile = 0.0
+        self._last_persist = 0.0
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def record_rows(self, rows: Iterable[List[Any]], sign: int = 1):
+        """Count full rows (SHEET_HEADERS order) in or out"""
+        self.record_values((row_stat_values(row) for row in rows), sign)
+
+    def record_values(self, values: Iterable[Tuple[Any, Any, Any]], sign: int = 1):
+        """Count (status, experience, tech_stack) triples in or out"""
+        with self._lock:
+            if self.aggregates is None:
+                return   # not loaded yet - the initial load or scan will include these rows
+            for status, experience, tech_stack in values:
+                self.aggregates.add(status, experience, tech_stack, sign)
+            self._changed()
+
+    def record_status_changes(self, changes: Iterable[Tuple[Any, Any]]):
+        """Apply (old_status, new_status) transitions"""
+        with self._lock:
+            if self.aggregates is None:
+                return
+            for old_status, new_status in changes:
+                self.aggregates.change_status(old_status, new_status)
+            self._changed()
+
+    def statistics(self) -> Dict[str, Any]:
+        """Current statistics (reconciles first when a full scan is due)"""
+        with self._lock:
+            if self.aggregates is None:
+                self._load()
+            if time.time() - self._last_reconcile >= self.reconcile_interval:
+                self.reconcile()
+            return self.aggregates.statistics()
+
+    def reconcile(self):
+        """Replace the running aggregates with a full recomputation"""
+        with self._lock:
+            self.aggregates = CandidateAggregates.from_columns(self.scan_fn(STATISTICS_COLUMNS))
+            self._last_reconcile = time.time()
+            self._dirty = True
+            self.persist()
+
+    def persist(self, force: bool = False):
+        """Write the aggregates if they changed (at most once per persist_interval unless forced)"""
+        with self._lock:
+            if self.aggregates is None or not self._dirty:
+                return
+            if not force and time.time() - self._last_persist < self.persist_interval:
+                return
+            try:
+                self.save_fn(self.aggregates.to_dict())
+                self._dirty = False
+                self._last_persist = time.time()
+            except Exception as e:
+                print(f"⚠️ Failed to persist candidate statistics: {str(e)}")
+
+    def _changed(self):
+        """Mark the aggregates dirty and persist if the interval has passed"""
+        self._dirty = True
+        self.persist()
+
+    def _load(self):
+        """Start from persisted aggregates, or a full scan when none are usable"""
+        loaded = None
+        try:
+            loaded = self.load_fn()
+        except Exception as e:
+            print(f"⚠️ Failed to load persisted candidate statistics: {str(e)}")
+
+        if loaded:
+            data, updated_at = loaded
+            self.aggregates = CandidateAggregates.from_dict(data)
+            # Persisted aggregates count as reconciled when they were written
+            self._last_reconcile = updated_at or 0.0
+            self._last_persist = time.time()
+        else:
+            self.reconcile()
+
+
+def aggregates_to_rows(data: Dict[str, Any]) -> List[List[Any]]:
+    """Key/value rows for a stats worksheet"""
+    rows = [
+        ["Updated_At", datetime.now().isoformat()],
+        ["Total", data["total"]],
+        ["Experience_Sum", data["experience_sum"]],
+        ["Experience_Count", data["experience_count"]],
+    ]
+    rows += [[f"Status:{status}", count] for status, count in sorted(data["status_counts"].items())]
+    rows += [[f"Tech:{tech}", count] for tech, count in sorted(data["tech_counts"].items())]
+    return rows
+
+
+def rows_to_aggregates(rows: List[List[Any]]) -> Optional[Tuple[Dict[str, Any], Optional[float]]]:
+    """Parse stats worksheet rows back into (aggregates dict, updated_at timestamp)"""
+    values = {row[0]: row[1] for row in rows if len(row) >= 2 and row[0]}
+    if "Total" not in values:
+        return None
+    data = {
+        "total": int(float(values["Total"])),
+        "experience_sum": float(values.get("Experience_Sum", 0) or 0),
+        "experience_count": int(float(values.get("Experience_Count", 0) or 0)),
+        "status_counts": {k[len("Status:"):]: int(float(v)) for k, v in values.items() if k.startswith("Status:")},
+        "tech_counts": {k[len("Tech:"):]: int(float(v)) for k, v in values.items() if k.startswith("Tech:")},
+    }
+    updated_at = None
+    if values.get("Updated_At"):
+        try:
+            updated_at = datetime.fromisoformat(values["Updated_At"]).timestamp()
+        except ValueError:
+            pass
+    return data, updated_at
+
+
+# Process-wide materializers, one per candidate store
+_materializers: Dict[str, StatsMaterializer] = {}
+_registry_lock = threading.Lock()
+
+
+def get_stats_materializer(key: str, **kwargs) -> StatsMaterializer:
+    """Get the shared materializer for a store, creating it on first use"""
+    with _registry_lock:
+        materializer = _materializers.get(key)
+        if materializer is None:
+            materializer = StatsMaterializer(**kwargs)
+            _materializers[key] = materializer
+        return materializer
+
+
+def release_stats_materializer(key: str):
+    """Persist and forget a store's materializer once the store is closed"""
+    with _registry_lock:
+        materializer = _materializers.pop(key, None)
+    if materializer is not None:
+        materializer.persist(force=True)
+
+
+def persist_all_stats():
+    """Write any unsaved aggregates (registered to run at interpreter exit)"""
+    with _registry_lock:
+        materializers = list(_materializers.values())
+    for materializer in materializers:
+        materializer.persist(force=True)
+
+
+atexit.register(persist_all_stats)
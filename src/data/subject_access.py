@@ -0,0 +1,111 @@
+"""
+Data Subject Access Export for TalentScout Hiring Assistant
+Finds one person's data across the candidate store, outbox archive and audit log and streams it as JSON
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.config.settings import SHEET_HEADERS
+from src.data.audit_log import AuditLog, get_audit_log
+from src.data.blind_index import email_blind_index
+from src.data.exporter import EXPORT_COLUMNS
+from src.data.outbox import CandidateOutbox
+from src.data.row_builder import ENCRYPTED_COLUMNS
+from src.utils.gdpr_compliance import GDPRCompliance
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Outbox rows are stored as SHEET_HEADERS-ordered JSON arrays
+EMAIL_INDEX_POSITION = SHEET_HEADERS.index("Email_Index")
+
+
+def json_array(items: Iterable[Any]) -> Iterator[str]:
+    """Serialize a JSON array one element at a time"""
+    yield "["
+    for position, item in enumerate(items):
+        yield ("," if position else "") + json.dumps(item, default=str, ensure_ascii=False)
+    yield "]"
+
+
+def chunked(pieces: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Coalesce small text pieces into encoded chunks of roughly chunk_size bytes"""
+    buffer: List[bytes] = []
+    size = 0
+    for piece in pieces:
+        data = piece.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class SubjectAccessExport:
+    """Answers a data subject access request (DSAR) from every store holding the person's data"""
+
+    def __init__(
+        self,
+        store,
+        audit_log: Optional[AuditLog] = None,
+        outbox: Optional[CandidateOutbox] = None,
+        gdpr_compliance: Optional[GDPRCompliance] = None,
+        blind_index_key: Optional[str] = None,
+    ):
+        self.store = store
+        self.audit_log = audit_log or get_audit_log()
+        self.outbox = outbox
+        self.gdpr_compliance = gdpr_compliance or getattr(store, "gdpr_compliance", None) or GDPRCompliance()
+        self.blind_index_key = blind_index_key or getattr(store, "blind_index_key", None) or ""
+
+    def locate(self, email: str) -> Dict[str, Any]:
+        """The subject's Session_IDs, stored records and outbox rows, found through the email blind index"""
+        records = self.store.find_by_email(email)
+
+        # Local copies awaiting (or kept after) delivery to the candidate store
+        archived = []
+        email_index = email_blind_index(email, self.blind_index_key)
+        if self.outbox is not None and email_index:
+            for session_id, row, status in self.outbox.find_rows(EMAIL_INDEX_POSITION, email_index):
+                record = dict(zip(SHEET_HEADERS, row))
+                record["Outbox_Status"] = status
+                archived.append(record)
+
+        session_ids = list(dict.fromkeys(
+            record.get("Session_ID") for record in records + archived if record.get("Session_ID")
+        ))
+        return {"session_ids": session_ids, "candidate_records": records, "archived_rows": archived}
+
+    def stream(self, email: str, requested_by: str = "admin", chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Locate and decrypt the subject's data now, then yield the JSON archive in chunks"""
+        located = self.locate(email)
+        session_ids = located["session_ids"]
+        records = self._decrypt(located["candidate_records"], EXPORT_COLUMNS)
+        archived = self._decrypt(located["archived_rows"], EXPORT_COLUMNS + ["Outbox_Status"])
+        self.gdpr_compliance.log_data_access(
+            "subject_access_export", "candidate_info", requested_by,
+            details={"session_ids": session_ids, "records": len(records), "archived_rows": len(archived)},
+        )
+        return chunked(self._archive_pieces(email, session_ids, records, archived), chunk_size)
+
+    def _decrypt(self, records: List[Dict[str, Any]], columns: List[str]) -> List[Dict[str, Any]]:
+        """Decrypt a batch of records (one pass per encrypted column) and drop the blind index hashes"""
+        decrypted = self.gdpr_compliance.decrypt_records(records, ENCRYPTED_COLUMNS)
+        return [{name: record.get(name, "") for name in columns} for record in decrypted]
+
+    def _archive_pieces(
+        self, email: str, session_ids: List[str], records: List[Dict[str, Any]], archived: List[Dict[str, Any]]
+    ) -> Iterator[str]:
+        """The archive as a stream of JSON text pieces (the audit trail is read when its section is reached)"""
+        header = {"subject": {"email": email}, "generated_at": datetime.now().isoformat(), "session_ids": session_ids}
+        yield json.dumps(header, ensure_ascii=False)[:-1]
+        yield ', "candidate_records": '
+        yield from json_array(records)
+        yield ', "archived_rows": '
+        yield from json_array(archived)
+        yield ', "audit_trail": '
+        yield from json_array(self.audit_log.query(user_ids=session_ids, limit=None))
+        yield "}"
@@ -0,0 +1,226 @@
+"""
+Write-behind Persistence Queue for TalentScout Hiring Assistant
+Accepts candidate rows immediately and flushes them to storage in batches
+"""
+
+import atexit
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# (key, row) pairs - the key is the candidate's Session_ID
+QueueItem = Tuple[str, List[Any]]
+
+
+class WriteBehindQueue:
+    """Buffers rows in memory and flushes them with one multi-row call per batch"""
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[List[Any]]], Any],
+        batch_size: int = 20,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 500,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        on_success: Optional[Callable[[List[QueueItem], Any], None]] = None,
+        on_failure: Optional[Callable[[List[QueueItem], Exception], None]] = None,
+        name: str = "sheets",
+    ):
+        self.flush_fn = flush_fn
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.on_success = on_success
+        self.on_failure = on_failure
+        self.name = name
+
+        self._queue: "queue.Queue[Optional[QueueItem]]" = queue.Queue(maxsize=max_queue_size)
+        self._pending: Dict[str, int] = {}
+        # Newest row for each unique key still waiting in the queue (replaced in place by re-saves)
+        self._latest: Dict[str, List[Any]] = {}
+        self._pending_lock = threading.Condition()
+        self._flush_requested = threading.Event()
+        self._closed = False
+
+        self._worker = threading.Thread(
+            target=self._run, name=f"write-behind-{name}", daemon=True
+        )
+        self._worker.start()
+
+    def enqueue(self, key: str, row: List[Any], timeout: Optional[float] = 5.0, unique: bool = False) -> bool:
+        """Queue a row for the next batch; returns False when the queue stays full (backpressure)
+
+        With unique=True a key that is already waiting is not queued a second time;
+        its queued row is replaced so the batch writes the newest version.
+        """
+        if self._closed:
+            return False
+
+        with self._pending_lock:
+            if unique and key in self._latest:
+                self._latest[key] = row
+                return True
+            if unique:
+                self._latest[key] = row
+            self._pending[key] = self._pending.get(key, 0) + 1
+        try:
+            self._queue.put((key, row), timeout=timeout)
+            return True
+        except queue.Full:
+            with self._pending_lock:
+                if unique:
+                    self._latest.pop(key, None)
+            self._mark_done([(key, row)])
+            return False
+
+    def is_pending(self, key: str) -> bool:
+        """Check whether a row for this key has not been written yet"""
+        with self._pending_lock:
+            return key in self._pending
+
+    def pending_count(self) -> int:
+        """Number of rows waiting to be written"""
+        with self._pending_lock:
+            return sum(self._pending.values())
+
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Write everything queued so far and wait for it; returns False on timeout"""
+        self._flush_requested.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_lock:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._pending_lock.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> bool:
+        """Stop accepting rows, drain the queue and stop the worker"""
+        if self._closed:
+            return not self._worker.is_alive()
+        self._closed = True
+        self._flush_requested.set()
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+    def _run(self):
+        """Worker loop: collect a batch on size or time threshold and flush it"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if self._flush_requested.is_set():
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=min(remaining, 0.1))
+                    except queue.Empty:
+                        continue
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            if self._queue.empty():
+                self._flush_requested.clear()
+
+        # Drain whatever was queued before shutdown
+        remaining_items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                remaining_items.append(item)
+        for start in range(0, len(remaining_items), self.batch_size):
+            self._write_batch(remaining_items[start:start + self.batch_size])
+
+    def _write_batch(self, batch: List[QueueItem]):
+        """Flush one batch with retries and report the outcome"""
+        with self._pending_lock:
+            # Rows re-saved while waiting are written in their newest version
+            batch = [(key, self._latest.pop(key, row)) for key, row in batch]
+        rows = [row for _, row in batch]
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = self.flush_fn(rows)
+                if self.on_success:
+                    self._safe_callback(self.on_success, batch, result)
+                self._mark_done(batch)
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    time.sleep(self.retry_backoff * (2 ** attempt))
+
+        print(f"❌ Write-behind flush failed for {len(batch)} row(s): {str(last_error)}")
+        if self.on_failure:
+            self._safe_callback(self.on_failure, batch, last_error)
+        self._mark_done(batch)
+
+    def _safe_callback(self, callback: Callable, batch: List[QueueItem], value: Any):
+        """Run a callback without letting it kill the worker thread"""
+        try:
+            callback(batch, value)
+        except Exception as e:
+            print(f"⚠️ Write-behind callback failed: {str(e)}")
+
+    def _mark_done(self, batch: List[QueueItem]):
+        """Release pending markers for written (or dropped) rows"""
+        with self._pending_lock:
+            for key, _ in batch:
+                count = self._pending.get(key, 0) - 1
+                if count > 0:
+                    self._pending[key] = count
+                else:
+                    self._pending.pop(key, None)
+            self._pending_lock.notify_all()
+
+
+# Process-wide queues, one per destination sheet
+_queues: Dict[str, WriteBehindQueue] = {}
+_registry_lock = threading.Lock()
+
+
+def get_write_queue(key: str, flush_fn: Callable[[List[List[Any]]], Any], **kwargs) -> WriteBehindQueue:
+    """Get the shared write-behind queue for a destination, creating it on first use"""
+    with _registry_lock:
+        write_queue = _queues.get(key)
+        if write_queue is None or write_queue._closed:
+            write_queue = WriteBehindQueue(flush_fn, name=key, **kwargs)
+            _queues[key] = write_queue
+        return write_queue
+
+
+def shutdown_write_queues(timeout: float = 10.0):
+    """Drain and stop every shared queue (registered to run at interpreter exit)"""
+    with _registry_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    for write_queue in queues:
+        write_queue.close(timeout)
+
+
+atexit.register(shutdown_write_queues)
@@ -3,8 +3,8 @@ UI Components for TalentScout Hiring Assistant
 """
 
 import streamlit as st
-import os
-from typing import List, Dict, Any, Optional
+import hmac
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 import time
 
@@ -13,6 +13,10 @@ from src.ui.styling import (
     create_info_card, create_status_indicator, create_sentiment_display
 )
 from src.chatbot.conversation_manager import ConversationManager
+from src.data.exporter import export_filename, export_mime_type, read_chunks, stream_export
+from src.data.importer import import_applications
+from src.data.subject_access import SubjectAccessExport
+from src.utils.pii_redaction import PiiRedactor, redact_stream
 
 def setup_page_config():
     """Configure Streamlit page settings"""
@@ -402,13 +406,9 @@ def render_control_buttons(conversation_manager: ConversationManager):
     if st.button("❓ Help", use_container_width=True):
         show_help_dialog()
 
-def export_conversation(conversation_manager: ConversationManager):
-    """Export conversation to downloadable format"""
-    
-    session = conversation_manager.get_session()
-    
-    # Create export content
-    export_content = f"""
+def conversation_export_lines(session) -> Iterator[str]:
+    """Yield the plain-text conversation export piece by piece"""
+    yield f"""
 TalentScout Hiring Assistant - Conversation Export
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Session ID: {session.session_id}
@@ -418,7 +418,7 @@ Session ID: {session.session_id}
     
     if session.candidate_info:
         candidate = session.candidate_info
-        export_content += f"""
+        yield f"""
 Name: {candidate.full_name}
 Email: {candidate.email}
 Phone: {candidate.phone}
@@ -428,21 +428,30 @@ Location: {candidate.location}
 Tech Stack: {', '.join(candidate.tech_stack)}
 """
     
-    export_content += "\n=== CONVERSATION HISTORY ===\n"
+    yield "\n=== CONVERSATION HISTORY ===\n"
     
     for message in session.chat_history:
         role = "User" if message["role"] == "user" else "Assistant"
         timestamp = message.get("timestamp", "")
         content = message["content"]
-        export_content += f"\n[{timestamp}] {role}: {content}\n"
+        yield f"\n[{timestamp}] {role}: {content}\n"
     
     if session.responses:
-        export_content += "\n=== TECHNICAL QUESTIONS & RESPONSES ===\n"
+        yield "\n=== TECHNICAL QUESTIONS & RESPONSES ===\n"
         for i, response in enumerate(session.responses, 1):
-            export_content += f"\nQ{i}: {response.question}"
-            export_content += f"\nA{i}: {response.response}"
+            yield f"\nQ{i}: {response.question}"
+            yield f"\nA{i}: {response.response}"
             if response.sentiment_score is not None:
-                export_content += f"\nSentiment: {response.sentiment_score:.2f}\n"
+                yield f"\nSentiment: {response.sentiment_score:.2f}\n"
+
+def export_conversation(conversation_manager: ConversationManager):
+    """Export conversation to downloadable format"""
+    
+    session = conversation_manager.get_session()
+    
+    # Mask the candidate's PII (known values plus anything pattern-like typed in the chat)
+    redactor = PiiRedactor.for_candidate(session.candidate_info, mask=True)
+    export_content = "".join(redact_stream(conversation_export_lines(session), redactor))
     
     # Create download button
     st.download_button(
@@ -452,6 +461,92 @@ Tech Stack: {', '.join(candidate.tech_stack)}
         mime="text/plain"
     )
 
+def render_hr_data_panel(conversation_manager: ConversationManager):
+    """Render the password-protected sidebar panel with HR data tools"""
+    password = conversation_manager.config.admin_password
+    candidate_store = conversation_manager.candidate_store
+    if not password or candidate_store is None:
+        return
+    
+    with st.sidebar.expander("🗂️ HR Data Tools"):
+        if not st.session_state.get("hr_panel_unlocked"):
+            entered = st.text_input("Admin password", type="password", key="hr_panel_password")
+            if not entered:
+                return
+            if not hmac.compare_digest(entered.encode(), password.encode()):
+                st.error("Incorrect password")
+                return
+            st.session_state.hr_panel_unlocked = True
+        
+        render_candidate_export(candidate_store)
+        st.divider()
+        render_subject_access_export(candidate_store, outbox=conversation_manager.outbox)
+        st.divider()
+        render_candidate_import(candidate_store)
+
+def render_candidate_export(candidate_store, format_type: str = "csv", compress: bool = True):
+    """Render a download button that builds the candidate export when clicked"""
+    
+    def build_export():
+        # Runs only when clicked; pages through the store and spools to an anonymous temporary file
+        return read_chunks(stream_export(candidate_store, format_type, compress, redact=True))
+    
+    st.download_button(
+        label=f"Download Candidates ({format_type.upper()}{' .gz' if compress else ''})",
+        data=build_export,
+        file_name=export_filename(format_type, compress),
+        mime=export_mime_type(format_type, compress),
+        key=f"candidate_export_{format_type}_{compress}"
+    )
+
+def render_subject_access_export(candidate_store, outbox=None):
+    """Render a data subject access request form that builds one person's archive when clicked"""
+    email = st.text_input("Data subject email", key="dsar_email")
+    if not email:
+        return
+    
+    file_name = f"talentscout_dsar_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    
+    def build_archive():
+        # Runs only when clicked; the records are located through the email blind index, not a sheet scan
+        return read_chunks(SubjectAccessExport(candidate_store, outbox=outbox).stream(email))
+    
+    st.download_button(
+        label="Download Subject Access Archive (JSON)",
+        data=build_archive,
+        file_name=file_name,
+        mime="application/json",
+        key="dsar_export"
+    )
+
+def render_candidate_import(candidate_store):
+    """Render an uploader that bulk-imports CSV / JSON application dumps into the store"""
+    uploaded = st.file_uploader(
+        "Import Applications (CSV or JSON)",
+        type=["csv", "json", "ndjson", "jsonl"],
+        key="candidate_import"
+    )
+    if uploaded is None or not st.button("📥 Import", key="btn_candidate_import"):
+        return
+    
+    format_type = "csv" if uploaded.name.lower().endswith(".csv") else "json"
+    try:
+        result = import_applications(candidate_store, uploaded.getvalue(), format_type)
+    except Exception as e:
+        st.error(f"Failed to import applications: {str(e)}")
+        return
+    
+    st.success(f"✅ Imported {result.imported} of {result.total} applications")
+    if result.rejected:
+        st.warning(f"⚠️ {result.rejected} row(s) failed validation")
+        st.download_button(
+            label="Download Error Report",
+            data=result.error_report_csv(),
+            file_name=f"import_errors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            key="candidate_import_errors"
+        )
+
 def show_help_dialog():
     """Toggle help information display"""
     # Toggle help visibility
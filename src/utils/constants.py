@@ -127,6 +127,7 @@ REGEX_PATTERNS = {
     "name": r'^[a-zA-Z\s\-\.\']{2,100}$',
     "experience": r'(\d+)\s*(?:years?|yrs?)',
     "tech_stack": r'[a-zA-Z0-9\+\#\.\-\s]+',
+    "date": r'^(?:\d{1,2}[/\-.]\d{1,2}[/\-.]\d{4}|\d{4}-\d{2}-\d{2})$',
 }
 
 # Default responses
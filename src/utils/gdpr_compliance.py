@@ -4,28 +4,102 @@ Handles consent management, data encryption, and privacy rights
 """
 
 import hashlib
+import hmac
+import itertools
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any
 import streamlit as st
-from cryptography.fernet import Fernet
 import base64
+from src.data.audit_log import AuditLog, get_audit_log
+from src.data.data_keys import DataKeyStore
+from src.utils.keyring import EncryptionKeyring, get_keyring
+
+# Fernet tokens are urlsafe base64 starting with the version byte 0x80 ("gAAAAA");
+# values written before the extra base64 layer was dropped start with its encoding instead
+FERNET_TOKEN_PREFIX = "gAAAAA"
+LEGACY_TOKEN_PREFIX = base64.b64encode(FERNET_TOKEN_PREFIX.encode()).decode()
+
+# Fields encrypted with a candidate's own data key (envelope encryption) carry this prefix
+ENVELOPE_PREFIX = "dk:"
+
+# Candidate data is kept for 12 months after the interview
+RETENTION_DAYS = 365
+
+# Batches smaller than this are handled inline; larger ones are split across the pool
+PARALLEL_BATCH_THRESHOLD = 512
+BATCH_CHUNK_SIZE = 256
+
+_crypto_pool: Optional[ThreadPoolExecutor] = None
+_crypto_pool_lock = threading.Lock()
+
+
+def _get_crypto_pool() -> Optional[ThreadPoolExecutor]:
+    """Process-wide pool for bulk field encryption (None on single-core hosts)"""
+    global _crypto_pool
+    workers = min(8, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    with _crypto_pool_lock:
+        if _crypto_pool is None:
+            _crypto_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="field-crypto")
+        return _crypto_pool
+
+
+def _map_batch(fn: Callable[[str], str], values: Iterable[Any]) -> List[str]:
+    """Apply a per-field function to a batch, in parallel chunks when the batch is large"""
+    values = list(values)
+    pool = _get_crypto_pool() if len(values) >= PARALLEL_BATCH_THRESHOLD else None
+    if pool is None:
+        return [fn(value) for value in values]
+    chunks = [values[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(values), BATCH_CHUNK_SIZE)]
+    return list(itertools.chain.from_iterable(pool.map(lambda chunk: [fn(value) for value in chunk], chunks)))
+
+
+def _token_bytes(value: str) -> bytes:
+    """Fernet token of a stored value, unwrapping the legacy double base64 encoding"""
+    if value.startswith(LEGACY_TOKEN_PREFIX):
+        return base64.b64decode(value.encode())
+    return value.encode()
+
+def compute_blind_index(value: str, key: str) -> str:
+    """Deterministic keyed HMAC of a normalized value, for lookups on encrypted fields"""
+    if not value:
+        return ""
+    normalized = str(value).strip().lower()
+    return hmac.new(key.encode(), normalized.encode(), hashlib.sha256).hexdigest()
 
 class GDPRCompliance:
     """Handles GDPR compliance features"""
     
-    def __init__(self):
-        self.encryption_key = self._get_or_create_encryption_key()
-        self.cipher_suite = Fernet(self.encryption_key)
+    def __init__(
+        self,
+        keyring: Optional[EncryptionKeyring] = None,
+        audit_log: Optional[AuditLog] = None,
+        data_keys: Optional[DataKeyStore] = None,
+    ):
+        self._keyring = keyring
+        self._audit_log = audit_log
+        # Per-candidate data keys; without them fields are encrypted with the master keyring directly
+        self.data_keys = data_keys
     
-    def _get_or_create_encryption_key(self) -> bytes:
-        """Get or create encryption key for data protection"""
-        try:
-            # In production, store this securely (e.g., environment variable)
-            key = Fernet.generate_key()
-            return key
-        except Exception:
-            return Fernet.generate_key()
+    @property
+    def keyring(self) -> EncryptionKeyring:
+        """Keyring used for field encryption (the process-wide one unless given)"""
+        return self._keyring or get_keyring()
+    
+    @property
+    def audit_log(self) -> AuditLog:
+        """Durable audit trail (the process-wide one unless given)"""
+        return self._audit_log or get_audit_log()
+    
+    @property
+    def cipher_suite(self):
+        """Cached MultiFernet: encrypts with the primary key, decrypts with any key version"""
+        return self.keyring.multi_fernet
     
     def show_privacy_notice(self) -> bool:
         """Display privacy notice and get consent"""
@@ -101,8 +175,8 @@ class GDPRCompliance:
         if not data:
             return ""
         try:
-            encrypted_data = self.cipher_suite.encrypt(data.encode())
-            return base64.b64encode(encrypted_data).decode()
+            # Fernet tokens are already urlsafe base64 text
+            return self.keyring.encrypt(str(data).encode()).decode()
         except Exception:
             return data  # Fallback to original if encryption fails
     
@@ -111,12 +185,97 @@ class GDPRCompliance:
         if not encrypted_data:
             return ""
         try:
-            decoded_data = base64.b64decode(encrypted_data.encode())
-            decrypted_data = self.cipher_suite.decrypt(decoded_data)
-            return decrypted_data.decode()
+            return self.keyring.decrypt(_token_bytes(str(encrypted_data))).decode()
         except Exception:
             return encrypted_data  # Fallback to original if decryption fails
     
+    def encrypt_many(self, values: Iterable[Any]) -> List[str]:
+        """Encrypt a list or column of fields"""
+        return _map_batch(self.encrypt_sensitive_data, values)
+    
+    def decrypt_many(self, values: Iterable[Any]) -> List[str]:
+        """Decrypt a list or column of fields"""
+        return _map_batch(self.decrypt_sensitive_data, values)
+    
+    def encrypt_for_sessions(self, session_ids: Iterable[str], values: Iterable[Any]) -> List[str]:
+        """Encrypt fields, each with its candidate's data key (created on first use) when data keys are enabled"""
+        if self.data_keys is None:
+            return self.encrypt_many(values)
+        pairs = list(zip(session_ids, values))
+        keys = self.data_keys.get_or_create_many(session_id for session_id, value in pairs if value)
+        
+        def encrypt(pair) -> str:
+            session_id, value = pair
+            if not value:
+                return ""
+            return ENVELOPE_PREFIX + keys[session_id].encrypt(str(value).encode()).decode()
+        return _map_batch(encrypt, pairs)
+    
+    def decrypt_records(self, records: List[Dict[str, Any]], columns: Iterable[str]) -> List[Dict[str, Any]]:
+        """Decrypt the given columns of a page of records, one batch per column (shredded fields come back blank)"""
+        records = [dict(record) for record in records]
+        columns = list(columns)
+        
+        # One key lookup for every candidate on the page with envelope-encrypted fields
+        enveloped = [
+            record.get("Session_ID") for record in records
+            if any(str(record.get(column, "")).startswith(ENVELOPE_PREFIX) for column in columns)
+        ]
+        keys = self.data_keys.get_many(enveloped) if enveloped and self.data_keys else {}
+        
+        def decrypt(pair) -> str:
+            session_id, value = pair
+            value = "" if value is None else str(value)
+            if not value.startswith(ENVELOPE_PREFIX):
+                return self.decrypt_sensitive_data(value)
+            if self.data_keys is None:
+                return value  # No key store configured here: leave the ciphertext
+            key = keys.get(session_id)
+            if key is None:
+                return ""  # Data key shredded: the value is erased
+            try:
+                return key.decrypt(value[len(ENVELOPE_PREFIX):].encode()).decode()
+            except Exception:
+                return value
+        
+        for column in columns:
+            plaintexts = _map_batch(decrypt, [(record.get("Session_ID"), record.get(column, "")) for record in records])
+            for record, value in zip(records, plaintexts):
+                if column in record:
+                    record[column] = value
+        return records
+    
+    def shred(self, session_ids: Iterable[str]) -> int:
+        """Crypto-shred candidates by destroying their data keys; returns how many keys were destroyed"""
+        if self.data_keys is None:
+            return 0
+        session_ids = list(session_ids)
+        destroyed = self.data_keys.shred(session_ids)
+        for session_id in session_ids:
+            self.log_data_access("crypto_shred", "candidate_info", session_id)
+        return destroyed
+    
+    def needs_rotation(self, encrypted_data: str) -> bool:
+        """Whether a stored ciphertext uses an older key version or the legacy encoding"""
+        if not encrypted_data:
+            return False
+        value = str(encrypted_data)
+        if not value.startswith((FERNET_TOKEN_PREFIX, LEGACY_TOKEN_PREFIX)):
+            return False  # Not a ciphertext (e.g. a legacy plaintext value)
+        try:
+            return value.startswith(LEGACY_TOKEN_PREFIX) or not self.keyring.is_current(_token_bytes(value))
+        except Exception:
+            return False
+    
+    def rotate_sensitive_data(self, encrypted_data: str) -> str:
+        """Re-encrypt a stored ciphertext under the primary key"""
+        if not self.needs_rotation(encrypted_data):
+            return encrypted_data
+        try:
+            return self.keyring.rotate(_token_bytes(str(encrypted_data))).decode()
+        except Exception:
+            return encrypted_data  # Undecryptable with any known key: leave as is
+    
     def anonymize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Anonymize personal data for analytics"""
         anonymized = data.copy()
@@ -219,25 +378,26 @@ class GDPRCompliance:
             else:
                 st.error("Please confirm deletion by checking the checkbox.")
     
-    def log_data_access(self, action: str, data_type: str, user_id: str = None):
+    def log_data_access(self, action: str, data_type: str, user_id: str = None, details: Optional[Dict[str, Any]] = None):
         """Log data access for audit trail"""
         log_entry = {
             'timestamp': datetime.now().isoformat(),
             'action': action,
             'data_type': data_type,
             'user_id': user_id or 'anonymous',
-            'ip_address': self._get_user_ip()
+            'ip_address': self._get_user_ip(),
+            'details': details
         }
         
-        # In production, store in secure audit log
-        if 'audit_log' not in st.session_state:
-            st.session_state.audit_log = []
-        
-        st.session_state.audit_log.append(log_entry)
+        # Queued for the append-only audit store - a save never waits on the insert
+        try:
+            self.audit_log.record(log_entry)
+        except Exception as e:
+            print(f"⚠️ Failed to write audit log entry: {str(e)}")
     
     def check_data_retention(self, data_timestamp: datetime) -> bool:
         """Check if data should be retained based on retention policy"""
-        retention_period = timedelta(days=365)  # 12 months
+        retention_period = timedelta(days=RETENTION_DAYS)
         return datetime.now() - data_timestamp < retention_period
     
     def get_compliance_status(self) -> Dict[str, bool]:
@@ -246,7 +406,7 @@ class GDPRCompliance:
             'consent_obtained': bool(st.session_state.get('gdpr_consent', {}).get('data_processing')),
             'privacy_notice_shown': 'gdpr_consent' in st.session_state,
             'data_encrypted': True,  # Assuming encryption is implemented
-            'audit_logging': 'audit_log' in st.session_state,
+            'audit_logging': True,  # Durable audit log store
             'retention_policy': True,  # Policy defined
             'subject_rights_available': True  # Rights UI available
         }
@@ -22,6 +22,16 @@ def sanitize_input(text: str) -> str:
     
     return sanitized.strip()
 
+def compact_markdown(text: str, max_length: int = 1000) -> str:
+    """Strip markdown decoration and blank runs from bot text, capped at max_length characters"""
+    if not text:
+        return ""
+    
+    compacted = re.sub(r'(\*\*|__|`{1,3}|^#{1,6}\s*|^>\s?)', '', text, flags=re.MULTILINE)
+    compacted = re.sub(r'[ \t]+', ' ', compacted)
+    compacted = re.sub(r'\n\s*\n+', '\n', compacted).strip()
+    return compacted if len(compacted) <= max_length else compacted[:max_length].rstrip() + "…"
+
 def validate_email_format(email: str) -> bool:
     """Validate email format using regex"""
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
@@ -0,0 +1,175 @@
+"""
+Encryption Keyring for TalentScout Hiring Assistant
+Versioned Fernet keys loaded once per process and combined into a cached MultiFernet
+"""
+
+import base64
+import hashlib
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+# Spec format: "keyring:v2:<key>,v1:<key>" - primary (used to encrypt) first.
+# Anything without the prefix is one legacy passphrase (version v1), even if it contains "," or ":"
+KEYRING_PREFIX = "keyring:"
+KEY_SEPARATOR = ","
+VERSION_SEPARATOR = ":"
+
+# Where a generated development key is kept when no ENCRYPTION_KEY is configured
+DEV_KEYRING_PATH = os.path.join("backups", "dev_encryption.key")
+
+
+def derive_fernet_key(secret: str) -> bytes:
+    """Use a configured secret as a Fernet key, deriving one with SHA-256 if it is not already one"""
+    key = secret.strip().encode()
+    try:
+        Fernet(key)
+        return key
+    except (ValueError, TypeError):
+        return base64.urlsafe_b64encode(hashlib.sha256(key).digest())
+
+
+def parse_keyring_spec(spec: str) -> List[Tuple[str, bytes]]:
+    """Parse a keyring spec into (version, Fernet key) pairs, primary first"""
+    spec = spec.strip()
+    if not spec.startswith(KEYRING_PREFIX):
+        # A plain ENCRYPTION_KEY is used whole, so a passphrase may contain any character
+        return [("v1", derive_fernet_key(spec))]
+
+    keys = []
+    for entry in spec[len(KEYRING_PREFIX):].split(KEY_SEPARATOR):
+        if not entry.strip():
+            continue
+        version, separator, secret = entry.partition(VERSION_SEPARATOR)
+        if not separator or not version.strip() or not secret.strip():
+            raise ValueError(f"Keyring entries must look like <version>{VERSION_SEPARATOR}<key>")
+        keys.append((version.strip(), derive_fernet_key(secret)))
+    return keys
+
+
+class EncryptionKeyring:
+    """Ordered set of versioned keys: the primary encrypts, all of them decrypt"""
+
+    def __init__(self, keys: List[Tuple[str, bytes]]):
+        if not keys:
+            raise ValueError("An encryption keyring needs at least one key")
+        versions = [version for version, _ in keys]
+        if len(set(versions)) != len(versions):
+            raise ValueError(f"Duplicate key versions in keyring: {versions}")
+        self.keys = list(keys)
+        self._primary = Fernet(self.keys[0][1])
+        self.multi_fernet = MultiFernet([Fernet(key) for _, key in self.keys])
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "EncryptionKeyring":
+        """Build a keyring from a "keyring:v2:<key>,v1:<key>" spec (or one legacy passphrase)"""
+        return cls(parse_keyring_spec(spec))
+
+    @property
+    def primary_version(self) -> str:
+        """Version of the key new ciphertexts are written with"""
+        return self.keys[0][0]
+
+    @property
+    def versions(self) -> List[str]:
+        """All key versions, primary first"""
+        return [version for version, _ in self.keys]
+
+    def encrypt(self, data: bytes) -> bytes:
+        """Encrypt with the primary key"""
+        return self.multi_fernet.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        """Decrypt with whichever key produced the token (raises InvalidToken if none did)"""
+        return self.multi_fernet.decrypt(token)
+
+    def is_current(self, token: bytes) -> bool:
+        """Whether a token was produced by the primary key"""
+        try:
+            self._primary.decrypt(token)
+            return True
+        except InvalidToken:
+            return False
+
+    def rotate(self, token: bytes) -> bytes:
+        """Re-encrypt a token under the primary key (keeps its original timestamp)"""
+        return self.multi_fernet.rotate(token)
+
+    def with_new_key(self, key: Optional[bytes] = None, version: Optional[str] = None) -> "EncryptionKeyring":
+        """A keyring with a new primary key (generated if not given) in front of the existing ones"""
+        if version is None:
+            numbers = [int(v[1:]) for v in self.versions if v[:1] == "v" and v[1:].isdigit()]
+            version = f"v{max(numbers, default=0) + 1}"
+        return EncryptionKeyring([(version, key or Fernet.generate_key())] + self.keys)
+
+    def without_version(self, version: str) -> "EncryptionKeyring":
+        """A keyring with a retired key removed (only once nothing is encrypted with it)"""
+        return EncryptionKeyring([(v, key) for v, key in self.keys if v != version])
+
+    def to_spec(self) -> str:
+        """Serialize as a keyring spec for ENCRYPTION_KEY"""
+        return KEYRING_PREFIX + KEY_SEPARATOR.join(
+            f"{version}{VERSION_SEPARATOR}{key.decode()}" for version, key in self.keys
+        )
+
+
+def _configured_spec() -> Optional[str]:
+    """ENCRYPTION_KEY from the application config (or the environment when the config is incomplete)"""
+    try:
+        from src.config.settings import AppConfig
+        return AppConfig().encryption_key
+    except Exception:
+        return os.environ.get("ENCRYPTION_KEY")
+
+
+def _read_development_spec(path: str) -> str:
+    """The keyring spec in a development key file (files written before the prefix are versioned specs)"""
+    with open(path, "r") as f:
+        spec = f.read().strip()
+    return spec if spec.startswith(KEYRING_PREFIX) else KEYRING_PREFIX + spec
+
+
+def _development_spec(path: Optional[str] = None) -> str:
+    """A locally persisted key so development data stays readable across restarts"""
+    path = path or DEV_KEYRING_PATH
+    if os.path.exists(path):
+        return _read_development_spec(path)
+    spec = f"{KEYRING_PREFIX}v1{VERSION_SEPARATOR}{Fernet.generate_key().decode()}"
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        # Another process generated the key first - use theirs
+        return _read_development_spec(path)
+    with os.fdopen(fd, "w") as f:
+        f.write(spec)
+    print(f"⚠️ ENCRYPTION_KEY not configured - generated a development key in {path}")
+    return spec
+
+
+# Process-wide keyring, loaded on first use
+_keyring: Optional[EncryptionKeyring] = None
+_keyring_lock = threading.Lock()
+
+
+def get_keyring() -> EncryptionKeyring:
+    """The process-wide keyring (built from ENCRYPTION_KEY once)"""
+    global _keyring
+    keyring = _keyring
+    if keyring is not None:
+        return keyring
+    with _keyring_lock:
+        if _keyring is None:
+            _keyring = EncryptionKeyring.from_spec(_configured_spec() or _development_spec())
+        return _keyring
+
+
+def set_keyring(keyring: EncryptionKeyring):
+    """Replace the process-wide keyring (after a rotation, or in tests)"""
+    global _keyring
+    with _keyring_lock:
+        _keyring = keyring
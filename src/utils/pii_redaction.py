@@ -0,0 +1,182 @@
+"""
+PII Redaction for TalentScout Hiring Assistant
+Single-pass regex redaction: reversible placeholders for LLM prompts, masking for logs and exports
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.constants import REGEX_PATTERNS
+from src.utils.helpers import mask_sensitive_data
+
+
+def _unanchored(pattern: str) -> str:
+    """A full-match validation pattern from REGEX_PATTERNS, usable for searching inside text"""
+    return pattern[1:-1] if pattern.startswith("^") and pattern.endswith("$") else pattern
+
+
+# Placeholder kind -> pattern, tried in this order at each position
+PII_PATTERNS = {
+    "EMAIL": _unanchored(REGEX_PATTERNS["email"]),
+    # A date followed by a time of day is a timestamp, not a birth date
+    "DATE": r"(?<!\d)" + _unanchored(REGEX_PATTERNS["date"]) + r"(?!\d|[T ]\d{1,2}:)",
+    # REGEX_PATTERNS["phone"] allows leading / trailing separators; inside text a number must start and end on a digit
+    "PHONE": r"(?<![\w@.+\-])\+?\(?\d[\d \-\(\)]{8,16}\d(?![\w@\-])",
+}
+
+# Patterns whose match always starts with a digit, "+" or "("
+DIGIT_LED_KINDS = ("DATE", "PHONE")
+
+PLACEHOLDER_PATTERN = re.compile(r"\[(EMAIL|DATE|PHONE|NAME|PII)_(\d+)\]")
+
+# Known values shorter than this (initials, "Li") would redact ordinary words
+MIN_KNOWN_LENGTH = 3
+
+MIN_PHONE_DIGITS = 10
+MAX_PHONE_DIGITS = 15
+
+# Streams are redacted a line at a time; a line longer than this is cut at whitespace
+MAX_PENDING_CHARS = 64 * 1024
+# No PII match is longer than this, so a forced cut never splits one that started in the kept tail
+MAX_MATCH_CHARS = 256
+
+# Bound on memoized masks, so a stream of distinct values cannot grow memory
+MAX_CACHED_MASKS = 10000
+
+
+@lru_cache(maxsize=256)
+def compile_pii_pattern(known_values: Tuple[str, ...] = ()) -> "re.Pattern[str]":
+    """One alternation over every PII pattern and the known literal values (longest first)"""
+    parts = [f"(?P<{kind}>{pattern})" for kind, pattern in PII_PATTERNS.items() if kind not in DIGIT_LED_KINDS]
+    # One cheap lookahead skips every digit-led branch at the (far more common) non-digit positions
+    digit_led = "|".join(f"(?P<{kind}>{PII_PATTERNS[kind]})" for kind in DIGIT_LED_KINDS)
+    parts.append(f"(?=[\\d+(])(?:{digit_led})")
+    if known_values:
+        # Tried last, so a known name inside an email address is masked as part of the address
+        literals = "|".join(re.escape(value) for value in sorted(known_values, key=len, reverse=True))
+        parts.append(f"(?P<KNOWN>(?<!\\w)(?i:{literals})(?!\\w))")
+    return re.compile("|".join(parts))
+
+
+def _normalize(kind: str, value: str) -> str:
+    """Key under which differently formatted copies of a value share one placeholder"""
+    if kind == "PHONE":
+        return re.sub(r"\D", "", value)
+    return value.strip().lower()
+
+
+def mask_value(kind: str, value: str) -> str:
+    """Partially mask one PII value the way mask_sensitive_data does for logs"""
+    if kind == "NAME" and len(value.split()) < 2:
+        return value[0] + "***"
+    if kind in ("EMAIL", "PHONE", "NAME"):
+        return mask_sensitive_data(value, kind.lower())
+    if kind == "DATE":
+        return re.sub(r"\d", "*", value)
+    return "***"
+
+
+class PiiRedactor:
+    """Replaces PII with placeholders like [EMAIL_1] that stay stable for the redactor's lifetime (or masks it)"""
+
+    def __init__(self, known: Optional[Dict[str, Iterable[str]]] = None, mask: bool = False):
+        # Masking is one-way and keeps no state, so it suits logs and exports of any size
+        self.mask = mask
+        # Normalized known value -> placeholder kind (e.g. the candidate's name, which no pattern can find)
+        self.known_kinds: Dict[str, str] = {}
+        for kind, values in (known or {}).items():
+            for value in values:
+                value = str(value or "").strip()
+                if len(value) >= MIN_KNOWN_LENGTH:
+                    self.known_kinds[value.lower()] = kind
+        self.pattern = compile_pii_pattern(tuple(sorted(self.known_kinds)))
+
+        self.placeholders: Dict[Tuple[str, str], str] = {}
+        self.originals: Dict[str, str] = {}
+        self._counts: Dict[str, int] = {}
+        # Masks are deterministic, so repeated values in a long stream are masked once
+        self._masks: Dict[Tuple[str, str], str] = {}
+
+    @classmethod
+    def for_candidate(cls, candidate: Any, mask: bool = False) -> "PiiRedactor":
+        """Redactor that also knows a candidate's name and contact details (model or dict)"""
+        if candidate is None:
+            return cls(mask=mask)
+
+        def field(name: str) -> str:
+            value = candidate.get(name, "") if isinstance(candidate, dict) else getattr(candidate, name, "")
+            return str(value or "")
+
+        full_name = field("full_name")
+        return cls({
+            "NAME": [full_name] + full_name.split(),
+            "EMAIL": [field("email")],
+            "PHONE": [field("phone")],
+            "DATE": [field("date_of_birth")],
+        }, mask=mask)
+
+    def redact(self, text: str) -> str:
+        """Replace every PII match in one pass over the text"""
+        if not text:
+            return text or ""
+        return self.pattern.sub(self._replace, text)
+
+    def restore(self, text: str) -> str:
+        """Put the original values back in place of this redactor's placeholders"""
+        if not text or not self.originals:
+            return text or ""
+        return PLACEHOLDER_PATTERN.sub(lambda match: self.originals.get(match.group(0), match.group(0)), text)
+
+    def redact_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copies of chat messages with their content redacted"""
+        return [{**message, "content": self.redact(message.get("content", ""))} for message in messages]
+
+    def _replace(self, match: "re.Match[str]") -> str:
+        """Placeholder for one match (the text is kept when it is not PII after all)"""
+        kind = match.lastgroup
+        value = match.group(0)
+        if kind == "KNOWN":
+            kind = self.known_kinds.get(value.lower(), "PII")
+        elif kind == "PHONE" and not MIN_PHONE_DIGITS <= len(re.sub(r"\D", "", value)) <= MAX_PHONE_DIGITS:
+            return value
+        if self.mask:
+            masked = self._masks.get((kind, value))
+            if masked is None:
+                if len(self._masks) >= MAX_CACHED_MASKS:
+                    self._masks.clear()
+                masked = self._masks[(kind, value)] = mask_value(kind, value)
+            return masked
+
+        key = (kind, _normalize(kind, value))
+        placeholder = self.placeholders.get(key)
+        if placeholder is None:
+            self._counts[kind] = self._counts.get(kind, 0) + 1
+            placeholder = f"[{kind}_{self._counts[kind]}]"
+            self.placeholders[key] = placeholder
+            self.originals[placeholder] = value
+        return placeholder
+
+
+def redact_stream(chunks: Iterable[str], redactor: PiiRedactor) -> Iterator[str]:
+    """Redact a text stream chunk by chunk, holding back at most one partial line"""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        cut = pending.rfind("\n") + 1
+        if not cut and len(pending) > MAX_PENDING_CHARS:
+            cut = pending.rfind(" ", 0, len(pending) - MAX_MATCH_CHARS) + 1 or len(pending) - MAX_MATCH_CHARS
+        if cut:
+            yield redactor.redact(pending[:cut])
+            pending = pending[cut:]
+    if pending:
+        yield redactor.redact(pending)
+
+
+# Pattern-only masking for diagnostics logged outside a session
+_LOG_REDACTOR = PiiRedactor(mask=True)
+
+
+def redacted_print(message: Any, redactor: Optional[PiiRedactor] = None):
+    """print() a diagnostic line with its PII masked"""
+    print((redactor or _LOG_REDACTOR).redact(str(message)))